@@ -0,0 +1,106 @@
+"""
+Latencia por request según el modo de conexión a PostgreSQL.
+
+Simula el ciclo de un request de Django sin servidor HTTP: las señales
+``request_started``/``request_finished`` (``close_old_connections``), una
+lectura de usuario por PK y el cierre o devolución de la conexión. Para
+cada modo de ``users.infrastructure.db_pool`` reporta p50, p95 y p99:
+
+- ``per_request``: ``CONN_MAX_AGE=0``; cada request abre su conexión.
+- ``persistent``: ``CONN_MAX_AGE`` + ``CONN_HEALTH_CHECKS``.
+- ``pool``: pool de psycopg 3 (requiere ``psycopg[pool]``).
+
+La diferencia de p50 entre ``per_request`` y los otros dos es el costo de
+establecer la conexión (TCP, TLS y autenticación).
+
+Uso (con la configuración de base de datos del servicio):
+    POSTGRES_DB=users_db python benchmarks/db_connections.py [--requests 2000]
+"""
+
+import argparse
+import copy
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "user_service.settings")
+os.environ.setdefault("USER_SERVICE_SECRET_KEY", "benchmark")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.signals import request_finished, request_started  # noqa: E402
+from django.db import DEFAULT_DB_ALIAS, connections  # noqa: E402
+
+from users.infrastructure.db_pool import MODE_PER_REQUEST, MODE_PERSISTENT, MODE_POOL  # noqa: E402
+
+ALIAS = "benchmark"
+
+
+def _settings_for(mode, base):
+    settings_dict = copy.deepcopy(base)
+    settings_dict.setdefault("OPTIONS", {}).pop("pool", None)
+    settings_dict["CONN_MAX_AGE"] = 0
+    settings_dict["CONN_HEALTH_CHECKS"] = mode != MODE_PER_REQUEST
+    if mode == MODE_PERSISTENT:
+        settings_dict["CONN_MAX_AGE"] = 600
+    elif mode == MODE_POOL:
+        settings_dict["OPTIONS"]["pool"] = {"min_size": 1, "max_size": 1}
+    return settings_dict
+
+
+def run(mode, requests, base):
+    connections.settings[ALIAS] = _settings_for(mode, base)
+    connection = connections[ALIAS]
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id FROM users LIMIT 1")
+        row = cursor.fetchone()
+    user_id = row[0] if row else None
+
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        request_started.send(sender=None)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id, email, username FROM users WHERE id = %s", [user_id])
+            cursor.fetchone()
+        request_finished.send(sender=None)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    connection.close()
+    if mode == MODE_POOL:
+        connection.close_pool()
+    del connections[ALIAS]
+    del connections.settings[ALIAS]
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return quantiles[49], quantiles[94], quantiles[98]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    base = connections[DEFAULT_DB_ALIAS].settings_dict
+    if connections[DEFAULT_DB_ALIAS].vendor != "postgresql":
+        sys.exit("Este benchmark requiere PostgreSQL (POSTGRES_DB).")
+
+    modes = [MODE_PER_REQUEST, MODE_PERSISTENT]
+    try:
+        import psycopg_pool  # noqa: F401
+        modes.append(MODE_POOL)
+    except ImportError:
+        print("psycopg_pool no está instalado: se omite el modo pool")
+
+    print(f"{'mode':<12} {'requests':>9} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8}")
+    for mode in modes:
+        p50, p95, p99 = run(mode, args.requests, base)
+        print(f"{mode:<12} {args.requests:>9} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Hidratación de entidades ``User`` desde filas de la base de datos.
+
+Mide entidades/seg y bytes por objeto para ``--rows`` filas sintéticas
+(mismas columnas que ``users``):
+
+- ``validated``: constructor + ``mark_clean`` (el camino anterior de
+  ``DjangoUserRepository._to_domain``: regex del email y chequeo del
+  username por fila).
+- ``from_persisted``: ``User.from_persisted`` (el camino actual).
+- ``summary``: ``UserSummary`` (lecturas proyectadas, sin ``password_hash``).
+
+La memoria se mide con ``tracemalloc`` sobre los objetos creados (sin
+contar los strings de las filas, que son compartidos). ``dict_layout`` es
+una referencia: los mismos atributos en un ``__dict__`` por instancia, como
+antes de ``slots=True``.
+
+Uso (no requiere base de datos):
+    python benchmarks/hydration.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from users.domain.entities import User, UserRole  # noqa: E402
+from users.domain.read_models import UserSummary  # noqa: E402
+
+
+class _DictLayout:
+    """Mismos atributos que ``User`` en un ``__dict__`` (referencia de memoria)."""
+
+
+def _rows(count):
+    created_at = datetime.now(timezone.utc)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "email": f"user{i}@example.com",
+            "username": f"user{i}",
+            "password_hash": "pbkdf2_sha256$1000000$salt$" + "x" * 44,
+            "is_active": True,
+            "role": UserRole.USER,
+            "created_at": created_at,
+            "token_version": 0,
+            "version": 1,
+        }
+        for i in range(count)
+    ]
+
+
+def validated(row):
+    user = User(**row)
+    user.mark_clean()
+    return user
+
+
+def from_persisted(row):
+    return User.from_persisted(**row)
+
+
+def summary(row):
+    return UserSummary(
+        id=row["id"], email=row["email"], username=row["username"],
+        role=row["role"], is_active=row["is_active"], created_at=row["created_at"],
+    )
+
+
+def dict_layout(row):
+    obj = _DictLayout()
+    obj.__dict__.update(row, _domain_events=[], _dirty_fields=set())
+    return obj
+
+
+def throughput(hydrate, rows, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            hydrate(row)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best
+
+
+def bytes_per_object(hydrate, rows):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [hydrate(row) for row in rows]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    allocated -= sys.getsizeof(objects)  # la lista que los retiene
+    return allocated / len(objects)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    print(f"{'path':<15} {'rows':>8} {'entities/s':>12} {'bytes/obj':>10}")
+    for name, hydrate in (
+        ("validated", validated),
+        ("from_persisted", from_persisted),
+        ("summary", summary),
+        ("dict_layout", dict_layout),
+    ):
+        rate = throughput(hydrate, rows, args.repeat)
+        size = bytes_per_object(hydrate, rows)
+        print(f"{name:<15} {args.rows:>8} {rate:>12.0f} {size:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
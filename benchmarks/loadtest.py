@@ -0,0 +1,141 @@
+"""
+Carga HTTP con conexiones concurrentes (solo librería estándar).
+
+Abre ``--concurrency`` conexiones keep-alive contra ``--url`` y envía GETs
+durante ``--duration`` segundos. Reporta requests/seg y latencias.
+
+Uso:
+    python benchmarks/loadtest.py --url http://localhost:8001/api/users/ \\
+        --token "$ACCESS_TOKEN" --concurrency 200 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.status: dict = {}
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bool]:
+    """Lee una respuesta completa; devuelve (status, keep_alive)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("conexión cerrada por el servidor")
+    version, status = status_line.split()[:2]
+    keep_alive = version == b"HTTP/1.1"
+    length: Optional[int] = None
+    chunked = False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value:
+            chunked = True
+        elif name == "connection":
+            keep_alive = value == "keep-alive"
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length is not None:
+        await reader.readexactly(length)
+    else:
+        await reader.read()
+        keep_alive = False
+    return int(status), keep_alive
+
+
+async def _worker(host: str, port: int, request: bytes, deadline: float, stats: Stats) -> None:
+    reader: Optional[asyncio.StreamReader] = None
+    writer: Optional[asyncio.StreamWriter] = None
+    while time.perf_counter() < deadline:
+        try:
+            started = time.perf_counter()
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await _read_response(reader)
+            stats.latencies.append(time.perf_counter() - started)
+            stats.status[status] = stats.status.get(status, 0) + 1
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            stats.errors += 1
+            keep_alive = False
+        if not keep_alive and writer is not None:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run(url: str, concurrency: int, duration: float, token: Optional[str]) -> dict:
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    headers = [
+        f"GET {path} HTTP/1.1",
+        f"Host: {parts.netloc}",
+        "Accept: application/vnd.api+json",
+        "Connection: keep-alive",
+    ]
+    if token:
+        headers.append(f"Cookie: access_token={token}")
+    request = ("\r\n".join(headers) + "\r\n\r\n").encode()
+
+    stats = Stats()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_worker(host, port, request, deadline, stats) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "requests": len(stats.latencies),
+        "requests_per_s": round(len(stats.latencies) / elapsed, 1),
+        "errors": stats.errors,
+        "status": stats.status,
+        "latency_ms": {
+            "mean": round(1000 * statistics.fmean(stats.latencies), 2) if stats.latencies else 0.0,
+            "p50": round(1000 * _percentile(stats.latencies, 0.50), 2),
+            "p95": round(1000 * _percentile(stats.latencies, 0.95), 2),
+            "p99": round(1000 * _percentile(stats.latencies, 0.99), 2),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--token", help="Access token JWT (se envía como cookie access_token)")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.url, args.concurrency, args.duration, args.token)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Costo de serializar respuestas JSON:API de usuarios.
+
+Compara, para una respuesta con 1 usuario y otra con 10k usuarios:
+- ``drf``: ``user_resource`` con ``isoformat()`` manual + ``JSONRenderer`` de DRF
+  (camino anterior).
+- ``fast-stdlib``: ``FastJSONRenderer`` con el fallback a ``json``.
+- ``fast-orjson``: ``FastJSONRenderer`` con ``orjson`` (si está instalado).
+
+Uso:
+    python benchmarks/serialization.py [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "user_service.settings")
+os.environ.setdefault("USER_SERVICE_SECRET_KEY", "benchmark")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from users import renderers  # noqa: E402
+from users.api_response import collection_response, user_resource  # noqa: E402
+from users.domain.entities import User, UserRole  # noqa: E402
+
+
+def _users(count):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        User(
+            id=str(uuid.uuid4()), email=f"bench{i}@test.com", username=f"bench{i}", password_hash="x",
+            is_active=True, role=UserRole.USER, created_at=base + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _legacy_resource(user):
+    resource = user_resource(user, request=True)
+    resource["attributes"]["created_at"] = user.created_at.isoformat()
+    return resource
+
+
+def _case(users, build, renderer):
+    def run():
+        return renderer.render(collection_response([build(u) for u in users]).data)
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    backends = [("drf", _legacy_resource, JSONRenderer(), None)]
+    backends.append(("fast-stdlib", lambda u: user_resource(u, request=True), renderers.FastJSONRenderer(), False))
+    if renderers.orjson is not None:
+        backends.append(("fast-orjson", lambda u: user_resource(u, request=True), renderers.FastJSONRenderer(), True))
+
+    orjson_module = renderers.orjson
+    print(f"{'usuarios':>9} {'backend':<12} {'ms/respuesta':>13} {'bytes':>10}")
+    for count, number in ((1, 2000), (10_000, 3)):
+        users = _users(count)
+        for name, build, renderer, use_orjson in backends:
+            if use_orjson is not None:
+                renderers.orjson = orjson_module if use_orjson else None
+            run = _case(users, build, renderer)
+            size = len(run())
+            best = min(timeit.repeat(run, number=number, repeat=args.repeat)) / number
+            print(f"{count:>9} {name:<12} {best * 1000:>13.3f} {size:>10}")
+        renderers.orjson = orjson_module
+
+
+if __name__ == "__main__":
+    main()
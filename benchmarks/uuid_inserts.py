@@ -0,0 +1,108 @@
+"""
+Inserciones con PK UUIDv4 vs UUIDv7 (PostgreSQL).
+
+Crea dos tablas con la misma forma que ``users`` (PK ``uuid`` + ~100 bytes
+por fila) e inserta ``--rows`` filas en lotes, una con ids v4 (aleatorios)
+y otra con ids v7 (ordenados por tiempo). Para cada una reporta:
+
+- ``rows/s``: throughput de inserción.
+- ``wal_mb``: WAL generado (los page splits del índice escriben páginas
+  completas en el WAL).
+- ``pk_mb``: tamaño del índice de la PK.
+- ``leaf_density`` / ``fragmentation``: de ``pgstatindex`` (extensión
+  ``pgstattuple``, si está disponible). Un índice con muchos splits tiene
+  hojas medio vacías (densidad ~50-70 %) y fragmentadas; uno con
+  inserciones al final queda cerca del ``fillfactor`` (90 %).
+
+Uso (con la configuración de base de datos del servicio):
+    POSTGRES_DB=users python benchmarks/uuid_inserts.py [--rows 1000000] [--batch 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "user_service.settings")
+os.environ.setdefault("USER_SERVICE_SECRET_KEY", "benchmark")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from users.infrastructure.uuid7 import uuid7  # noqa: E402
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+PAYLOAD = "x" * 100
+
+
+def _stats(cursor, table, has_pgstattuple):
+    cursor.execute("SELECT pg_relation_size(%s)", [f"{table}_pkey"])
+    pk_bytes = cursor.fetchone()[0]
+    density = fragmentation = None
+    if has_pgstattuple:
+        cursor.execute(
+            "SELECT avg_leaf_density, leaf_fragmentation FROM pgstatindex(%s)", [f"{table}_pkey"]
+        )
+        density, fragmentation = cursor.fetchone()
+    return pk_bytes, density, fragmentation
+
+
+def run(name, rows, batch, has_pgstattuple):
+    table = f"bench_pk_{name}"
+    generate = GENERATORS[name]
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(f"CREATE TABLE {table} (id uuid PRIMARY KEY, payload text NOT NULL)")
+        cursor.execute("SELECT pg_current_wal_lsn()")
+        wal_start = cursor.fetchone()[0]
+
+        started = time.perf_counter()
+        for offset in range(0, rows, batch):
+            ids = [str(generate()) for _ in range(min(batch, rows - offset))]
+            cursor.execute(
+                f"INSERT INTO {table} (id, payload) SELECT unnest(%s::uuid[]), %s",
+                [ids, PAYLOAD],
+            )
+        elapsed = time.perf_counter() - started
+
+        cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s)", [wal_start])
+        wal_bytes = cursor.fetchone()[0]
+        pk_bytes, density, fragmentation = _stats(cursor, table, has_pgstattuple)
+        cursor.execute(f"DROP TABLE {table}")
+
+    return rows / elapsed, wal_bytes, pk_bytes, density, fragmentation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    if connection.vendor != "postgresql":
+        sys.exit("Este benchmark requiere PostgreSQL (POSTGRES_DB).")
+
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pgstattuple")
+            has_pgstattuple = True
+        except Exception:
+            has_pgstattuple = False
+
+    print(f"{'pk':<6} {'rows':>9} {'rows/s':>10} {'wal_mb':>9} {'pk_mb':>8} {'leaf_density':>13} {'fragmentation':>14}")
+    for name in GENERATORS:
+        rate, wal_bytes, pk_bytes, density, fragmentation = run(name, args.rows, args.batch, has_pgstattuple)
+        print(
+            f"{name:<6} {args.rows:>9} {rate:>10.0f} {wal_bytes / 2**20:>9.1f} {pk_bytes / 2**20:>8.1f} "
+            f"{'-' if density is None else f'{density:.1f}':>13} "
+            f"{'-' if fragmentation is None else f'{fragmentation:.1f}':>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
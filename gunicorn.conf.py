@@ -0,0 +1,61 @@
+"""
+gunicorn.conf.py
+
+Hooks de ciclo de vida de los workers. gunicorn carga este archivo desde el
+directorio de trabajo (``/app`` en la imagen) tanto para el perfil WSGI
+como para el ASGI (uvicorn).
+
+El contenedor de dependencias (``users/container.py``) se crea una vez por
+worker; los hooks solo actúan si Django ya está cargado en el proceso (con
+``--preload`` lo carga el master antes del fork).
+
+Las métricas de ``/metrics`` se agregan entre workers en
+``PROMETHEUS_MULTIPROC_DIR`` (por defecto un directorio temporal). Se define
+aquí, en el master, para que los workers la hereden antes de importar
+``prometheus_client``; el directorio se vacía al arrancar.
+"""
+
+import os
+import shutil
+import tempfile
+
+METRICS_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "users-service-metrics"),
+)
+
+
+def _container():
+    from django.apps import apps
+
+    if not apps.ready:
+        return None
+    from users.container import get_container
+
+    return get_container()
+
+
+def on_starting(server):
+    """Descarta las métricas de una ejecución anterior."""
+    shutil.rmtree(METRICS_DIR, ignore_errors=True)
+    os.makedirs(METRICS_DIR, exist_ok=True)
+
+
+def post_fork(server, worker):
+    """Descarta en el worker lo construido por el master (``--preload``)."""
+    container = _container()
+    if container is not None:
+        container.post_fork()
+
+
+def worker_exit(server, worker):
+    """Cierra pools y conexiones del worker antes de que termine."""
+    container = _container()
+    if container is not None:
+        container.shutdown()
+
+
+def child_exit(server, worker):
+    """Los archivos de métricas del worker muerto dejan de contar como vivos."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid, METRICS_DIR)
@@ -53,6 +53,9 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    # Primero, para medir el request completo (GET /metrics)
+    'users.middleware.MetricsMiddleware',
+    'users.middleware.ServerTimingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -64,6 +67,8 @@ MIDDLEWARE = [
     # --- API robustness (RFC 7231 / RFC 9110) ---
     'users.middleware.APIHeadersMiddleware',
     'users.middleware.ContentNegotiationMiddleware',
+    'users.middleware.IdentityMapMiddleware',
+    'users.middleware.ReadYourWritesMiddleware',
 ]
 
 ROOT_URLCONF = 'user_service.urls'
@@ -98,8 +103,30 @@ if _postgres_db:
             'PASSWORD': os.getenv("POSTGRES_PASSWORD", "postgres"),
             'HOST': os.getenv("POSTGRES_HOST", "db"),
             'PORT': os.getenv("POSTGRES_PORT", "5432"),
+            # Conexiones persistentes: cada worker reutiliza su conexión entre
+            # requests en lugar de abrir una por request. Se verifica antes de
+            # reutilizarla (CONN_HEALTH_CHECKS).
+            'CONN_MAX_AGE': int(os.getenv("POSTGRES_CONN_MAX_AGE", "60")),
+            'CONN_HEALTH_CHECKS': True,
         }
     }
+    # Pool de psycopg 3 (por proceso: cada worker tiene el suyo). Reemplaza a
+    # las conexiones persistentes; es el modo recomendado bajo ASGI, donde
+    # cada request async usa su propia conexión.
+    if os.getenv("POSTGRES_POOL", "false").lower() == "true":
+        from psycopg_pool import ConnectionPool
+
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS'] = {
+            'pool': {
+                'min_size': int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")),
+                'max_size': int(os.getenv("POSTGRES_POOL_MAX_SIZE", "4")),
+                'timeout': float(os.getenv("POSTGRES_POOL_TIMEOUT", "10")),
+                'max_idle': float(os.getenv("POSTGRES_POOL_MAX_IDLE", "300")),
+                # Health check al entregar cada conexión del pool
+                'check': ConnectionPool.check_connection,
+            },
+        }
 else:
     DATABASES = {
         'default': {
@@ -108,6 +135,23 @@ else:
         }
     }
 
+# Réplica de lectura opcional (ver users/infrastructure/db_router.py).
+# En tests apunta a la base de datos de test del primario.
+_replica_host = os.getenv("POSTGRES_REPLICA_HOST")
+if _postgres_db and _replica_host:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': _replica_host,
+        'PORT': os.getenv("POSTGRES_REPLICA_PORT", DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['users.infrastructure.db_router.PrimaryReplicaRouter']
+
+# Tras escribir, un cliente lee del primario durante estos segundos
+# (read-your-writes; solo tiene efecto con réplica configurada)
+USERS_READ_YOUR_WRITES_SECONDS = float(os.getenv("USERS_READ_YOUR_WRITES_SECONDS", "5"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -128,6 +172,33 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# ---------------------------------------------------------------------------
+# KDF preferido para los hashes nuevos; los demás se aceptan al verificar y
+# se regeneran con el preferido en el siguiente login. argon2 y bcrypt
+# requieren instalar argon2-cffi / bcrypt.
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2').lower()
+_PASSWORD_HASHER_CLASSES = {
+    'pbkdf2': 'users.infrastructure.password_hashing.CalibratedPBKDF2PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'bcrypt': 'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+# Iteraciones de PBKDF2. El default sale de
+#   python manage.py calibrate_password_hasher --target-ms 250
+# en un núcleo x86-64 actual (~250 ms por hash); el default de Django
+# (1.5M) tarda ~0.8 s y con el pool acotado limita el throughput del login.
+# Recalibrar en el hardware de producción; 0 = default de Django.
+PASSWORD_HASH_ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', '450000'))
+# Pool acotado donde corren hash/verificación (0 workers = sin pool)
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '32'))
+PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', '5'))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -154,6 +225,12 @@ STATIC_URL = 'static/'
 # ---------------------------------------------------------------------------
 RABBITMQ_HOST = os.environ.get('RABBITMQ_HOST', 'rabbitmq')
 
+# Entrega de eventos de dominio:
+# - "outbox" (default): se guardan en la tabla users_outbox en la misma
+#   transacción que el cambio y los publica `manage.py relay_outbox`.
+# - "direct": publicación síncrona en RabbitMQ dentro del request.
+EVENT_DELIVERY_MODE = os.environ.get('EVENT_DELIVERY_MODE', 'outbox').lower()
+
 # Django REST Framework
 # ---------------------------------------------------------------------------
 REST_FRAMEWORK = {
@@ -164,8 +241,16 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ),
     # JSON only — no Browsable API (security + RFC 7231 content negotiation)
+    # orjson si está instalado, json de la librería estándar si no
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'users.renderers.FastJSONRenderer',
+        'users.renderers.JSONAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'users.renderers.FastJSONParser',
+        'users.renderers.JSONAPIParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
     # Global exception handler: convierte TODAS las excepciones a JSON:API
     'EXCEPTION_HANDLER': 'users.exception_handler.jsonapi_exception_handler',
@@ -205,6 +290,44 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': False,
 }
 
+# Autenticación sin estado (claims-only): el usuario se construye desde los
+# claims del JWT sin consultar la tabla users en cada request. La revocación
+# (desactivación, cambio de email, borrado) se verifica contra la caché
+# TOKEN_REVOCATION_CACHE, que debe ser compartida entre workers en producción.
+JWT_STATELESS_AUTH = os.getenv("JWT_STATELESS_AUTH", "false").lower() == "true"
+TOKEN_REVOCATION_CACHE = os.getenv("TOKEN_REVOCATION_CACHE", "default")
+
+# Caché por proceso de usuarios autenticados (modo con consulta a BD).
+# AUTH_PRINCIPAL_CACHE_SIZE=0 desactiva la caché.
+AUTH_PRINCIPAL_CACHE_SIZE = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", "1024"))
+AUTH_PRINCIPAL_CACHE_TTL = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", "30"))
+
+# Paginación por cursor de las colecciones (page[size] por defecto y máximo)
+USERS_PAGE_SIZE = int(os.getenv("USERS_PAGE_SIZE", "50"))
+USERS_PAGE_SIZE_MAX = int(os.getenv("USERS_PAGE_SIZE_MAX", "200"))
+
+# Resolución por lote (filter[id] / POST /api/users/lookup/): máximo de IDs + emails
+USERS_LOOKUP_MAX = int(os.getenv("USERS_LOOKUP_MAX", "200"))
+
+# Bloqueo optimista: un UPDATE falla (409) si la fila cambió desde que se leyó
+USERS_OPTIMISTIC_LOCKING = os.getenv("USERS_OPTIMISTIC_LOCKING", "true").lower() == "true"
+
+# Feed de cambios: antigüedad mínima (segundos) de un cambio para entregarlo,
+# así una transacción lenta no queda detrás de un cursor ya entregado
+USERS_CHANGES_SETTLE_SECONDS = float(os.getenv("USERS_CHANGES_SETTLE_SECONDS", "5"))
+
+# Vistas async para las lecturas de usuarios (despliegue ASGI con uvicorn)
+USERS_ASYNC_VIEWS = os.getenv("USERS_ASYNC_VIEWS", "false").lower() == "true"
+
+# Cabecera Server-Timing por fase en las respuestas de /api/
+USERS_SERVER_TIMING = os.getenv("USERS_SERVER_TIMING", "true").lower() == "true"
+
+# Presupuestos de consultas por vista (@query_budget): warn (log), raise u off
+USERS_QUERY_BUDGET_MODE = os.getenv("USERS_QUERY_BUDGET_MODE", "warn").lower()
+
+# Exportación en streaming: filas por fetch del cursor de base de datos
+USERS_EXPORT_CHUNK_SIZE = int(os.getenv("USERS_EXPORT_CHUNK_SIZE", "2000"))
+
 # CORS Configuration
 # Obtener orígenes permitidos desde variables de entorno (separados por comas)
 _cors_origins = os.getenv("CORS_ALLOWED_ORIGINS", "")
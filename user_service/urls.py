@@ -4,6 +4,7 @@ URL configuration for user_service project.
 La configuración de URLs del proyecto incluye:
 - /admin/: Interfaz de administración de Django
 - /api/: Rutas de la API REST de la aplicación users
+- /metrics: Métricas en formato Prometheus
 
 Para microservicios, todas las rutas de API deben estar bajo /api/
 """
@@ -11,6 +12,8 @@ from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView
 
+from users.views import metrics_view
+
 urlpatterns = [
     # Django Admin
     path('admin/', admin.site.urls),
@@ -21,4 +24,7 @@ urlpatterns = [
     # API de la aplicación users
     # Las rutas de users se configuran en users/urls.py
     path('api/', include('users.urls')),  # incluye las rutas /api/auth/, /api/health/
+
+    # Métricas para Prometheus (fuera de /api/: texto plano, sin JSON:API)
+    path('metrics', metrics_view, name='metrics'),
 ]
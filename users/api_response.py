@@ -13,10 +13,11 @@ un envelope uniforme:
       "meta": { ... }
     }
 
-  Éxito (colección):
+  Éxito (colección paginada):
     {
       "data": [ ... ],
-      "meta": { "count": N, "timestamp": "..." }
+      "meta": { "count": N, "timestamp": "..." },
+      "links": { "self": "...", "next": "...", "prev": null }
     }
 
   Error:
@@ -35,26 +36,30 @@ un envelope uniforme:
 
 from __future__ import annotations
 
-import threading
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Sequence
 
 from rest_framework.response import Response
 from rest_framework import status as http_status
 
-# Thread-local storage para propagar request_id sin pasar request
-# a cada función. El middleware lo setea al inicio de cada petición.
-_local = threading.local()
+from .infrastructure.request_profile import timed
+
+# ContextVar para propagar request_id sin pasar request a cada función.
+# El middleware lo setea al inicio de cada petición. A diferencia de un
+# thread-local, es seguro con vistas async (varias peticiones comparten el
+# hilo del event loop) y asgiref lo propaga a ``sync_to_async``.
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
 def set_request_id(request_id: str) -> None:
-    """Almacena el request_id en thread-local (llamado por el middleware)."""
-    _local.request_id = request_id
+    """Almacena el request_id del contexto actual (llamado por el middleware)."""
+    _request_id.set(request_id)
 
 
 def get_request_id() -> Optional[str]:
-    """Obtiene el request_id del thread-local, o None si no está seteado."""
-    return getattr(_local, "request_id", None)
+    """Obtiene el request_id del contexto actual, o None si no está seteado."""
+    return _request_id.get()
 
 
 # ---------------------------------------------------------------------------
@@ -154,15 +159,26 @@ def collection_response(
     *,
     status: int = http_status.HTTP_200_OK,
     meta_extra: Optional[Dict[str, Any]] = None,
+    links: Optional[Dict[str, Optional[str]]] = None,
 ) -> Response:
-    """Respuesta exitosa con una colección de recursos."""
+    """
+    Respuesta exitosa con una colección de recursos.
+
+    Args:
+        data: Resource objects de la página.
+        status: HTTP status code.
+        meta_extra: Campos adicionales para el bloque ``meta``.
+        links: Enlaces de paginación JSON:API (``self``/``next``/``prev``).
+    """
     extra = {"count": len(data)}
     if meta_extra:
         extra.update(meta_extra)
-    body = {
+    body: Dict[str, Any] = {
         "data": list(data),
         "meta": _meta(extra),
     }
+    if links:
+        body["links"] = links
     return Response(body, status=status, content_type="application/vnd.api+json")
 
 
@@ -293,6 +309,7 @@ def internal_error(detail: str = "An unexpected error occurred.") -> Response:
 # Serializador de usuario a JSON:API resource object
 # ---------------------------------------------------------------------------
 
+@timed("serialization")
 def user_resource(user, *, request=None) -> Dict[str, Any]:
     """
     Convierte una entidad ``User`` de dominio a un JSON:API resource object.
@@ -301,9 +318,8 @@ def user_resource(user, *, request=None) -> Dict[str, Any]:
     endpoints que devuelven usuarios.
     """
     role_value = getattr(user.role, "value", user.role) if hasattr(user, "role") else "USER"
+    # datetime tal cual: el renderer (users.renderers) lo serializa en ISO 8601
     created = getattr(user, "created_at", None)
-    if created and hasattr(created, "isoformat"):
-        created = created.isoformat()
 
     attributes = {
         "email": user.email,
@@ -319,3 +335,20 @@ def user_resource(user, *, request=None) -> Dict[str, Any]:
         links["self"] = f"/api/users/{user.id}/"
 
     return _resource_object("users", str(user.id), attributes, links=links)
+
+
+def user_change_resource(change, *, request=None) -> Dict[str, Any]:
+    """
+    Convierte un ``UserChange`` del feed de cambios a un resource object.
+
+    Las altas/modificaciones son el usuario completo; las bajas solo llevan
+    ``type``/``id`` y ``meta.deleted``. En ambos casos ``meta.changed_at``
+    es el momento del cambio.
+    """
+    if change.deleted:
+        obj: Dict[str, Any] = {"type": "users", "id": change.user_id}
+        obj["meta"] = {"deleted": True, "changed_at": change.changed_at}
+        return obj
+    obj = user_resource(change.user, request=request)
+    obj["meta"] = {"deleted": False, "changed_at": change.changed_at}
+    return obj
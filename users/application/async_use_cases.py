@@ -0,0 +1,89 @@
+"""
+Async Use Cases - Variantes async de los casos de uso de lectura.
+
+Se usan desde las vistas async (``users.async_views``) cuando el servicio
+corre bajo ASGI. Repiten la orquestación de sus equivalentes síncronos en
+``use_cases.py`` sobre un ``AsyncUserRepository``; las reglas (validación
+del rol, orden de las páginas) son las mismas.
+"""
+
+from typing import Optional
+
+from ..domain.entities import parse_role
+from ..domain.exceptions import UserNotFound
+from ..domain.pagination import Page, PageRequest
+from ..domain.read_models import UserSummary
+from ..domain.repositories import AsyncUserRepository
+from .use_cases import (
+    GetUsersByRoleCommand,
+    ResolveUsersCommand,
+    ResolveUsersResult,
+)
+
+
+class AsyncGetUserUseCase:
+    """
+    Caso de uso async: Obtener un usuario por ID.
+    """
+
+    def __init__(self, repository: AsyncUserRepository):
+        self.repository = repository
+
+    async def execute(self, user_id: str) -> UserSummary:
+        """
+        Obtiene un usuario por su ID.
+
+        Raises:
+            UserNotFound: Si el usuario no existe
+        """
+        user = await self.repository.find_summary_by_id(user_id)
+
+        if not user:
+            raise UserNotFound(user_id)
+
+        return user
+
+
+class AsyncListUsersUseCase:
+    """
+    Caso de uso async: Listar usuarios paginados (más recientes primero).
+    """
+
+    def __init__(self, repository: AsyncUserRepository):
+        self.repository = repository
+
+    async def execute_page(self, page: PageRequest, is_active: Optional[bool] = None) -> Page[UserSummary]:
+        return await self.repository.find_page(page, is_active)
+
+
+class AsyncGetUsersByRoleUseCase:
+    """
+    Caso de uso async: Obtener usuarios por rol, paginados por username.
+    """
+
+    def __init__(self, repository: AsyncUserRepository):
+        self.repository = repository
+
+    async def execute_page(self, command: GetUsersByRoleCommand, page: PageRequest) -> Page[UserSummary]:
+        """
+        Raises:
+            InvalidRole: Si el rol no existe
+        """
+        role = parse_role(command.role)
+        if role is None:
+            return Page()
+        return await self.repository.find_page_by_role(role, page)
+
+
+class AsyncResolveUsersUseCase:
+    """
+    Caso de uso async: Resolver un lote de usuarios por ID y/o email.
+    """
+
+    def __init__(self, repository: AsyncUserRepository):
+        self.repository = repository
+
+    async def execute(self, command: ResolveUsersCommand) -> ResolveUsersResult:
+        by_id = await self.repository.find_by_ids(command.ids) if command.ids else []
+        by_email = await self.repository.find_by_emails(command.emails) if command.emails else []
+        return ResolveUsersResult.from_lookup(command, by_id, by_email)
@@ -89,8 +89,8 @@ class TestRegisterUserUseCase:
         assert result['user'].role == UserRole.USER
 
     def test_execute_raises_if_email_exists(self) -> None:
-        """Registro con email duplicado lanza UserAlreadyExists."""
-        self.mock_repository.exists_by_email.return_value = True
+        """Registro con email duplicado: el repositorio lanza UserAlreadyExists y no se publica nada."""
+        self.mock_repository.save.side_effect = UserAlreadyExists("existing@test.com")
 
         command = RegisterUserCommand(
             email="existing@test.com",
@@ -101,6 +101,9 @@ class TestRegisterUserUseCase:
         with pytest.raises(UserAlreadyExists):
             self.use_case.execute(command)
 
+        self.mock_repository.exists_by_email.assert_not_called()
+        self.mock_event_publisher.publish.assert_not_called()
+
     def test_execute_publishes_user_created_event(self) -> None:
         """Registro exitoso publica evento user.created."""
         self.mock_repository.exists_by_email.return_value = False
@@ -3,27 +3,45 @@ Use Cases (Comandos) - Casos de uso que orquestan operaciones de dominio.
 Cada caso de uso representa una operación de negocio completa.
 """
 
-from dataclasses import dataclass
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
-import hashlib
+from itertools import islice
+from typing import Any, Callable, ContextManager, Iterable, Iterator, List, Optional
+import re
+import time
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.settings import api_settings
 
-from ..domain.entities import User, UserRole
+from ..domain.changes import ChangeFeed
+from ..domain.entities import User, UserRole, parse_role
 from ..domain.factories import UserFactory
+from ..domain.pagination import Page, PageKey, PageRequest
+from ..domain.read_models import UserSummary
+from ..domain.password_hasher import PasswordHasher, get_password_hasher
 from ..domain.repositories import UserRepository
 from ..domain.event_publisher import EventPublisher
 from ..domain.events import UserCreated
-from ..domain.exceptions import UserAlreadyExists, UserNotFound, InvalidCredentials, InvalidRole
+from ..domain.exceptions import (
+    ConcurrentModification, DomainException, UserAlreadyExists, UserNotFound, InvalidCredentials,
+)
 
 
 def _generate_tokens(user: User) -> dict[str, str]:
-    """Genera access y refresh JWT con claims personalizados."""
+    """
+    Genera access y refresh JWT con claims personalizados.
+
+    Incluye los claims necesarios para autenticar sin consultar la base de
+    datos (modo JWT_STATELESS_AUTH): username, is_active y token_version.
+    """
     refresh = RefreshToken()
     refresh[str(api_settings.USER_ID_CLAIM)] = str(user.id)
     refresh['email'] = user.email
+    refresh['username'] = user.username
     refresh['role'] = user.role.value if hasattr(user.role, 'value') else str(user.role)
+    refresh['is_active'] = bool(getattr(user, 'is_active', True))
+    refresh['token_version'] = int(getattr(user, 'token_version', 0))
     return {
         'access': str(refresh.access_token),
         'refresh': str(refresh),
@@ -77,15 +95,84 @@ class GetUsersByRoleCommand:
     role: Optional[str]
 
 
+@dataclass
+class ResolveUsersCommand:
+    """Comando: Resolver varios usuarios por ID y/o email."""
+    ids: List[str] = field(default_factory=list)
+    emails: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ResolveUsersResult:
+    """Usuarios encontrados y los IDs / emails pedidos que no existen."""
+    users: List[UserSummary] = field(default_factory=list)
+    missing_ids: List[str] = field(default_factory=list)
+    missing_emails: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_lookup(
+        cls, command: ResolveUsersCommand, by_id: List[UserSummary], by_email: List[UserSummary],
+    ) -> "ResolveUsersResult":
+        """Arma el resultado a partir de lo que encontró el repositorio."""
+        found_ids = {user.id.lower() for user in by_id}
+        found_emails = {user.email.lower() for user in by_email}
+        users = {user.id: user for user in by_id + by_email}
+        return cls(
+            users=list(users.values()),
+            missing_ids=[i for i in dict.fromkeys(command.ids) if i.lower() not in found_ids],
+            missing_emails=[e for e in dict.fromkeys(command.emails) if e.lower() not in found_emails],
+        )
+
+
+@dataclass
+class ImportUserRow:
+    """Fila de una importación masiva (``line`` se usa para reportar errores)."""
+    email: str
+    username: str
+    password: str
+    role: Optional[str] = None
+    line: int = 0
+
+
+@dataclass
+class ImportUsersCommand:
+    """Comando: Importar usuarios en lotes."""
+    rows: Iterable[ImportUserRow]
+    batch_size: int = 1000
+
+
+@dataclass
+class ImportRowError:
+    """Fila rechazada en una importación (inválida o en conflicto)."""
+    line: int
+    email: str
+    code: str
+    detail: str
+
+
+@dataclass
+class ImportUsersResult:
+    """Resultado agregado de una importación masiva."""
+    created: int = 0
+    conflicts: List[ImportRowError] = field(default_factory=list)
+    invalid: List[ImportRowError] = field(default_factory=list)
+    events_published: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.created / self.elapsed if self.elapsed > 0 else 0.0
+
+
 class CreateUserUseCase:
     """
     Caso de uso: Crear un nuevo usuario.
 
     Responsabilidades:
-    1. Validar que el email no exista
-    2. Crear la entidad mediante factory (validaciones)
-    3. Persistir el usuario usando el repositorio
-    4. Generar y publicar eventos de dominio
+    1. Crear la entidad mediante factory (validaciones)
+    2. Persistir el usuario usando el repositorio (los duplicados los
+       detectan las restricciones únicas)
+    3. Generar y publicar eventos de dominio
     """
 
     def __init__(
@@ -117,26 +204,23 @@ class CreateUserUseCase:
             El usuario creado y persistido
 
         Raises:
-            UserAlreadyExists: Si el email ya está registrado
+            UserAlreadyExists: Si el email o el username ya están registrados
             InvalidEmail: Si el email no es válido
             InvalidUsername: Si el username no cumple requisitos
             InvalidUserData: Si el password es muy corto
         """
-        # 1. Validar que el email no exista
-        if self.repository.exists_by_email(command.email):
-            raise UserAlreadyExists(command.email)
-
-        # 2. Crear entidad de dominio usando factory (valida)
+        # 1. Crear entidad de dominio usando factory (valida)
         user = self.factory.create(
             email=command.email,
             username=command.username,
             password=command.password
         )
 
-        # 3. Persistir el usuario
+        # 2. Persistir el usuario: la unicidad la garantizan las restricciones
+        # de la tabla (un solo INSERT, sin consulta previa ni carrera)
         user = self.repository.save(user)
 
-        # 4. Generar evento de dominio (ahora que tenemos el ID)
+        # 3. Generar evento de dominio (ahora que tenemos el ID)
         assert user.id is not None, "El usuario persistido debe tener un ID"
         event = UserCreated(
             occurred_at=datetime.now(),
@@ -145,7 +229,7 @@ class CreateUserUseCase:
             username=user.username
         )
 
-        # 5. Publicar evento
+        # 4. Publicar evento
         self.event_publisher.publish(event, 'user.created')
 
         return user
@@ -286,7 +370,7 @@ class GetUserUseCase:
     def __init__(self, repository: UserRepository):
         self.repository = repository
 
-    def execute(self, user_id: str) -> User:
+    def execute(self, user_id: str) -> UserSummary:
         """
         Obtiene un usuario por su ID.
 
@@ -294,12 +378,12 @@ class GetUserUseCase:
             user_id: ID del usuario
 
         Returns:
-            El usuario encontrado
+            Vista de solo lectura del usuario encontrado
 
         Raises:
             UserNotFound: Si el usuario no existe
         """
-        user = self.repository.find_by_id(user_id)
+        user = self.repository.find_summary_by_id(user_id)
 
         if not user:
             raise UserNotFound(user_id)
@@ -324,6 +408,71 @@ class ListUsersUseCase:
         """
         return self.repository.find_all()
 
+    def execute_page(self, page: PageRequest, is_active: Optional[bool] = None) -> Page[UserSummary]:
+        """
+        Obtiene una página de usuarios (más recientes primero).
+
+        Args:
+            page: Tamaño y cursor de la página
+            is_active: Solo activos (True) / inactivos (False); None = todos
+
+        Returns:
+            Página de usuarios
+        """
+        return self.repository.find_page(page, is_active)
+
+
+class ResolveUsersUseCase:
+    """
+    Caso de uso: Resolver un lote de usuarios por ID y/o email.
+
+    Reemplaza N consultas ``GET /api/users/{id}/`` de otros servicios por
+    una consulta ``IN`` por criterio.
+    """
+
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+
+    def execute(self, command: ResolveUsersCommand) -> ResolveUsersResult:
+        """
+        Resuelve los usuarios pedidos.
+
+        Args:
+            command: IDs y emails a resolver
+
+        Returns:
+            Usuarios encontrados (primero por ID, luego por email, sin
+            repetir) y los IDs / emails que no existen
+        """
+        by_id = self.repository.find_by_ids(command.ids) if command.ids else []
+        by_email = self.repository.find_by_emails(command.emails) if command.emails else []
+        return ResolveUsersResult.from_lookup(command, by_id, by_email)
+
+
+class ListUserChangesUseCase:
+    """
+    Caso de uso: Obtener los cambios de usuarios posteriores a una posición.
+
+    Lo usan otros servicios para sincronizar su copia de los usuarios en
+    O(cambios) en lugar de descargar la colección completa.
+    """
+
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+
+    def execute(self, since: Optional[PageKey], limit: int) -> ChangeFeed:
+        """
+        Obtiene hasta ``limit`` cambios posteriores a ``since``.
+
+        Args:
+            since: Posición devuelta por la llamada anterior (None: desde el inicio)
+            limit: Número máximo de cambios
+
+        Returns:
+            Tramo del feed con la nueva posición
+        """
+        return self.repository.find_changes(since, limit)
+
 
 class RegisterUserUseCase:
     """
@@ -331,10 +480,10 @@ class RegisterUserUseCase:
     Similar a CreateUserUseCase pero específico para auth endpoint.
 
     Responsabilidades:
-    1. Validar que el email no exista
-    2. Crear la entidad mediante factory (validaciones)
-    3. Persistir el usuario usando el repositorio
-    4. Generar y publicar eventos de dominio
+    1. Crear la entidad mediante factory (validaciones)
+    2. Persistir el usuario usando el repositorio (un solo INSERT; los
+       duplicados los detectan las restricciones únicas)
+    3. Generar y publicar eventos de dominio
     """
 
     def __init__(
@@ -358,16 +507,12 @@ class RegisterUserUseCase:
             Diccionario con usuario y tokens JWT
 
         Raises:
-            UserAlreadyExists: Si el email ya está registrado
+            UserAlreadyExists: Si el email o el username ya están registrados
             InvalidEmail: Si el email no es válido
             InvalidUsername: Si el username no cumple requisitos
             InvalidUserData: Si el password es muy corto
         """
-        # 1. Validar que el email no exista
-        if self.repository.exists_by_email(command.email):
-            raise UserAlreadyExists(command.email)
-
-        # 2. Crear entidad de dominio usando factory (valida)
+        # 1. Crear entidad de dominio usando factory (valida)
         # SEGURIDAD: Siempre forzar UserRole.USER en registro público
         user = self.factory.create(
             email=command.email,
@@ -376,10 +521,12 @@ class RegisterUserUseCase:
             role=UserRole.USER
         )
 
-        # 4. Persistir el usuario
+        # 2. Persistir el usuario. Un registro concurrente con el mismo email
+        # o username viola la restricción única y el repositorio lanza
+        # UserAlreadyExists: no hay ventana entre una consulta y el INSERT.
         user = self.repository.save(user)
 
-        # 5. Generar evento de dominio (ahora que tenemos el ID)
+        # 3. Generar evento de dominio (ahora que tenemos el ID)
         assert user.id is not None, "El usuario persistido debe tener un ID"
         event = UserCreated(
             occurred_at=datetime.now(),
@@ -388,7 +535,7 @@ class RegisterUserUseCase:
             username=user.username
         )
 
-        # 6. Publicar evento
+        # 4. Publicar evento
         self.event_publisher.publish(event, 'user.created')
 
         return {
@@ -405,11 +552,29 @@ class LoginUseCase:
     1. Buscar el usuario por email
     2. Verificar el password
     3. Validar que el usuario esté activo
-    4. Retornar el usuario autenticado
+    4. Actualizar el hash si usa un algoritmo o costo obsoleto (rehash)
+    5. Retornar el usuario autenticado
     """
 
-    def __init__(self, repository: UserRepository):
+    # Password contra el que se verifica cuando el email no existe
+    _DUMMY_PASSWORD = "login-timing-equalizer"
+
+    def __init__(self, repository: UserRepository, password_hasher: Optional[PasswordHasher] = None):
         self.repository = repository
+        self.password_hasher = password_hasher or get_password_hasher()
+        self._dummy_hash: Optional[str] = None
+
+    def _verify_dummy(self, password: str) -> None:
+        """
+        Verificación con el mismo costo que la de un usuario existente.
+
+        Sin ella un email desconocido responde sin pasar por el KDF y la
+        latencia revela qué emails están registrados (como Django en
+        ``ModelBackend.authenticate``). El hash se calcula una sola vez.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = self.password_hasher.hash(self._DUMMY_PASSWORD)
+        self.password_hasher.verify(password, self._dummy_hash)
 
     def execute(self, command: LoginCommand) -> dict[str, Any]:
         """
@@ -428,36 +593,32 @@ class LoginUseCase:
         user = self.repository.find_by_email(command.email)
 
         if not user:
+            self._verify_dummy(command.password)
             raise InvalidCredentials()
 
         # 2. Verificar password
-        password_hash = self._hash_password(command.password)
-
-        if user.password_hash != password_hash:
+        if not self.password_hasher.verify(command.password, user.password_hash):
             raise InvalidCredentials()
 
         # 3. Validar que el usuario esté activo
         if not user.is_active:
             raise InvalidCredentials("Usuario inactivo")
 
+        # 4. Rehash transparente (p.ej. SHA-256 legacy -> KDF con salt). Es
+        # best-effort: si otro request modificó la fila (p.ej. un login
+        # simultáneo que ya hizo el rehash) el login sigue siendo válido
+        if self.password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = self.password_hasher.hash(command.password)
+            try:
+                user = self.repository.save(user)
+            except ConcurrentModification:
+                pass
+
         return {
             'user': user,
             'tokens': _generate_tokens(user),
         }
 
-    @staticmethod
-    def _hash_password(password: str) -> str:
-        """
-        Genera un hash del password (debe ser igual al de la factory).
-
-        Args:
-            password: Password en texto plano
-
-        Returns:
-            Hash SHA-256 del password
-        """
-        return hashlib.sha256(password.encode()).hexdigest()
-
 
 class GetUsersByRoleUseCase:
     """
@@ -472,7 +633,7 @@ class GetUsersByRoleUseCase:
     def __init__(self, repository: UserRepository):
         self.repository = repository
 
-    def execute(self, command: GetUsersByRoleCommand) -> list[User]:
+    def execute(self, command: GetUsersByRoleCommand) -> list[UserSummary]:
         """
         Ejecuta el caso de uso de obtener usuarios por rol.
 
@@ -482,20 +643,204 @@ class GetUsersByRoleUseCase:
         Returns:
             Lista de usuarios con el rol especificado
         """
-        # Validar que el rol sea válido y no venga vacío
-        role_value = command.role
-        if role_value is None:
+        role = parse_role(command.role)
+        if role is None:
             return []
-        if isinstance(role_value, UserRole):
-            role = role_value
-        else:
-            role_text = str(role_value).strip().upper()
-            if not role_text:
-                return []
-            try:
-                role = UserRole[role_text]
-            except KeyError:
-                raise InvalidRole(role_text)
 
         # Obtener usuarios por rol
         return self.repository.find_by_role(role)
+
+    def execute_page(self, command: GetUsersByRoleCommand, page: PageRequest) -> Page[UserSummary]:
+        """
+        Obtiene una página de usuarios del rol indicado (orden por username).
+
+        Args:
+            command: Comando con el rol a filtrar
+            page: Tamaño y cursor de la página
+
+        Returns:
+            Página de usuarios con el rol especificado
+        """
+        role = parse_role(command.role)
+        if role is None:
+            return Page()
+        return self.repository.find_page_by_role(role, page)
+
+
+class ImportUsersUseCase:
+    """
+    Caso de uso: Importar usuarios en lote (alta masiva de un tenant).
+
+    A diferencia de ``RegisterUserUseCase`` (una consulta, un hash, un
+    INSERT y un evento por usuario), por cada lote:
+    1. Valida las filas con ``UserFactory.validate`` (sin hashear)
+    2. Descarta duplicados dentro del archivo y contra la BD (2 consultas)
+    3. Hashea los passwords en paralelo con el ``executor`` dado
+    4. Inserta el lote con ``UserRepository.bulk_insert`` y publica sus
+       ``UserCreated`` con un solo ``publish_many``, ambos dentro de
+       ``atomic()``: con el outbox, los eventos de un lote se confirman
+       junto con sus filas (un lote posterior que falla no los pierde)
+
+    ``atomic`` es la fábrica de transacciones (``transaction.atomic`` en el
+    comando ``import_users``); por defecto no abre ninguna.
+
+    ``password_hasher`` es el hasher registrado salvo que se indique otro;
+    el comando ``import_users`` pasa uno sin el pool de los requests para
+    que el paralelismo lo decida su ``executor``.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        event_publisher: EventPublisher,
+        factory: Optional[UserFactory] = None,
+        executor: Optional[Executor] = None,
+        password_hasher: Optional[PasswordHasher] = None,
+        atomic: Callable[[], ContextManager[Any]] = nullcontext,
+    ):
+        self.repository = repository
+        self.event_publisher = event_publisher
+        self.factory = factory or UserFactory()
+        self.executor = executor
+        self.password_hasher = password_hasher or get_password_hasher()
+        self.atomic = atomic
+
+    def execute(self, command: ImportUsersCommand) -> ImportUsersResult:
+        """
+        Ejecuta la importación.
+
+        Las filas inválidas o en conflicto no detienen la importación: se
+        reportan en ``ImportUsersResult.invalid`` / ``conflicts``.
+
+        Args:
+            command: Filas a importar y tamaño de lote
+
+        Returns:
+            Resultado con contadores y filas rechazadas
+        """
+        started = time.perf_counter()
+        result = ImportUsersResult()
+        seen_emails: set[str] = set()
+        seen_usernames: set[str] = set()
+
+        for batch in _chunked(command.rows, max(1, command.batch_size)):
+            users, rows_by_user = self._prepare_batch(batch, result, seen_emails, seen_usernames)
+            if not users:
+                continue
+            with self.atomic():
+                created = self._insert_batch(users, rows_by_user, result)
+                events = [
+                    UserCreated(
+                        occurred_at=datetime.now(),
+                        user_id=user.id,
+                        email=user.email,
+                        username=user.username,
+                    )
+                    for user in created
+                    if user.id is not None
+                ]
+                if events:
+                    self.event_publisher.publish_many(events, 'user.created')
+            result.created += len(created)
+            result.events_published += len(events)
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _prepare_batch(
+        self,
+        batch: List[ImportUserRow],
+        result: ImportUsersResult,
+        seen_emails: set[str],
+        seen_usernames: set[str],
+    ) -> tuple[List[User], dict[int, ImportUserRow]]:
+        """Valida, descarta conflictos y hashea (fuera de la transacción del lote)."""
+        # 1. Validación y normalización (sin hashear)
+        candidates: List[tuple[ImportUserRow, str, str, UserRole]] = []
+        for row in batch:
+            try:
+                self.factory.validate(row.email, row.username, row.password)
+                role = self._parse_role(row.role)
+            except DomainException as exc:
+                result.invalid.append(_row_error(row, exc))
+                continue
+            email = row.email.strip().lower()
+            username = row.username.strip()
+            if email in seen_emails or username in seen_usernames:
+                result.conflicts.append(ImportRowError(
+                    row.line, row.email, "duplicate_in_input", "Email o username repetido en la entrada",
+                ))
+                continue
+            seen_emails.add(email)
+            seen_usernames.add(username)
+            candidates.append((row, email, username, role))
+
+        if not candidates:
+            return [], {}
+
+        # 2. Conflictos contra la base de datos (una consulta por columna)
+        existing_emails = self.repository.find_existing_emails(c[1] for c in candidates)
+        existing_usernames = self.repository.find_existing_usernames(c[2] for c in candidates)
+        fresh = []
+        for candidate in candidates:
+            row, email, username, _ = candidate
+            if email in existing_emails:
+                result.conflicts.append(ImportRowError(
+                    row.line, row.email, "email_exists", str(UserAlreadyExists(email)),
+                ))
+            elif username in existing_usernames:
+                result.conflicts.append(ImportRowError(
+                    row.line, row.email, "username_exists", str(UserAlreadyExists(username, "username")),
+                ))
+            else:
+                fresh.append(candidate)
+
+        # 3. Hash en paralelo
+        passwords = [row.password for row, *_ in fresh]
+        mapper = self.executor.map if self.executor is not None else map
+        hashes = list(mapper(self.password_hasher.hash, passwords))
+
+        users: List[User] = []
+        rows_by_user: dict[int, ImportUserRow] = {}
+        for (row, email, username, role), password_hash in zip(fresh, hashes):
+            try:
+                user = self.factory.create_from_hash(email, username, password_hash, role)
+            except DomainException as exc:
+                result.invalid.append(_row_error(row, exc))
+                continue
+            users.append(user)
+            rows_by_user[id(user)] = row
+
+        return users, rows_by_user
+
+    def _insert_batch(
+        self,
+        users: List[User],
+        rows_by_user: dict[int, ImportUserRow],
+        result: ImportUsersResult,
+    ) -> List[User]:
+        """Inserta el lote; los perdidos por una carrera se reportan como conflicto."""
+        created = self.repository.bulk_insert(users)
+        created_ids = {id(user) for user in created}
+        for user in users:
+            if id(user) not in created_ids:
+                row = rows_by_user[id(user)]
+                result.conflicts.append(ImportRowError(
+                    row.line, row.email, "concurrent_conflict", "Insertado concurrentemente por otro proceso",
+                ))
+        return created
+
+    @staticmethod
+    def _parse_role(role: Optional[str]) -> UserRole:
+        return parse_role(role) or UserRole.USER
+
+
+def _row_error(row: ImportUserRow, exc: DomainException) -> ImportRowError:
+    code = re.sub(r'(?<!^)(?=[A-Z])', '_', type(exc).__name__).lower()
+    return ImportRowError(row.line, row.email, code, str(exc))
+
+
+def _chunked(rows: Iterable[ImportUserRow], size: int) -> Iterator[List[ImportUserRow]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -3,3 +3,20 @@ from django.apps import AppConfig
 
 class UsersConfig(AppConfig):
     name = 'users'
+
+    def ready(self):
+        # Registrar el hasher de producción (KDF + pool acotado) en el dominio
+        from .domain.password_hasher import set_password_hasher
+        from .infrastructure.password_hashing import build_password_hasher
+
+        set_password_hasher(build_password_hasher())
+
+        # Conteo de consultas por request en cada conexión que se abra
+        from .infrastructure import metrics  # noqa: F401
+
+        # La revocación de JWT sin estado necesita una caché compartida
+        from django.core import checks
+
+        from .infrastructure.token_revocation import check_revocation_cache
+
+        checks.register(check_revocation_cache)
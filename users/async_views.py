@@ -0,0 +1,192 @@
+"""
+users/async_views.py
+
+Capa de presentacion -- Vistas async para el despliegue ASGI.
+
+Variantes async de los endpoints de lectura de usuarios:
+
+    GET /api/users/                 -- ``AsyncUserListView``
+    GET /api/users/{id}/            -- ``AsyncUserDetailView``
+    GET /api/auth/by-role/{role}/   -- ``AsyncUsersByRoleView``
+
+Bajo ASGI (uvicorn) estas vistas esperan la base de datos con el ORM async
+de Django, sin ocupar un hilo por request. Se activan con
+``USERS_ASYNC_VIEWS=true`` (ver ``users/urls.py``).
+
+Devuelven exactamente las mismas respuestas JSON:API que ``UserViewSet`` /
+``AuthViewSet``: reusan la autenticación por cookie, la paginación, los
+helpers de ``api_response`` y el exception handler global. Los métodos de
+escritura de esas rutas (PATCH, DELETE, ...) se delegan al viewset síncrono
+(``sync_to_async``): las escrituras publican eventos y usan transacciones,
+que el ORM async todavía no soporta.
+"""
+
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .api_response import collection_response, success_response, user_resource
+from .application.use_cases import GetUsersByRoleCommand
+from .conditional import collection_etag, not_modified, user_etag
+from .container import get_container
+from .domain.entities import parse_role
+from .domain.exceptions import DomainException
+from .exception_handler import jsonapi_exception_handler
+from .infrastructure.cookie_authentication import CookieJWTAuthentication
+from .infrastructure.request_profile import phase, query_budget
+from .lookup import active_filter_from_query, resolve_command_from_query, resolve_response
+from .pagination import CREATED_AT_KEY, USERNAME_KEY, page_request_from_query, pagination_links
+from .renderers import FastJSONRenderer
+from .views import AuthViewSet, UserViewSet
+
+
+class AsyncAPIView(View):
+    """
+    Base de las vistas async: autenticación, errores y render JSON:API.
+
+    Solo GET/HEAD se atienden en async; el resto de métodos se delega a
+    ``sync_view`` (o 405 JSON:API si no hay vista síncrona).
+    """
+
+    sync_view: Optional[Callable[..., Any]] = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # La autenticación es por JWT (cookie/header), como en las APIView de DRF
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.container = get_container()
+        self.repository = self.container.async_repository
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if request.method not in ("GET", "HEAD"):
+            sync_view = type(self).sync_view
+            if sync_view is None:
+                return self.http_method_not_allowed(request, *args, **kwargs)
+            return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+        drf_request = Request(request, authenticators=[CookieJWTAuthentication()])
+        etag = None
+        try:
+            await sync_to_async(self._authenticate)(drf_request)
+            etag = await self.etag(drf_request, *args, **kwargs)
+            unchanged = not_modified(request, etag)
+            if unchanged is not None:
+                return unchanged
+            response = await self.get(drf_request, *args, **kwargs)
+        except Exception as exc:
+            response = jsonapi_exception_handler(exc, {"view": self, "request": drf_request})
+        if etag is not None and response.status_code == 200:
+            response["ETag"] = etag
+        return self._finalize(response, drf_request)
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        raise NotImplementedError
+
+    async def etag(self, request: Request, *args, **kwargs) -> Optional[str]:
+        """ETag actual del recurso (ver ``users.conditional``); None = sin condicionales."""
+        return None
+
+    @staticmethod
+    def _authenticate(request: Request) -> None:
+        """Equivalente a ``IsAuthenticated``; puede consultar la base de datos."""
+        user = request.user
+        if not (user and user.is_authenticated):
+            raise NotAuthenticated()
+
+    @staticmethod
+    def _finalize(response: Response, request: Request) -> Response:
+        """Prepara la Response de DRF para que Django la renderice al devolverla."""
+        response.accepted_renderer = FastJSONRenderer()
+        response.accepted_media_type = FastJSONRenderer.media_type
+        response.renderer_context = {"request": request, "response": response}
+        return response
+
+
+class AsyncUserListView(AsyncAPIView):
+    """GET /api/users/ -- listado paginado o resolución por ``filter[id]`` / ``filter[email]``."""
+
+    sync_view = staticmethod(UserViewSet.as_view({"get": "list"}))
+
+    async def etag(self, request: Request, *args, **kwargs) -> Optional[str]:
+        return collection_etag(request, *await self.repository.collection_state())
+
+    @query_budget(3)
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        command = resolve_command_from_query(request)
+        if command is not None:
+            with phase("use_case"):
+                result = await self.container.async_resolve_users.execute(command)
+            return resolve_response(request, result)
+
+        page_request = page_request_from_query(request, CREATED_AT_KEY)
+        is_active = active_filter_from_query(request)
+        with phase("use_case"):
+            page = await self.container.async_list_users.execute_page(page_request, is_active)
+        resources = [user_resource(u, request=request) for u in page.items]
+        return collection_response(
+            resources,
+            status=status.HTTP_200_OK,
+            links=pagination_links(request, page, page_request),
+        )
+
+
+class AsyncUserDetailView(AsyncAPIView):
+    """GET /api/users/{id}/ -- PATCH y DELETE se delegan a ``UserViewSet``."""
+
+    sync_view = staticmethod(UserViewSet.as_view({
+        "get": "retrieve",
+        "patch": "partial_update",
+        "delete": "destroy",
+    }))
+
+    async def etag(self, request: Request, pk: Optional[str] = None, **kwargs) -> Optional[str]:
+        try:
+            return user_etag(pk, await self.repository.find_updated_at(pk))
+        except DjangoValidationError:
+            return None  # ID inválido: get() responde el error
+
+    @query_budget(2)
+    async def get(self, request: Request, pk: Optional[str] = None, **kwargs) -> Response:
+        with phase("use_case"):
+            user = await self.container.async_get_user.execute(user_id=pk)
+        return success_response(user_resource(user, request=request), status=status.HTTP_200_OK)
+
+
+class AsyncUsersByRoleView(AsyncAPIView):
+    """GET /api/auth/by-role/{role}/ -- usuarios de un rol, paginados por username."""
+
+    sync_view = staticmethod(AuthViewSet.as_view({"get": "by_role"}))
+
+    async def etag(self, request: Request, role: Optional[str] = None, **kwargs) -> Optional[str]:
+        try:
+            resolved = parse_role(role)
+        except DomainException:
+            return None  # rol inválido: get() responde el error
+        if resolved is None:
+            return None
+        return collection_etag(request, *await self.repository.collection_state(resolved), resolved.value)
+
+    @query_budget(3)
+    async def get(self, request: Request, role: Optional[str] = None, **kwargs) -> Response:
+        page_request = page_request_from_query(request, USERNAME_KEY)
+        with phase("use_case"):
+            page = await self.container.async_get_users_by_role.execute_page(
+                GetUsersByRoleCommand(role=role), page_request,
+            )
+        resources = [user_resource(u, request=request) for u in page.items]
+        return collection_response(
+            resources,
+            status=status.HTTP_200_OK,
+            links=pagination_links(request, page, page_request),
+        )
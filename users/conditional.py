@@ -0,0 +1,80 @@
+"""
+users/conditional.py
+
+GET condicionales (``ETag`` / ``If-None-Match``) de usuarios y colecciones.
+
+Los ETag son débiles (``W/"..."``): identifican el estado de los datos, no
+los bytes del cuerpo (``meta`` lleva request_id y timestamp). Se calculan
+sin cargar ni serializar usuarios:
+
+- Recurso: ``id`` + ``updated_at`` del usuario.
+- Colección: cantidad de usuarios + ``max(updated_at)`` del alcance (todos
+  o un rol) + query string (tamaño de página y cursor).
+
+Si ``If-None-Match`` coincide se responde ``304 Not Modified`` sin cuerpo.
+Las respuestas con ETag llevan ``Cache-Control: private, no-cache`` (ver
+``APIHeadersMiddleware``): el cliente puede guardarlas pero debe revalidar.
+"""
+
+import hashlib
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+
+
+def weak_etag(*parts: Any) -> str:
+    """ETag débil a partir de los componentes dados."""
+    digest = hashlib.blake2b("|".join(str(p) for p in parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def user_etag(user_id: Any, updated_at: Optional[datetime]) -> Optional[str]:
+    """ETag de un usuario (None si no existe)."""
+    if updated_at is None:
+        return None
+    return weak_etag("user", user_id, updated_at.isoformat())
+
+
+def collection_etag(request, count: int, last_updated: Optional[datetime], *scope: Any) -> str:
+    """ETag de una página de colección."""
+    return weak_etag(
+        "users", *scope, count,
+        last_updated.isoformat() if last_updated else "",
+        request.META.get("QUERY_STRING", ""),
+    )
+
+
+def not_modified(request, etag: Optional[str]) -> Optional[HttpResponseBase]:
+    """``304 Not Modified`` si ``If-None-Match`` coincide con ``etag``, o None."""
+    if etag is None:
+        return None
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response["ETag"] = etag
+    return response
+
+
+def etag_condition(etag_func: Callable[..., Optional[str]]):
+    """
+    Decorador para acciones GET de ViewSet: evalúa ``If-None-Match``.
+
+    ``etag_func(view, request, *args, **kwargs)`` devuelve el ETag actual
+    (o None para responder sin condicionales). Corre después de la
+    autenticación y antes de la acción, que no se ejecuta si hay 304.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            etag = etag_func(self, request, *args, **kwargs)
+            response = not_modified(request, etag)
+            if response is not None:
+                return response
+            response = view_method(self, request, *args, **kwargs)
+            if etag is not None and response.status_code == 200:
+                response["ETag"] = etag
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,228 @@
+"""
+users/container.py
+
+Contenedor de dependencias del proceso.
+
+DRF crea un viewset por request; antes cada uno construía su repositorio,
+su publicador (leyendo ``os.environ``) y un caso de uso por acción. Los
+repositorios, publicadores y casos de uso no guardan estado de request (el
+identity map y el enrutamiento viven en ``ContextVar``), así que se
+construyen una sola vez por proceso, de forma perezosa y thread-safe, y
+las vistas los toman de ``get_container()``.
+
+Ciclo de vida:
+
+- ``post_fork()``: en el worker recién creado (gunicorn ``post_fork``,
+  ver ``gunicorn.conf.py``) descarta las instancias y conexiones heredadas
+  del master (relevante con ``--preload``).
+- ``shutdown()``: al terminar el worker cierra los pools (RabbitMQ,
+  hashing, conexiones a la base de datos).
+- ``override(**deps)``: reemplaza dependencias dentro de un ``with``
+  (tests). Los casos de uso se reconstruyen con los reemplazos.
+- Un cambio de ``EVENT_DELIVERY_MODE`` (``override_settings``) descarta
+  las instancias construidas.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, TypeVar
+
+from django.core.signals import setting_changed
+from django.db import connections
+
+from .application.async_use_cases import (
+    AsyncGetUserUseCase,
+    AsyncGetUsersByRoleUseCase,
+    AsyncListUsersUseCase,
+    AsyncResolveUsersUseCase,
+)
+from .application.use_cases import (
+    ChangeUserEmailUseCase,
+    DeactivateUserUseCase,
+    GetUserUseCase,
+    GetUsersByRoleUseCase,
+    ListUserChangesUseCase,
+    ListUsersUseCase,
+    LoginUseCase,
+    RegisterUserUseCase,
+    ResolveUsersUseCase,
+)
+from .domain.event_publisher import EventPublisher
+from .domain.repositories import AsyncUserRepository, UserRepository
+from .infrastructure.async_repository import AsyncDjangoUserRepository
+from .infrastructure.outbox import build_event_publisher
+from .infrastructure.password_hashing import shutdown_hashing_pool
+from .infrastructure.rabbitmq_pool import close_all_pools
+from .infrastructure.repository import DjangoUserRepository
+
+T = TypeVar("T")
+
+# Settings que cambian qué se construye
+_WIRING_SETTINGS = {"EVENT_DELIVERY_MODE"}
+
+
+class Container:
+    """Singletons del proceso: repositorios, publicador y casos de uso."""
+
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        self._overrides: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _resolve(self, name: str, factory: Callable[[], T]) -> T:
+        if name in self._overrides:
+            return self._overrides[name]
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return self._instances[name]
+
+    # -- Infraestructura -----------------------------------------------------
+
+    @property
+    def repository(self) -> UserRepository:
+        return self._resolve("repository", DjangoUserRepository)
+
+    @property
+    def async_repository(self) -> AsyncUserRepository:
+        return self._resolve("async_repository", lambda: AsyncDjangoUserRepository(self.repository))
+
+    @property
+    def event_publisher(self) -> EventPublisher:
+        return self._resolve("event_publisher", build_event_publisher)
+
+    # -- Casos de uso --------------------------------------------------------
+
+    @property
+    def register_user(self) -> RegisterUserUseCase:
+        return self._resolve("register_user", lambda: RegisterUserUseCase(self.repository, self.event_publisher))
+
+    @property
+    def login(self) -> LoginUseCase:
+        return self._resolve("login", lambda: LoginUseCase(self.repository))
+
+    @property
+    def get_user(self) -> GetUserUseCase:
+        return self._resolve("get_user", lambda: GetUserUseCase(self.repository))
+
+    @property
+    def list_users(self) -> ListUsersUseCase:
+        return self._resolve("list_users", lambda: ListUsersUseCase(self.repository))
+
+    @property
+    def get_users_by_role(self) -> GetUsersByRoleUseCase:
+        return self._resolve("get_users_by_role", lambda: GetUsersByRoleUseCase(self.repository))
+
+    @property
+    def resolve_users(self) -> ResolveUsersUseCase:
+        return self._resolve("resolve_users", lambda: ResolveUsersUseCase(self.repository))
+
+    @property
+    def list_user_changes(self) -> ListUserChangesUseCase:
+        return self._resolve("list_user_changes", lambda: ListUserChangesUseCase(self.repository))
+
+    @property
+    def change_user_email(self) -> ChangeUserEmailUseCase:
+        return self._resolve(
+            "change_user_email", lambda: ChangeUserEmailUseCase(self.repository, self.event_publisher)
+        )
+
+    @property
+    def deactivate_user(self) -> DeactivateUserUseCase:
+        return self._resolve(
+            "deactivate_user", lambda: DeactivateUserUseCase(self.repository, self.event_publisher)
+        )
+
+    @property
+    def async_get_user(self) -> AsyncGetUserUseCase:
+        return self._resolve("async_get_user", lambda: AsyncGetUserUseCase(self.async_repository))
+
+    @property
+    def async_list_users(self) -> AsyncListUsersUseCase:
+        return self._resolve("async_list_users", lambda: AsyncListUsersUseCase(self.async_repository))
+
+    @property
+    def async_get_users_by_role(self) -> AsyncGetUsersByRoleUseCase:
+        return self._resolve(
+            "async_get_users_by_role", lambda: AsyncGetUsersByRoleUseCase(self.async_repository)
+        )
+
+    @property
+    def async_resolve_users(self) -> AsyncResolveUsersUseCase:
+        return self._resolve("async_resolve_users", lambda: AsyncResolveUsersUseCase(self.async_repository))
+
+    # -- Ciclo de vida -------------------------------------------------------
+
+    def reset(self) -> None:
+        """Descarta las instancias construidas (se recrean al pedirlas)."""
+        with self._lock:
+            self._instances.clear()
+
+    @contextmanager
+    def override(self, **dependencies: Any) -> Iterator["Container"]:
+        """
+        Reemplaza dependencias por nombre de propiedad dentro del ``with``.
+
+        Lo que depende de ellas se construye de nuevo con los reemplazos; al
+        salir vuelven las instancias anteriores.
+
+        Ejemplo: ``with get_container().override(event_publisher=fake): ...``
+        """
+        unknown = [name for name in dependencies if not isinstance(getattr(type(self), name, None), property)]
+        if unknown:
+            raise AttributeError(f"Dependencias desconocidas: {', '.join(unknown)}")
+        with self._lock:
+            previous_overrides, previous_instances = dict(self._overrides), self._instances
+            self._overrides.update(dependencies)
+            self._instances = {}
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._overrides, self._instances = previous_overrides, previous_instances
+
+    def post_fork(self) -> None:
+        """
+        Worker recién creado: nada de lo construido en el master se reutiliza.
+
+        Las conexiones a la base de datos heredadas pertenecen al master; se
+        descartan sin cerrarlas (cerrarlas cerraría el socket compartido).
+        Los pools de RabbitMQ y de hashing ya se reinician con
+        ``os.register_at_fork``.
+        """
+        self.reset()
+        for connection in connections.all(initialized_only=True):
+            connection.connection = None
+
+    def shutdown(self) -> None:
+        """Cierra los recursos compartidos del proceso (fin del worker)."""
+        self.reset()
+        close_all_pools()
+        shutdown_hashing_pool()
+        for connection in connections.all(initialized_only=True):
+            connection.close()
+            close_pool = getattr(connection, "close_pool", None)
+            if close_pool is not None:
+                close_pool()
+
+
+_container = Container()
+
+
+def get_container() -> Container:
+    """Contenedor del proceso."""
+    return _container
+
+
+def _reset_on_setting_change(setting: str, **kwargs: Any) -> None:
+    if setting in _WIRING_SETTINGS:
+        _container.reset()
+
+
+setting_changed.connect(_reset_on_setting_change)
@@ -3,6 +3,7 @@ CAPA DE DOMINIO - Lógica de negocio pura, independiente del framework.
 
 Esta capa contiene:
 - Entidades: Objetos con identidad y reglas de negocio
+- Modelos de lectura: Proyecciones de solo lectura, sin secretos
 - Eventos: Hechos importantes del dominio (inmutables)
 - Excepciones: Violaciones de reglas de negocio
 - Factories: Creación compleja de entidades
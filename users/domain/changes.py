@@ -0,0 +1,54 @@
+"""
+Feed de cambios - Objetos de valor del dominio.
+
+Permite a otros servicios sincronizar su copia de los usuarios de forma
+incremental: en lugar de volver a descargar toda la colección piden los
+cambios posteriores a la última posición que procesaron.
+
+Cada cambio es un alta/modificación (con el usuario actual) o una baja
+(``user`` es None). Los cambios se ordenan por ``(changed_at, user_id)`` y
+la posición en el feed es la clave de ordenación del último cambio visto
+(una ``PageKey``, igual que en la paginación keyset).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from .pagination import PageKey
+from .read_models import UserSummary
+
+
+@dataclass(frozen=True)
+class UserChange:
+    """
+    Cambio de un usuario.
+
+    Attributes:
+        user_id: ID del usuario modificado o eliminado
+        changed_at: Momento del cambio (``updated_at`` o fecha de baja)
+        user: Estado actual del usuario, o None si fue eliminado
+    """
+    user_id: str
+    changed_at: datetime
+    user: Optional[UserSummary] = None
+
+    @property
+    def deleted(self) -> bool:
+        return self.user is None
+
+
+@dataclass
+class ChangeFeed:
+    """
+    Tramo del feed de cambios.
+
+    Attributes:
+        changes: Cambios en orden ``(changed_at, user_id)`` ascendente
+        cursor: Posición para pedir los cambios siguientes (la recibida si
+            no hubo cambios; None si el feed está vacío)
+        has_more: Hay más cambios disponibles después de ``cursor``
+    """
+    changes: List[UserChange] = field(default_factory=list)
+    cursor: Optional[PageKey] = None
+    has_more: bool = False
@@ -5,12 +5,12 @@ Contienen las reglas de negocio y son independientes del framework.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Set
 from enum import Enum
 import re
 
 from .events import DomainEvent, UserDeactivated, UserEmailChanged
-from .exceptions import InvalidEmail, UserAlreadyInactive
+from .exceptions import InvalidEmail, InvalidRole, UserAlreadyInactive
 
 
 class UserRole(str, Enum):
@@ -22,7 +22,41 @@ class UserRole(str, Enum):
     USER = "USER"
 
 
-@dataclass
+def parse_role(value: object) -> Optional[UserRole]:
+    """
+    Rol a partir de un valor de entrada (``"admin"``, ``" USER "``, ``UserRole``).
+
+    Returns:
+        El rol, o None si el valor viene vacío
+
+    Raises:
+        InvalidRole: Si el rol no existe
+    """
+    if value is None:
+        return None
+    if isinstance(value, UserRole):
+        return value
+    role_text = str(value).strip().upper()
+    if not role_text:
+        return None
+    try:
+        return UserRole[role_text]
+    except KeyError:
+        raise InvalidRole(role_text)
+
+
+# Atributos persistidos cuyo cambio se registra para escribir solo esos campos
+TRACKED_FIELDS: FrozenSet[str] = frozenset({
+    "email", "username", "password_hash", "is_active", "role", "token_version",
+})
+
+# Regex simple para validar formato básico de email (compilada una vez)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
 class User:
     """
     Entidad de dominio User.
@@ -35,6 +69,21 @@ class User:
     - Un usuario puede estar activo o inactivo
     - Un usuario tiene un rol (ADMIN o USER)
     - Solo se puede desactivar un usuario activo (idempotencia)
+    - Desactivar o cambiar el email revoca los tokens emitidos (token_version)
+
+    Seguimiento de cambios:
+    - Una entidad cargada por el repositorio queda "limpia" (``mark_clean``) y
+      registra qué atributos de ``TRACKED_FIELDS`` se modifican después; el
+      repositorio solo escribe esos campos.
+    - Una entidad construida a mano no tiene seguimiento: todos sus campos se
+      consideran modificados.
+    - ``version`` es la versión de la fila leída (bloqueo optimista).
+
+    Hidratación:
+    - El constructor valida el estado inicial (``__post_init__``).
+    - ``from_persisted`` reconstruye una fila ya validada al guardarla, sin
+      volver a validar, y la deja limpia.
+    - ``slots=True``: sin ``__dict__`` por instancia.
     """
 
     # Atributos de la entidad
@@ -45,9 +94,59 @@ class User:
     is_active: bool
     role: UserRole  # Rol del usuario
     created_at: datetime
+    # Versión de los tokens emitidos; al incrementarse invalida los anteriores
+    token_version: int = 0
+    # Versión de la fila persistida; se incrementa en cada escritura
+    version: int = 0
 
     # Lista de eventos de dominio generados por cambios en la entidad
     _domain_events: List[DomainEvent] = field(default_factory=list, init=False, repr=False)
+    # Campos modificados desde mark_clean() (None = sin seguimiento)
+    _dirty_fields: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        dirty = getattr(self, "_dirty_fields", None)
+        if dirty is not None and name in TRACKED_FIELDS and getattr(self, name, _UNSET) != value:
+            dirty.add(name)
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_persisted(
+        cls,
+        id: str,
+        email: str,
+        username: str,
+        password_hash: str,
+        is_active: bool,
+        role: UserRole,
+        created_at: datetime,
+        token_version: int = 0,
+        version: int = 0,
+    ) -> "User":
+        """
+        Reconstruye un usuario persistido sin validarlo (método factory).
+
+        Solo para datos que ya pasaron por las reglas del dominio al
+        guardarse (filas de la base de datos). No ejecuta ``__post_init__``
+        y deja la entidad limpia (``mark_clean``).
+
+        Returns:
+            Entidad con seguimiento de cambios activo
+        """
+        user = cls.__new__(cls)
+        set_field = object.__setattr__
+        set_field(user, "id", id)
+        set_field(user, "email", email)
+        set_field(user, "username", username)
+        set_field(user, "password_hash", password_hash)
+        set_field(user, "is_active", is_active)
+        set_field(user, "role", role)
+        set_field(user, "created_at", created_at)
+        set_field(user, "token_version", token_version)
+        set_field(user, "version", version)
+        set_field(user, "_domain_events", [])
+        set_field(user, "_dirty_fields", set())
+        return user
 
     def __post_init__(self):
         """Validación de estado inicial de la entidad."""
@@ -81,6 +180,7 @@ class User:
 
         # Cambiar estado
         self.is_active = False
+        self._revoke_tokens()
 
         # Generar evento de dominio
         event = UserDeactivated(
@@ -120,6 +220,7 @@ class User:
         # Cambiar email
         old_email = self.email
         self.email = new_email_normalized
+        self._revoke_tokens()
 
         # Generar evento de dominio
         event = UserEmailChanged(
@@ -130,6 +231,24 @@ class User:
         )
         self._domain_events.append(event)
 
+    def _revoke_tokens(self) -> None:
+        """Invalida los tokens emitidos hasta ahora (los claims quedan obsoletos)."""
+        self.token_version += 1
+
+    def mark_clean(self) -> None:
+        """Inicia el seguimiento de cambios: el estado actual es el persistido."""
+        self._dirty_fields = set()
+
+    def dirty_fields(self) -> FrozenSet[str]:
+        """Campos modificados desde ``mark_clean`` (todos si no hay seguimiento)."""
+        if self._dirty_fields is None:
+            return TRACKED_FIELDS
+        return frozenset(self._dirty_fields)
+
+    def is_tracking_changes(self) -> bool:
+        """True si la entidad registra sus cambios (fue cargada del repositorio)."""
+        return self._dirty_fields is not None
+
     def is_admin(self) -> bool:
         """
         Verifica si el usuario tiene rol de administrador.
@@ -174,9 +293,7 @@ class User:
         if not email or not email.strip():
             return False
 
-        # Regex simple para validar formato básico de email
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email.strip()))
+        return bool(EMAIL_PATTERN.match(email.strip()))
 
     @staticmethod
     def create(email: str, username: str, password_hash: str, role: UserRole = UserRole.USER) -> "User":
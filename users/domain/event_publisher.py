@@ -8,7 +8,7 @@ El dominio solo sabe que puede "publicar eventos", no sabe CÓMO se publican.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 
 class EventPublisher(ABC):
@@ -29,3 +29,17 @@ class EventPublisher(ABC):
             routing_key: Clave de enrutamiento para el mensaje (ej: 'user.created')
         """
         pass
+
+    def publish_many(self, events: Iterable[Any], routing_key: str) -> None:
+        """
+        Publica varios eventos de una vez (p.ej. tras una importación masiva).
+
+        La implementación por defecto publica uno a uno; las implementaciones
+        concretas pueden agruparlos (un solo canal, un solo INSERT...).
+
+        Args:
+            events: Eventos de dominio a publicar
+            routing_key: Clave de enrutamiento común a todos los eventos
+        """
+        for event in events:
+            self.publish(event, routing_key)
@@ -26,11 +26,13 @@ class InvalidUsername(DomainException):
 
 
 class UserAlreadyExists(DomainException):
-    """Se lanza cuando se intenta crear un usuario con un email ya registrado."""
+    """Se lanza cuando se intenta crear un usuario con un email o username ya registrado."""
 
-    def __init__(self, email: str):
-        self.email = email
-        super().__init__(f"Ya existe un usuario con el email: {email}")
+    def __init__(self, value: str, field: str = "email"):
+        self.field = field
+        self.value = value
+        self.email = value if field == "email" else None
+        super().__init__(f"Ya existe un usuario con el {field}: {value}")
 
 
 class UserAlreadyInactive(DomainException):
@@ -49,6 +51,14 @@ class UserNotFound(DomainException):
         super().__init__(f"Usuario {user_id} no encontrado")
 
 
+class ConcurrentModification(DomainException):
+    """Se lanza cuando el usuario cambió en la base de datos desde que se leyó (bloqueo optimista)."""
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        super().__init__(f"El usuario {user_id} fue modificado por otra operación; reintente")
+
+
 class InvalidUserData(DomainException):
     """Se lanza cuando los datos del usuario son inválidos."""
     pass
@@ -3,10 +3,9 @@ Factory - Crea instancias de entidades de dominio asegurando validez.
 Encapsula la lógica compleja de creación y validación.
 """
 
-import hashlib
-
 from .entities import User, UserRole
 from .exceptions import InvalidUserData, InvalidEmail, InvalidUsername
+from .password_hasher import get_password_hasher
 
 
 class UserFactory:
@@ -42,6 +41,26 @@ class UserFactory:
             InvalidUsername: Si el username no cumple requisitos
             InvalidUserData: Si el password es muy corto
         """
+        UserFactory.validate(email, username, password)
+
+        # Hashear el password con el hasher registrado (KDF con salt)
+        password_hash = UserFactory.hash_password(password)
+
+        return UserFactory.create_from_hash(email, username, password_hash, role)
+
+    @staticmethod
+    def validate(email: str, username: str, password: str) -> None:
+        """
+        Aplica las reglas de validación de ``create`` sin hashear el password.
+
+        Permite validar lotes (importación masiva) antes de pagar el costo
+        del hash.
+
+        Raises:
+            InvalidEmail: Si el email está vacío
+            InvalidUsername: Si el username no cumple requisitos
+            InvalidUserData: Si el password es muy corto
+        """
         # Validación: Email no vacío
         if not email or not email.strip():
             raise InvalidEmail(email or "")
@@ -54,9 +73,26 @@ class UserFactory:
         if not password or len(password) < 8:
             raise InvalidUserData("El password debe tener al menos 8 caracteres")
 
-        # Hashear el password (simple hash para desarrollo, usar bcrypt en producción)
-        password_hash = UserFactory._hash_password(password)
+    @staticmethod
+    def create_from_hash(
+        email: str,
+        username: str,
+        password_hash: str,
+        role: UserRole = UserRole.USER,
+    ) -> User:
+        """
+        Crea un usuario a partir de un password ya hasheado.
 
+        Args:
+            email: Email del usuario
+            username: Nombre de usuario
+            password_hash: Hash del password (ver ``hash_password``)
+            role: Rol del usuario (default: USER)
+
+        Raises:
+            InvalidEmail: Si el email no tiene formato válido
+            InvalidUsername: Si el username no cumple requisitos
+        """
         # Crear usuario usando el método factory de la entidad
         # Esto aplicará las validaciones adicionales del __post_init__
         return User.create(
@@ -67,17 +103,18 @@ class UserFactory:
         )
 
     @staticmethod
-    def _hash_password(password: str) -> str:
+    def hash_password(password: str) -> str:
         """
-        Genera un hash del password.
+        Genera un hash del password con el ``PasswordHasher`` registrado.
 
-        NOTA: En producción usar bcrypt, argon2 o similar.
-        Este es un hash simple solo para desarrollo/ejemplo.
+        En la app Django es un KDF con salt y costo calibrado (ver
+        infrastructure/password_hashing.py); sin infraestructura, el
+        hasher legacy SHA-256.
 
         Args:
             password: Password en texto plano
 
         Returns:
-            Hash SHA-256 del password
+            Hash codificado del password
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        return get_password_hasher().hash(password)
@@ -0,0 +1,47 @@
+"""
+Paginación por cursor (keyset) - Objetos de valor del dominio.
+
+La paginación keyset no usa OFFSET: cada página se obtiene filtrando por
+la clave de ordenación del último elemento visto (p.ej. ``(created_at, id)``),
+por lo que el costo por página es constante sin importar la profundidad.
+
+Las claves (``after`` / ``before``) son tuplas de valores primitivos. La
+codificación a un cursor opaco es responsabilidad de la capa de presentación.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+PageKey = Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """
+    Solicitud de una página.
+
+    Attributes:
+        size: Número máximo de elementos en la página
+        after: Clave del último elemento de la página anterior (avanzar)
+        before: Clave del primer elemento de la página siguiente (retroceder)
+    """
+    size: int
+    after: Optional[PageKey] = None
+    before: Optional[PageKey] = None
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    Página de resultados.
+
+    Attributes:
+        items: Elementos de la página, en el orden de la consulta
+        next_key: Clave para pedir la página siguiente (None si es la última)
+        prev_key: Clave para pedir la página anterior (None si es la primera)
+    """
+    items: List[T] = field(default_factory=list)
+    next_key: Optional[PageKey] = None
+    prev_key: Optional[PageKey] = None
@@ -0,0 +1,96 @@
+"""
+Interfaz PasswordHasher - Define el contrato para hashear y verificar passwords.
+
+⚠️ IMPORTANTE: Este archivo contiene la interfaz abstracta y el hasher
+legacy (SHA-256 sin salt) usado por las primeras versiones del servicio.
+La IMPLEMENTACIÓN de producción (KDF con salt y costo calibrado, pool de
+workers acotado) va en infrastructure/password_hashing.py y se registra al
+arrancar la app (``users.apps.UsersConfig.ready``).
+
+El dominio solo sabe que puede "hashear" y "verificar", no CÓMO.
+"""
+
+import hashlib
+import hmac
+import re
+from abc import ABC, abstractmethod
+
+
+class PasswordHasher(ABC):
+    """Contrato abstracto para hashear y verificar passwords."""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """
+        Genera el hash de un password.
+
+        Args:
+            password: Password en texto plano
+
+        Returns:
+            Hash codificado (incluye algoritmo, parámetros y salt)
+        """
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, encoded: str) -> bool:
+        """
+        Verifica un password contra un hash almacenado.
+
+        Args:
+            password: Password en texto plano
+            encoded: Hash almacenado
+
+        Returns:
+            True si el password corresponde al hash
+        """
+        pass
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """
+        Indica si el hash debe regenerarse (algoritmo o costo obsoletos).
+
+        Se consulta tras un login exitoso para actualizar el hash de forma
+        transparente.
+        """
+        return False
+
+
+_LEGACY_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_legacy_sha256(encoded: str) -> bool:
+    """True si ``encoded`` es un hash SHA-256 hex sin salt (formato legacy)."""
+    return bool(_LEGACY_SHA256_RE.match(encoded or ""))
+
+
+class LegacySha256PasswordHasher(PasswordHasher):
+    """
+    SHA-256 sin salt (formato original del servicio).
+
+    Solo se usa para verificar hashes existentes y como fallback cuando el
+    dominio se usa sin la infraestructura (tests de dominio puros).
+    """
+
+    def hash(self, password: str) -> str:
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return hmac.compare_digest(self.hash(password), encoded or "")
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return True
+
+
+_password_hasher: PasswordHasher = LegacySha256PasswordHasher()
+
+
+def set_password_hasher(hasher: PasswordHasher) -> None:
+    """Registra el hasher usado por ``UserFactory`` y los casos de uso."""
+    global _password_hasher
+    _password_hasher = hasher
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Hasher registrado (legacy SHA-256 si la infraestructura no registró otro)."""
+    return _password_hasher
@@ -0,0 +1,30 @@
+"""
+Modelos de lectura - Proyecciones de usuarios para consultas de solo lectura.
+
+Los listados, el detalle, la resolución por lote y el feed de cambios no
+modifican usuarios: no necesitan la entidad completa ni, sobre todo, el
+hash del password. Los repositorios los cargan con solo las columnas que
+se exponen, así que el hash no sale de la base de datos en esas rutas.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from .entities import UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class UserSummary:
+    """
+    Vista de solo lectura de un usuario, sin secretos.
+
+    Tiene los atributos que se serializan (``user_resource``). Para
+    modificar un usuario hay que cargar la entidad ``User``.
+    """
+    id: str
+    email: str
+    username: str
+    role: UserRole
+    is_active: bool
+    created_at: Optional[datetime] = None
@@ -8,9 +8,13 @@ Esto permite inyección de dependencias y desacopla el dominio de la infraestruc
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
 
+from .changes import ChangeFeed
 from .entities import User, UserRole
+from .pagination import Page, PageKey, PageRequest
+from .read_models import UserSummary
 
 
 class UserRepository(ABC):
@@ -31,6 +35,10 @@ class UserRepository(ABC):
 
         Returns:
             Usuario persistido con el ID asignado (si es nuevo)
+
+        Raises:
+            UserAlreadyExists: Si el email o el username ya pertenecen a otro
+                usuario (lo detecta la restricción única, sin consulta previa)
         """
         pass
 
@@ -47,6 +55,19 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """
+        Busca un usuario por ID para mostrarlo (solo las columnas expuestas).
+
+        Args:
+            user_id: ID del usuario (UUID como string)
+
+        Returns:
+            Vista de solo lectura del usuario, None si no se encuentra
+        """
+        pass
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[User]:
         """
@@ -61,12 +82,38 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    def find_all(self) -> List[User]:
+    def find_by_ids(self, user_ids: Iterable[str]) -> List[UserSummary]:
+        """
+        Busca varios usuarios por ID en una sola consulta.
+
+        Args:
+            user_ids: IDs a buscar (los inválidos o inexistentes se omiten)
+
+        Returns:
+            Vistas de solo lectura, en el orden de ``user_ids``
+        """
+        pass
+
+    @abstractmethod
+    def find_by_emails(self, emails: Iterable[str]) -> List[UserSummary]:
+        """
+        Busca varios usuarios por email en una sola consulta.
+
+        Args:
+            emails: Emails a buscar (sin distinguir mayúsculas)
+
+        Returns:
+            Vistas de solo lectura, en el orden de ``emails``
+        """
+        pass
+
+    @abstractmethod
+    def find_all(self) -> List[UserSummary]:
         """
         Obtiene todos los usuarios del sistema.
 
         Returns:
-            Lista de entidades User
+            Lista de vistas de solo lectura (sin ``password_hash``)
         """
         pass
 
@@ -94,7 +141,7 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    def find_by_role(self, role: UserRole) -> List[User]:
+    def find_by_role(self, role: UserRole) -> List[UserSummary]:
         """
         Busca usuarios por rol.
 
@@ -102,6 +149,171 @@ class UserRepository(ABC):
             role: Rol a filtrar (UserRole enum)
 
         Returns:
-            Lista de entidades User con ese rol
+            Lista de vistas de solo lectura con ese rol
+        """
+        pass
+
+    @abstractmethod
+    def find_page(self, page: PageRequest, is_active: Optional[bool] = None) -> Page[UserSummary]:
+        """
+        Obtiene una página de usuarios ordenados por ``(created_at, id)``
+        descendente (más recientes primero).
+
+        Args:
+            page: Tamaño y clave de posición de la página
+            is_active: Solo usuarios activos (True) o inactivos (False); None = todos
+
+        Returns:
+            Página de vistas de solo lectura con las claves de la página siguiente/anterior
+        """
+        pass
+
+    @abstractmethod
+    def find_page_by_role(self, role: UserRole, page: PageRequest) -> Page[UserSummary]:
+        """
+        Obtiene una página de usuarios de un rol ordenados por ``(username, id)``.
+
+        Args:
+            role: Rol a filtrar (UserRole enum)
+            page: Tamaño y clave de posición de la página
+
+        Returns:
+            Página de vistas de solo lectura con las claves de la página siguiente/anterior
+        """
+        pass
+
+    @abstractmethod
+    def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Devuelve cuáles de los emails dados ya están registrados (una consulta).
+
+        Args:
+            emails: Emails a verificar (normalizados)
+
+        Returns:
+            Subconjunto de emails existentes
+        """
+        pass
+
+    @abstractmethod
+    def find_existing_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        """
+        Devuelve cuáles de los usernames dados ya están registrados (una consulta).
+
+        Args:
+            usernames: Usernames a verificar
+
+        Returns:
+            Subconjunto de usernames existentes
+        """
+        pass
+
+    @abstractmethod
+    def bulk_insert(self, users: List[User]) -> List[User]:
+        """
+        Inserta un lote de usuarios nuevos en una sola operación.
+
+        Los usuarios que choquen con otro ya existente (p.ej. insertado
+        concurrentemente) se omiten.
+
+        Args:
+            users: Entidades sin ID
+
+        Returns:
+            Los usuarios efectivamente insertados, con su ID asignado
+        """
+        pass
+
+    @abstractmethod
+    def find_updated_at(self, user_id: str) -> Optional[datetime]:
+        """
+        Fecha de la última modificación de un usuario, sin cargarlo entero.
+
+        Se usa para validar cachés (ETag) con una consulta mínima.
+
+        Returns:
+            ``updated_at`` del usuario, o None si no existe
         """
         pass
+
+    @abstractmethod
+    def collection_state(self, role: Optional[UserRole] = None) -> Tuple[int, Optional[datetime]]:
+        """
+        Cantidad de usuarios y máximo ``updated_at`` (opcionalmente de un rol).
+
+        Cambia al crear, modificar o eliminar usuarios de la colección.
+        """
+        pass
+
+    @abstractmethod
+    def find_changes(self, since: Optional[PageKey], limit: int) -> ChangeFeed:
+        """
+        Altas, modificaciones y bajas posteriores a la posición ``since``.
+
+        Args:
+            since: Posición devuelta por la llamada anterior (None: desde el inicio)
+            limit: Número máximo de cambios a devolver
+
+        Returns:
+            Cambios en orden ``(changed_at, user_id)`` y la nueva posición
+        """
+        pass
+
+
+class AsyncUserRepository(ABC):
+    """
+    Contrato async (lectura) para el camino ASGI.
+
+    Mismo comportamiento que los métodos homónimos de ``UserRepository``,
+    pero sin bloquear el event loop mientras se espera a la base de datos.
+    """
+
+    @abstractmethod
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        """Busca un usuario por su ID (None si no existe)."""
+        pass
+
+    @abstractmethod
+    async def find_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Vista de solo lectura de un usuario por su ID (None si no existe)."""
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Busca un usuario por su email (None si no existe)."""
+        pass
+
+    @abstractmethod
+    async def find_by_ids(self, user_ids: Iterable[str]) -> List[UserSummary]:
+        """Usuarios con los IDs dados, en una sola consulta y en el orden pedido."""
+        pass
+
+    @abstractmethod
+    async def find_by_emails(self, emails: Iterable[str]) -> List[UserSummary]:
+        """Usuarios con los emails dados, en una sola consulta y en el orden pedido."""
+        pass
+
+    @abstractmethod
+    async def exists_by_email(self, email: str) -> bool:
+        """True si existe un usuario con el email dado."""
+        pass
+
+    @abstractmethod
+    async def find_page(self, page: PageRequest, is_active: Optional[bool] = None) -> Page[UserSummary]:
+        """Página de usuarios (opcionalmente por ``is_active``) ordenados por ``(created_at, id)`` descendente."""
+        pass
+
+    @abstractmethod
+    async def find_page_by_role(self, role: UserRole, page: PageRequest) -> Page[UserSummary]:
+        """Página de usuarios de un rol ordenados por ``(username, id)`` ascendente."""
+        pass
+
+    @abstractmethod
+    async def find_updated_at(self, user_id: str) -> Optional[datetime]:
+        """``updated_at`` del usuario, o None si no existe."""
+        pass
+
+    @abstractmethod
+    async def collection_state(self, role: Optional[UserRole] = None) -> Tuple[int, Optional[datetime]]:
+        """Cantidad de usuarios y máximo ``updated_at`` (opcionalmente de un rol)."""
+        pass
@@ -35,6 +35,7 @@ from rest_framework.response import Response
 
 from .api_response import _error_object, _meta
 from .domain.exceptions import (
+    ConcurrentModification,
     DomainException,
     InvalidCredentials,
     InvalidEmail,
@@ -55,6 +56,7 @@ _DOMAIN_MAP: Dict[type, tuple[int, str, str]] = {
     UserNotFound: (404, "user_not_found", "Resource not found"),
     UserAlreadyExists: (409, "user_already_exists", "Conflict"),
     UserAlreadyInactive: (409, "user_already_inactive", "Conflict"),
+    ConcurrentModification: (409, "concurrent_modification", "Conflict"),
     InvalidEmail: (422, "invalid_email", "Validation error"),
     InvalidUsername: (422, "invalid_username", "Validation error"),
     InvalidUserData: (422, "invalid_user_data", "Validation error"),
@@ -138,11 +140,15 @@ def jsonapi_exception_handler(exc: Exception, context: Any) -> Optional[Response
         status_code, code, title = _DOMAIN_MAP.get(
             type(exc), (400, "domain_error", "Domain error")
         )
+        source = None
+        if isinstance(exc, UserAlreadyExists):
+            source = {"pointer": f"/data/attributes/{exc.field}"}
         errors = [_error_object(
             status_code=status_code,
             code=code,
             title=title,
             detail=str(exc),
+            source=source,
         )]
         if isinstance(exc, InvalidCredentials):
             resp = _build_response(errors, status_code)
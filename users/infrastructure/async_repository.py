@@ -0,0 +1,100 @@
+"""
+Async Django Repository - Lectura de usuarios con el ORM async de Django.
+
+Usado por las vistas async (``users.async_views``) cuando el servicio corre
+bajo ASGI: las consultas se esperan con ``await`` y el worker puede atender
+otras conexiones mientras tanto.
+
+Comparte la traducción modelo -> entidad, la paginación keyset y el
+identity map del request con ``DjangoUserRepository``; solo cambia cómo se
+ejecutan las consultas.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.db.models import Count, Max
+
+from ..domain.entities import User as DomainUser, UserRole
+from ..domain.pagination import Page, PageRequest
+from ..domain.read_models import UserSummary
+from ..domain.repositories import AsyncUserRepository
+from ..models import User as DjangoUser
+from .identity_map import current_identity_map
+from .repository import SUMMARY_COLUMNS, DjangoUserRepository
+
+
+class AsyncDjangoUserRepository(AsyncUserRepository):
+    """Implementación async del repositorio (solo lectura)."""
+
+    def __init__(self, sync_repository: Optional[DjangoUserRepository] = None):
+        self._sync = sync_repository or DjangoUserRepository()
+
+    async def find_by_id(self, user_id: str) -> Optional[DomainUser]:
+        identity_map = current_identity_map()
+        django_user = identity_map.get(user_id) if identity_map is not None else None
+        if django_user is None:
+            try:
+                django_user = self._sync._register(await DjangoUser.objects.aget(pk=user_id))
+            except DjangoUser.DoesNotExist:
+                return None
+        return self._sync._to_domain(django_user)
+
+    async def find_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        summary = self._sync._summary_in_identity_map(user_id)
+        if summary is not None:
+            return summary
+        values = await DjangoUser.objects.filter(pk=user_id).values(*SUMMARY_COLUMNS).afirst()
+        return self._sync._to_summary(values) if values else None
+
+    async def find_by_email(self, email: str) -> Optional[DomainUser]:
+        django_user = await self._sync._email_queryset([email]).afirst()
+        return self._sync._to_domain(django_user) if django_user else None
+
+    async def find_by_ids(self, user_ids: Iterable[str]) -> List[UserSummary]:
+        keys = self._sync._uuid_keys(user_ids)
+        found, pending = self._sync._summaries_in_identity_map(keys)
+        if pending:
+            query = DjangoUser.objects.filter(pk__in=pending).order_by().values(*SUMMARY_COLUMNS)
+            found.update(self._sync._summaries_by([row async for row in query], 'id'))
+        return [found[key] for key in keys if key in found]
+
+    async def find_by_emails(self, emails: Iterable[str]) -> List[UserSummary]:
+        keys = self._sync._email_keys(emails)
+        if not keys:
+            return []
+        query = self._sync._email_queryset(keys).values(*SUMMARY_COLUMNS)
+        found = self._sync._summaries_by([row async for row in query], 'email')
+        return [found[key] for key in keys if key in found]
+
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._sync._email_queryset([email]).aexists()
+
+    async def find_page(self, page: PageRequest, is_active: Optional[bool] = None) -> Page[UserSummary]:
+        return await self._keyset_page(self._sync._listing_queryset(is_active), ('created_at', 'id'), True, page)
+
+    async def find_page_by_role(self, role: UserRole, page: PageRequest) -> Page[UserSummary]:
+        return await self._keyset_page(
+            DjangoUser.objects.filter(role=role.value), ('username', 'id'), False, page
+        )
+
+    async def find_updated_at(self, user_id: str) -> Optional[datetime]:
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return await DjangoUser.objects.filter(pk=user_id).values_list('updated_at', flat=True).afirst()
+        row = identity_map.get(user_id)
+        if row is not None:
+            return row.updated_at
+        values = await DjangoUser.objects.filter(pk=user_id).values(*SUMMARY_COLUMNS, 'updated_at').afirst()
+        return self._sync._remember_summary(identity_map, user_id, values)
+
+    async def collection_state(self, role: Optional[UserRole] = None) -> Tuple[int, Optional[datetime]]:
+        state = await self._sync._collection_queryset(role).aaggregate(
+            count=Count('id'), last_updated=Max('updated_at'),
+        )
+        return state['count'], state['last_updated']
+
+    async def _keyset_page(self, queryset, fields, descending: bool, page: PageRequest) -> Page[UserSummary]:
+        query = self._sync._keyset_queryset(queryset.values(*SUMMARY_COLUMNS), fields, descending, page)
+        rows = [row async for row in query]
+        return self._sync._build_page(rows, fields, page)
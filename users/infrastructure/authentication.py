@@ -3,10 +3,16 @@ Authentication adapter for users-service.
 Uses users.User (UUID PK) when validating JWTs.
 """
 
+import copy
+
+from django.conf import settings
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 from rest_framework_simplejwt.settings import api_settings
 
+from users.infrastructure.claims_principal import authenticate_from_claims
+from users.infrastructure.identity_map import current_identity_map
+from users.infrastructure.principal_cache import get_principal_cache
 from users.models import User
 
 
@@ -15,17 +21,38 @@ class UsersServiceJWTAuthentication(JWTAuthentication):
 
     def get_user(self, validated_token):
         """Return authenticated user or raise an auth error in Spanish."""
+        if getattr(settings, "JWT_STATELESS_AUTH", False):
+            principal = authenticate_from_claims(validated_token)
+            if principal is not None:
+                return principal
+
         try:
             user_id = validated_token[api_settings.USER_ID_CLAIM]
         except KeyError as exc:
             raise InvalidToken("Token sin user_id") from exc
 
-        try:
-            user = User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
-        except User.DoesNotExist as exc:
-            raise AuthenticationFailed("Usuario no encontrado", code="user_not_found") from exc
+        cache = get_principal_cache()
+        user = cache.get(user_id)
+        if user is None:
+            try:
+                user = self._load_user(user_id)
+            except User.DoesNotExist as exc:
+                raise AuthenticationFailed("Usuario no encontrado", code="user_not_found") from exc
+            # La caché es compartida entre requests: copia, no la fila del identity map
+            cache.put(user_id, copy.copy(user))
 
         if not user.is_active:
             raise AuthenticationFailed("Usuario inactivo", code="user_inactive")
 
         return user
+
+    @staticmethod
+    def _load_user(user_id):
+        """Carga la fila del usuario a través del identity map del request (si hay)."""
+        def load():
+            return User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return load()
+        return identity_map.get_or_load(user_id, load)
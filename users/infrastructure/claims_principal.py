@@ -0,0 +1,90 @@
+"""
+Principal ligero construido a partir de los claims del JWT.
+
+Se usa en el modo ``JWT_STATELESS_AUTH``: el autenticador no consulta la
+tabla ``users`` en cada request, sino que confía en los claims firmados
+(``role``, ``is_active``, ``token_version``...) y solo verifica la
+revocación contra la caché (ver ``token_revocation``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from .token_revocation import is_token_revoked
+
+# Claims necesarios para autenticar sin consultar la base de datos
+REQUIRED_CLAIMS = ("email", "username", "role", "is_active", "token_version")
+
+
+@dataclass(frozen=True)
+class ClaimsPrincipal:
+    """
+    Usuario autenticado representado solo por sus claims.
+
+    Expone la misma interfaz de lectura que ``users.User`` usada por las
+    vistas y permisos (``id``, ``email``, ``role``, ``is_authenticated``...).
+    """
+
+    id: str
+    email: str
+    username: str
+    role: str
+    is_active: bool
+    token_version: int
+
+    is_authenticated = True
+    is_anonymous = False
+
+    @property
+    def pk(self) -> str:
+        return self.id
+
+    @classmethod
+    def from_token(cls, validated_token: Token) -> Optional["ClaimsPrincipal"]:
+        """
+        Construye el principal desde el token.
+
+        Returns:
+            El principal, o ``None`` si el token es anterior al modo sin
+            estado y no trae todos los claims necesarios.
+        """
+        if any(claim not in validated_token for claim in REQUIRED_CLAIMS):
+            return None
+        return cls(
+            id=str(validated_token[api_settings.USER_ID_CLAIM]),
+            email=validated_token["email"],
+            username=validated_token["username"],
+            role=validated_token["role"],
+            is_active=bool(validated_token["is_active"]),
+            token_version=int(validated_token["token_version"]),
+        )
+
+
+def authenticate_from_claims(validated_token: Token) -> Optional[ClaimsPrincipal]:
+    """
+    Autentica usando solo los claims del token y la lista de revocación.
+
+    Returns:
+        El principal autenticado, o ``None`` si el token no trae los claims
+        necesarios (el llamador debe recurrir a la consulta en BD).
+
+    Raises:
+        AuthenticationFailed: Si el usuario está inactivo o el token fue revocado.
+    """
+    principal = ClaimsPrincipal.from_token(validated_token)
+    if principal is None:
+        return None
+
+    if not principal.is_active:
+        raise AuthenticationFailed("Usuario inactivo", code="user_inactive")
+
+    if is_token_revoked(principal.id, principal.token_version):
+        raise AuthenticationFailed("Token revocado", code="token_revoked")
+
+    return principal
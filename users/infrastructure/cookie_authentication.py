@@ -9,9 +9,15 @@ Uses the custom ``users.User`` model directly for DB lookups instead of
 ``get_user_model()`` because ``AUTH_USER_MODEL`` is not overridden in
 this project (the custom model is a plain ``models.Model``, not
 ``AbstractUser``).
+
+When ``settings.JWT_STATELESS_AUTH`` is enabled the user is built from
+the token claims (see ``claims_principal``) and no DB lookup is made.
 """
 
-from typing import Optional, Tuple
+import copy
+from typing import Optional, Tuple, Union
+
+from django.conf import settings
 
 from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import JWTAuthentication
@@ -19,6 +25,10 @@ from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidTok
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import Token
 
+from users.infrastructure.claims_principal import ClaimsPrincipal, authenticate_from_claims
+from users.infrastructure.identity_map import current_identity_map
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.request_profile import phase
 from users.models import User
 
 
@@ -35,17 +45,18 @@ class CookieJWTAuthentication(JWTAuthentication):
     use ``CookieJWTStatelessAuthentication`` instead (no User table).
     """
 
-    def authenticate(self, request: Request) -> Optional[Tuple[User, Token]]:
+    def authenticate(self, request: Request) -> Optional[Tuple[Union[User, ClaimsPrincipal], Token]]:
         """Attempt cookie-based auth first, then fall back to header."""
-        raw_token: Optional[str] = request.COOKIES.get('access_token')
-        if raw_token is not None:
-            validated_token = self.get_validated_token(raw_token)
-            return self.get_user(validated_token), validated_token
+        with phase("auth"):
+            raw_token: Optional[str] = request.COOKIES.get('access_token')
+            if raw_token is not None:
+                validated_token = self.get_validated_token(raw_token)
+                return self.get_user(validated_token), validated_token
 
-        # Fallback: standard Authorization header
-        return super().authenticate(request)
+            # Fallback: standard Authorization header
+            return super().authenticate(request)
 
-    def get_user(self, validated_token: Token) -> User:
+    def get_user(self, validated_token: Token) -> Union[User, ClaimsPrincipal]:
         """
         Resolve the user from the validated JWT using ``users.User``.
 
@@ -53,27 +64,45 @@ class CookieJWTAuthentication(JWTAuthentication):
         ``get_user_model()`` — unsuitable here because the custom
         ``User`` model is not registered as ``AUTH_USER_MODEL``.
 
+        In stateless mode a ``ClaimsPrincipal`` is returned instead; tokens
+        issued before that mode (missing claims) fall back to the DB lookup.
+        DB lookups go through the per-process ``PrincipalCache``; on a miss
+        the row is loaded through the request's identity map so the
+        repository can reuse it instead of querying again.
+
         Args:
             validated_token: Already-validated JWT token.
 
         Returns:
-            The authenticated ``User`` instance.
+            The authenticated ``User`` instance (or ``ClaimsPrincipal``).
 
         Raises:
             InvalidToken: If the token lacks a ``user_id`` claim.
-            AuthenticationFailed: If the user does not exist or is inactive.
+            AuthenticationFailed: If the user does not exist, is inactive
+                or the token was revoked.
         """
+        if getattr(settings, 'JWT_STATELESS_AUTH', False):
+            principal = authenticate_from_claims(validated_token)
+            if principal is not None:
+                return principal
+
         try:
             user_id = validated_token[api_settings.USER_ID_CLAIM]
         except KeyError:
             raise InvalidToken("Token sin identificador de usuario")
 
-        try:
-            user = User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
-        except User.DoesNotExist:
-            raise AuthenticationFailed(
-                "Usuario no encontrado", code="user_not_found"
-            )
+        cache = get_principal_cache()
+        user = cache.get(user_id)
+        if user is None:
+            try:
+                user = self._load_user(user_id)
+            except User.DoesNotExist:
+                raise AuthenticationFailed(
+                    "Usuario no encontrado", code="user_not_found"
+                )
+            # The cache is shared across requests: store a copy, never the
+            # identity map row that this request may still modify.
+            cache.put(user_id, copy.copy(user))
 
         if not user.is_active:
             raise AuthenticationFailed(
@@ -81,3 +110,14 @@ class CookieJWTAuthentication(JWTAuthentication):
             )
 
         return user
+
+    @staticmethod
+    def _load_user(user_id: str) -> User:
+        """Load the user row, registering it in the request's identity map."""
+        def load() -> User:
+            return User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return load()
+        return identity_map.get_or_load(user_id, load)
@@ -0,0 +1,63 @@
+"""
+Estado de las conexiones a la base de datos, por alias.
+
+La configuración vive en ``settings.DATABASES`` (ver ``POSTGRES_CONN_MAX_AGE``
+y ``POSTGRES_POOL``). Cada alias funciona en uno de tres modos:
+
+- ``per_request``: ``CONN_MAX_AGE=0`` sin pool; se abre y cierra una
+  conexión por request (handshake TCP + TLS + autenticación cada vez).
+- ``persistent``: el worker reutiliza su conexión entre requests durante
+  ``CONN_MAX_AGE`` segundos y la verifica antes de reutilizarla
+  (``CONN_HEALTH_CHECKS``).
+- ``pool``: pool de psycopg 3 por proceso (``OPTIONS['pool']``), acotado
+  por ``max_size``; cada conexión se verifica al entregarse.
+
+``database_pool_stats()`` lo reporta en ``GET /api/health/``.
+"""
+
+from typing import Any, Dict
+
+from django.db import connections
+
+MODE_PER_REQUEST = "per_request"
+MODE_PERSISTENT = "persistent"
+MODE_POOL = "pool"
+
+
+def connection_mode(settings_dict: Dict[str, Any]) -> str:
+    if settings_dict.get("OPTIONS", {}).get("pool"):
+        return MODE_POOL
+    if settings_dict.get("CONN_MAX_AGE", 0) != 0:
+        return MODE_PERSISTENT
+    return MODE_PER_REQUEST
+
+
+def connection_stats(connection) -> Dict[str, Any]:
+    """Modo y, si hay pool, su ocupación (``psycopg_pool.ConnectionPool.get_stats``)."""
+    settings_dict = connection.settings_dict
+    stats: Dict[str, Any] = {
+        "vendor": connection.vendor,
+        "mode": connection_mode(settings_dict),
+        "conn_max_age": settings_dict.get("CONN_MAX_AGE", 0),
+        "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+    }
+    pool = getattr(connection, "pool", None) if stats["mode"] == MODE_POOL else None
+    if pool is not None:
+        pool_stats = pool.get_stats()
+        in_use = pool_stats.get("pool_size", 0) - pool_stats.get("pool_available", 0)
+        stats.update(
+            min_size=pool_stats.get("pool_min", 0),
+            max_size=pool_stats.get("pool_max", 0),
+            size=pool_stats.get("pool_size", 0),
+            available=pool_stats.get("pool_available", 0),
+            in_use=in_use,
+            waiting=pool_stats.get("requests_waiting", 0),
+            utilization=round(in_use / pool_stats["pool_max"], 3) if pool_stats.get("pool_max") else 0.0,
+            timeouts=pool_stats.get("requests_errors", 0),
+        )
+    return stats
+
+
+def database_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Estado de las conexiones del proceso, indexado por alias."""
+    return {alias: connection_stats(connections[alias]) for alias in connections}
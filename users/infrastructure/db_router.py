@@ -0,0 +1,129 @@
+"""
+Router de base de datos: lecturas a la réplica con read-your-writes.
+
+Si ``settings.DATABASES`` define el alias ``replica`` (ver
+``POSTGRES_REPLICA_HOST``), las lecturas de usuarios hechas durante un
+request (``find_*``, ``exists_by_email``, autenticación) van a la réplica.
+Van al primario:
+
+- Todas las escrituras.
+- Las lecturas dentro de una transacción del primario (``atomic``): los
+  casos de uso que leen y luego escriben necesitan la versión actual de
+  la fila (bloqueo optimista).
+- Las lecturas del resto del request una vez que escribió.
+- Las lecturas de un cliente que escribió hace menos de
+  ``USERS_READ_YOUR_WRITES_SECONDS``: ``ReadYourWritesMiddleware`` marca
+  la respuesta de la escritura con una cookie y los requests siguientes del
+  mismo cliente se atienden desde el primario hasta que vence.
+- Todo lo que corre fuera de un request (comandos, relay del outbox) y
+  los modelos que no son de usuarios (outbox).
+
+Cada decisión se cuenta por motivo; ver ``routing_stats()``.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_ALIAS = "replica"
+
+# Modelos cuyas lecturas pueden ir a la réplica
+_REPLICATED_MODELS = {"user", "usertombstone"}
+
+
+@dataclass
+class _RoutingState:
+    """Estado de enrutamiento del request en curso (mutable: lo comparten los hilos de ``sync_to_async``)."""
+    pinned: bool = False
+    wrote: bool = False
+
+
+_state: ContextVar[Optional[_RoutingState]] = ContextVar("users_db_routing", default=None)
+
+_counters: Dict[str, int] = {
+    "replica": 0,
+    "primary_write": 0,
+    "primary_pinned": 0,
+    "primary_transaction": 0,
+    "primary_unscoped": 0,
+}
+_counters_lock = threading.Lock()
+
+
+def _count(decision: str) -> None:
+    with _counters_lock:
+        _counters[decision] += 1
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in connections.settings
+
+
+def routing_stats() -> Dict[str, Any]:
+    """Decisiones de enrutamiento del proceso, por motivo."""
+    with _counters_lock:
+        return {"replica_configured": replica_configured(), **_counters}
+
+
+def reset_routing_stats() -> None:
+    with _counters_lock:
+        for key in _counters:
+            _counters[key] = 0
+
+
+@contextmanager
+def db_routing_scope(pinned: bool = False) -> Iterator[_RoutingState]:
+    """
+    Alcance de un request: sus lecturas pueden ir a la réplica.
+
+    Args:
+        pinned: El cliente escribió hace poco; todo el request usa el primario
+    """
+    state = _RoutingState(pinned=pinned)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """``DATABASE_ROUTERS``: primario para escrituras, réplica para lecturas de usuarios."""
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if model._meta.model_name not in _REPLICATED_MODELS or not replica_configured():
+            return None
+        state = _state.get()
+        if state is None:
+            _count("primary_unscoped")
+            return DEFAULT_DB_ALIAS
+        if state.pinned:
+            _count("primary_pinned")
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            _count("primary_transaction")
+            return DEFAULT_DB_ALIAS
+        _count("replica")
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        state = _state.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        if replica_configured():
+            _count("primary_write")
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Primario y réplica tienen los mismos datos
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # La réplica recibe el esquema por replicación
+        return db != REPLICA_ALIAS
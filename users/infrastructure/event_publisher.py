@@ -4,25 +4,92 @@ Adaptador que traduce eventos de dominio a mensajes RabbitMQ.
 """
 
 import json
+import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 import pika
 
 from ..domain.event_publisher import EventPublisher
 from ..domain.events import DomainEvent, UserCreated, UserDeactivated, UserEmailChanged
+from .metrics import observe_publish
+from .rabbitmq_pool import RECONNECTABLE_ERRORS, PooledChannel, RabbitMQChannelPool, get_channel_pool
+
+logger = logging.getLogger(__name__)
+
+
+def translate_event(event: DomainEvent) -> Dict[str, Any]:
+    """
+    Traduce un evento de dominio a un diccionario JSON serializable.
+
+    Args:
+        event: Evento de dominio
+
+    Returns:
+        Diccionario con los datos del evento
+    """
+    if isinstance(event, UserCreated):
+        return {
+            "event_type": "user.created",
+            "user_id": event.user_id,
+            "email": event.email,
+            "username": event.username,
+            "occurred_at": event.occurred_at.isoformat()
+        }
+    elif isinstance(event, UserDeactivated):
+        return {
+            "event_type": "user.deactivated",
+            "user_id": event.user_id,
+            "reason": event.reason,
+            "occurred_at": event.occurred_at.isoformat()
+        }
+    elif isinstance(event, UserEmailChanged):
+        return {
+            "event_type": "user.email_changed",
+            "user_id": event.user_id,
+            "old_email": event.old_email,
+            "new_email": event.new_email,
+            "occurred_at": event.occurred_at.isoformat()
+        }
+    else:
+        # Evento genérico
+        return {
+            "event_type": event.__class__.__name__,
+            "occurred_at": event.occurred_at.isoformat()
+        }
 
 
 class RabbitMQEventPublisher(EventPublisher):
     """
     Implementación del publicador de eventos usando RabbitMQ.
     Traduce eventos de dominio a mensajes y los publica en un exchange.
+
+    Las conexiones y canales se toman de un pool por proceso
+    (``rabbitmq_pool``), por lo que publicar no implica un handshake
+    TCP + AMQP por evento.
     """
 
-    def __init__(self):
-        """Inicializa el publicador con configuración de RabbitMQ."""
+    def __init__(self, pool: Optional[RabbitMQChannelPool] = None):
+        """
+        Inicializa el publicador con configuración de RabbitMQ.
+
+        Args:
+            pool: Pool de canales a usar (opcional, por defecto el del proceso)
+        """
         self.host = os.environ.get('RABBITMQ_HOST', 'localhost')
         self.exchange_name = os.environ.get('RABBITMQ_EXCHANGE_NAME', 'users_events')
+        self._pool = pool
+
+    @property
+    def pool(self) -> RabbitMQChannelPool:
+        """Pool de canales usado para publicar."""
+        if self._pool is None:
+            self._pool = get_channel_pool(self.host)
+        return self._pool
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Estadísticas del pool de conexiones del publicador."""
+        return self.pool.stats()
 
     def publish(self, event: DomainEvent, routing_key: str = '') -> None:
         """
@@ -38,6 +105,42 @@ class RabbitMQEventPublisher(EventPublisher):
         # Publicar en RabbitMQ
         self._publish_to_rabbitmq(message)
 
+    def publish_message(self, message: Dict[str, Any]) -> None:
+        """
+        Publica un mensaje ya traducido (p.ej. leído del outbox).
+
+        Args:
+            message: Diccionario JSON serializable con los datos del evento
+        """
+        self._publish_to_rabbitmq(message)
+
+    def publish_many(self, events: Iterable[DomainEvent], routing_key: str = '') -> None:
+        """
+        Publica varios eventos reutilizando un único canal del pool.
+
+        Si el canal se rompe a mitad del lote, se reintenta una vez con una
+        conexión nueva a partir del primer mensaje no publicado.
+
+        Args:
+            events: Eventos de dominio a publicar
+            routing_key: Clave de enrutamiento (ignorada en fanout)
+        """
+        bodies = [json.dumps(self._translate_event(event)) for event in events]
+        published = 0
+        with observe_publish("publish_many"):
+            for attempt in range(2):
+                try:
+                    with self.pool.channel() as pooled:
+                        self._ensure_exchange(pooled)
+                        for body in bodies[published:]:
+                            self._basic_publish(pooled, body)
+                            published += 1
+                    return
+                except RECONNECTABLE_ERRORS as exc:
+                    if attempt:
+                        raise
+                    logger.warning("Canal RabbitMQ roto (%s), reconectando...", exc)
+
     def _translate_event(self, event: DomainEvent) -> Dict[str, Any]:
         """
         Traduce un evento de dominio a un diccionario JSON serializable.
@@ -48,60 +151,38 @@ class RabbitMQEventPublisher(EventPublisher):
         Returns:
             Diccionario con los datos del evento
         """
-        if isinstance(event, UserCreated):
-            return {
-                "event_type": "user.created",
-                "user_id": event.user_id,
-                "email": event.email,
-                "username": event.username,
-                "occurred_at": event.occurred_at.isoformat()
-            }
-        elif isinstance(event, UserDeactivated):
-            return {
-                "event_type": "user.deactivated",
-                "user_id": event.user_id,
-                "reason": event.reason,
-                "occurred_at": event.occurred_at.isoformat()
-            }
-        elif isinstance(event, UserEmailChanged):
-            return {
-                "event_type": "user.email_changed",
-                "user_id": event.user_id,
-                "old_email": event.old_email,
-                "new_email": event.new_email,
-                "occurred_at": event.occurred_at.isoformat()
-            }
-        else:
-            # Evento genérico
-            return {
-                "event_type": event.__class__.__name__,
-                "occurred_at": event.occurred_at.isoformat()
-            }
+        return translate_event(event)
 
     def _publish_to_rabbitmq(self, message: Dict[str, Any]) -> None:
         """
         Publica un mensaje en RabbitMQ usando exchange fanout.
 
+        Reutiliza un canal del pool. Si el canal resulta estar roto (p.ej. el
+        broker cerró la conexión ociosa) se descarta y se reintenta una vez
+        con una conexión nueva.
+
         Args:
             message: Diccionario con los datos del mensaje
         """
-        connection = pika.BlockingConnection(
-            pika.ConnectionParameters(host=self.host)
-        )
-        channel = connection.channel()
-
-        # Declarar exchange fanout (broadcast)
-        channel.exchange_declare(
-            exchange=self.exchange_name,
-            exchange_type='fanout',
-            durable=True
-        )
-
         # Serializar mensaje a JSON
         body = json.dumps(message)
 
-        # Publicar al exchange
-        channel.basic_publish(
+        with observe_publish("publish"):
+            try:
+                self._publish_body(body)
+            except RECONNECTABLE_ERRORS as exc:
+                logger.warning("Canal RabbitMQ roto (%s), reconectando...", exc)
+                self._publish_body(body)
+
+    def _publish_body(self, body: str) -> None:
+        """Publica *body* en el exchange usando un canal prestado por el pool."""
+        with self.pool.channel() as pooled:
+            self._ensure_exchange(pooled)
+            self._basic_publish(pooled, body)
+
+    def _basic_publish(self, pooled: PooledChannel, body: str) -> None:
+        """Publica *body* en el exchange con el canal dado."""
+        pooled.channel.basic_publish(
             exchange=self.exchange_name,
             routing_key='',  # Ignorado en fanout
             body=body,
@@ -111,4 +192,13 @@ class RabbitMQEventPublisher(EventPublisher):
             )
         )
 
-        connection.close()
+    def _ensure_exchange(self, pooled: PooledChannel) -> None:
+        """Declara el exchange fanout (broadcast) una sola vez por canal."""
+        if self.exchange_name in pooled.declared_exchanges:
+            return
+        pooled.channel.exchange_declare(
+            exchange=self.exchange_name,
+            exchange_type='fanout',
+            durable=True
+        )
+        pooled.declared_exchanges.add(self.exchange_name)
@@ -0,0 +1,122 @@
+"""
+Exportación en streaming de la tabla ``users`` (NDJSON / CSV, opcional gzip).
+
+Pensado para sincronizaciones masivas: las filas se leen con
+``QuerySet.iterator(chunk_size=...)`` (cursor del lado del servidor en
+PostgreSQL) como tuplas planas, sin instanciar modelos ni entidades, y se
+serializan en bloques. La memoria usada es constante sin importar cuántos
+usuarios haya.
+
+Lo usan ``GET /api/users/export/`` (``StreamingHttpResponse``) y
+``manage.py export_users``. Nunca se exporta ``password_hash``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from django.conf import settings
+
+from ..models import User as DjangoUser
+
+# Columnas exportadas, en orden (también es la cabecera del CSV)
+EXPORT_FIELDS: Tuple[str, ...] = ("id", "email", "username", "role", "is_active", "created_at")
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+
+CONTENT_TYPES: Dict[str, str] = {
+    FORMAT_NDJSON: "application/x-ndjson",
+    FORMAT_CSV: "text/csv; charset=utf-8",
+}
+
+# Filas serializadas por cada bloque que se entrega al consumidor
+_ROWS_PER_CHUNK = 500
+
+
+def default_chunk_size() -> int:
+    return getattr(settings, "USERS_EXPORT_CHUNK_SIZE", 2000)
+
+
+def iter_user_rows(chunk_size: int | None = None) -> Iterator[Tuple[Any, ...]]:
+    """
+    Recorre todos los usuarios en orden ``(created_at, id)`` como tuplas.
+
+    Args:
+        chunk_size: Filas por fetch del cursor (default ``USERS_EXPORT_CHUNK_SIZE``)
+    """
+    queryset = DjangoUser.objects.order_by("created_at", "id").values_list(*EXPORT_FIELDS)
+    return queryset.iterator(chunk_size=chunk_size or default_chunk_size())
+
+
+def _normalize(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    user_id, email, username, role, is_active, created_at = row
+    return str(user_id), email, username, role, bool(is_active), created_at.isoformat()
+
+
+def iter_ndjson(rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    """Serializa filas como NDJSON (un objeto JSON por línea), en bloques."""
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(dict(zip(EXPORT_FIELDS, _normalize(row))), ensure_ascii=False))
+        if len(buffer) >= _ROWS_PER_CHUNK:
+            yield "\n".join(buffer) + "\n"
+            buffer.clear()
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def iter_csv(rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    """Serializa filas como CSV con cabecera, en bloques."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(EXPORT_FIELDS)
+    pending = 1
+    for row in rows:
+        writer.writerow(_normalize(row))
+        pending += 1
+        if pending >= _ROWS_PER_CHUNK:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+            pending = 0
+    if pending:
+        yield out.getvalue()
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Comprime un flujo de bytes en formato gzip de forma incremental."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_users(
+    fmt: str = FORMAT_NDJSON,
+    *,
+    gzip: bool = False,
+    chunk_size: int | None = None,
+) -> Iterator[bytes]:
+    """
+    Genera la exportación completa como un flujo de bytes.
+
+    Args:
+        fmt: ``ndjson`` o ``csv``
+        gzip: Comprimir la salida con gzip
+        chunk_size: Filas por fetch del cursor de base de datos
+
+    Raises:
+        ValueError: Si el formato no es soportado
+    """
+    if fmt not in CONTENT_TYPES:
+        raise ValueError(f"Formato de exportación no soportado: {fmt}")
+    serializer = iter_csv if fmt == FORMAT_CSV else iter_ndjson
+    encoded = (chunk.encode("utf-8") for chunk in serializer(iter_user_rows(chunk_size)))
+    return gzip_stream(encoded) if gzip else encoded
@@ -0,0 +1,113 @@
+"""
+Identity map por request (unidad de trabajo de lectura).
+
+Durante un request la misma fila de ``users`` se necesita varias veces:
+la autenticación JWT la carga para verificar ``is_active``, el caso de uso
+la vuelve a pedir con ``find_by_id`` y ``save`` la necesita para actualizar.
+El identity map guarda cada fila cargada, indexada por id, y la devuelve en
+las lecturas siguientes del mismo request sin volver a consultar la base.
+
+Además de filas completas guarda vistas de solo lectura (``UserSummary``)
+cargadas por las lecturas proyectadas: la consulta del ETag de un usuario
+trae esas columnas y el detalle las reutiliza. Cargar o descartar la fila
+completa descarta la vista.
+
+El alcance lo abre ``users.middleware.IdentityMapMiddleware`` con
+``identity_map_scope()``; vive en un ``ContextVar``, por lo que es propio
+de cada request tanto en WSGI (hilos) como en ASGI (tareas). Fuera de un
+request (comandos, relay, tests de repositorio) no hay identity map activo
+y el repositorio consulta siempre la base de datos.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class IdentityMap:
+    """
+    Filas cargadas en el request actual, indexadas por id.
+
+    ``hits`` cuenta las lecturas resueltas sin consultar la base de datos
+    (consultas ahorradas) y ``loads`` las que sí la consultaron.
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, Any] = {}
+        self._summaries: Dict[str, Any] = {}
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        row = self._rows.get(str(key))
+        if row is not None:
+            self.hits += 1
+        return row
+
+    def peek(self, key: Any) -> Optional[Any]:
+        """Como ``get`` pero sin contar un acierto (uso interno del repositorio)."""
+        return self._rows.get(str(key))
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """Fila registrada para ``key`` o, si no hay, la que devuelve ``loader`` (y se registra)."""
+        row = self.get(key)
+        if row is None:
+            row = loader()
+            self.loads += 1
+            self._rows[str(key)] = row
+            self._summaries.pop(str(key), None)
+        return row
+
+    def register(self, row: Any) -> Any:
+        """
+        Registra una fila cargada por otra vía.
+
+        Si ya había una instancia con el mismo id se conserva esa (una sola
+        instancia por fila) y se devuelve.
+        """
+        self.loads += 1
+        self._summaries.pop(str(row.pk), None)
+        return self._rows.setdefault(str(row.pk), row)
+
+    def get_summary(self, key: Any) -> Optional[Any]:
+        """Vista de solo lectura registrada para ``key`` (sin fila completa)."""
+        summary = self._summaries.get(str(key))
+        if summary is not None:
+            self.hits += 1
+        return summary
+
+    def register_summary(self, key: Any, summary: Any) -> None:
+        """Registra una vista cargada con columnas proyectadas."""
+        self.loads += 1
+        self._summaries[str(key)] = summary
+
+    def discard(self, key: Any) -> None:
+        self._rows.pop(str(key), None)
+        self._summaries.pop(str(key), None)
+
+    def __contains__(self, key: Any) -> bool:
+        return str(key) in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+_current: ContextVar[Optional[IdentityMap]] = ContextVar("users_identity_map", default=None)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """Identity map del request en curso, o ``None`` fuera de un request."""
+    return _current.get()
+
+
+@contextmanager
+def identity_map_scope() -> Iterator[IdentityMap]:
+    """Abre un identity map nuevo para el bloque (un request)."""
+    identity_map = IdentityMap()
+    token = _current.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current.reset(token)
@@ -0,0 +1,165 @@
+"""
+Métricas del servicio en formato de texto de Prometheus (``GET /metrics``).
+
+Se registran con ``prometheus_client``:
+
+- Latencia de cada request por ruta, método y status (``MetricsMiddleware``).
+- Consultas a la base de datos por request: cantidad (sin savepoints) y
+  tiempo total. Un ``execute_wrapper`` instalado en cada conexión suma en
+  las estadísticas del request actual (``ContextVar``, así que también
+  cuenta las consultas de las vistas async que corren en otro hilo).
+- Latencia y fallos de publicación en RabbitMQ (``RabbitMQEventPublisher``).
+- Hits y misses de la caché de principals.
+
+Con gunicorn cada worker tiene sus propios contadores. Si está definida
+``PROMETHEUS_MULTIPROC_DIR`` (``gunicorn.conf.py`` la define), los valores
+se escriben en archivos mmap de ese directorio y ``render_metrics`` los
+agrega entre workers; no hace falta ningún servicio externo.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+
+from django.db.backends.signals import connection_created
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+REQUEST_LATENCY = Histogram(
+    "users_http_request_duration_seconds",
+    "Latencia de los requests HTTP (hasta devolver la respuesta).",
+    ["route", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "users_http_request_db_queries",
+    "Consultas a la base de datos por request.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+REQUEST_DB_SECONDS = Histogram(
+    "users_http_request_db_duration_seconds",
+    "Tiempo total en la base de datos por request.",
+    ["route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+PUBLISH_LATENCY = Histogram(
+    "users_rabbitmq_publish_duration_seconds",
+    "Latencia de publicación en RabbitMQ (incluye el reintento tras reconectar).",
+    ["operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+PUBLISH_FAILURES = Counter(
+    "users_rabbitmq_publish_failures_total",
+    "Publicaciones en RabbitMQ que fallaron tras el reintento.",
+    ["operation"],
+)
+PRINCIPAL_CACHE_LOOKUPS = Counter(
+    "users_principal_cache_lookups_total",
+    "Búsquedas en la caché de principals.",
+    ["result"],
+)
+
+
+class QueryStats:
+    """Consultas ejecutadas dentro de un ``query_stats_scope``."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("users_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Estadísticas del scope actual, o ``None`` fuera de un request."""
+    return _query_stats.get()
+
+
+@contextmanager
+def query_stats_scope(reuse: bool = False) -> Iterator[QueryStats]:
+    """
+    Cuenta las consultas (de cualquier alias) ejecutadas dentro del bloque.
+
+    Con ``reuse`` devuelve el scope ya abierto, si lo hay, en lugar de uno nuevo.
+    """
+    current = _query_stats.get()
+    if reuse and current is not None:
+        yield current
+        return
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+# Control de transacciones: cuenta en el tiempo pero no como consulta (en
+# PostgreSQL ``atomic`` no emite sentencias; en SQLite y en los tests, sí)
+_TRANSACTION_CONTROL = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT", "BEGIN")
+
+
+def _track_query(execute, sql, params, many, context):
+    stats = _query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if not sql.startswith(_TRANSACTION_CONTROL):
+            stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+def install_query_tracking(connection) -> None:
+    """Agrega el wrapper de conteo a una conexión (idempotente)."""
+    if _track_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_track_query)
+
+
+def _on_connection_created(sender, connection, **kwargs) -> None:
+    install_query_tracking(connection)
+
+
+connection_created.connect(_on_connection_created)
+
+
+def observe_request(route: str, method: str, status: int, seconds: float, queries: QueryStats) -> None:
+    """Registra un request terminado."""
+    REQUEST_LATENCY.labels(route, method, str(status)).observe(seconds)
+    REQUEST_DB_QUERIES.labels(route).observe(queries.count)
+    REQUEST_DB_SECONDS.labels(route).observe(queries.seconds)
+
+
+@contextmanager
+def observe_publish(operation: str) -> Iterator[None]:
+    """Mide una publicación en RabbitMQ; si el bloque falla cuenta el fallo."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        PUBLISH_FAILURES.labels(operation).inc()
+        raise
+    finally:
+        PUBLISH_LATENCY.labels(operation).observe(time.perf_counter() - started)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Cuerpo y content type de ``/metrics`` (agregado entre workers si aplica)."""
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,228 @@
+"""
+Transactional Outbox - Publicación de eventos desacoplada del request HTTP.
+
+Flujo:
+1. El caso de uso llama a ``OutboxEventPublisher.publish`` dentro de la
+   misma transacción que persiste al usuario: el evento se guarda como una
+   fila de ``users_outbox`` (commit atómico con el cambio).
+2. El proceso ``manage.py relay_outbox`` lee las filas pendientes en lotes
+   y las publica en RabbitMQ (``OutboxRelay``).
+3. Un evento que falla ``max_attempts`` veces se descarta (``failed_at``,
+   dead letter) para no bloquear a los posteriores.
+
+La latencia HTTP deja de depender del broker y ningún evento se pierde si
+RabbitMQ no está disponible: queda pendiente hasta el siguiente lote.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..domain.event_publisher import EventPublisher
+from ..domain.events import DomainEvent
+from ..models import OutboxEvent
+from .event_publisher import RabbitMQEventPublisher, translate_event
+from .principal_cache import PrincipalCacheInvalidator
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxEventPublisher(EventPublisher):
+    """
+    Publicador que escribe los eventos en la tabla outbox.
+
+    Debe invocarse dentro de ``transaction.atomic()`` junto con el cambio
+    del agregado para garantizar atomicidad (ver ``users.views``).
+    """
+
+    def publish(self, event: DomainEvent, routing_key: str = '') -> None:
+        """
+        Encola un evento de dominio en el outbox.
+
+        Args:
+            event: Evento de dominio a publicar
+            routing_key: Clave de enrutamiento (se guarda para el relay)
+        """
+        message = translate_event(event)
+        OutboxEvent.objects.create(
+            event_type=message["event_type"],
+            routing_key=routing_key or '',
+            payload=message,
+        )
+
+    def publish_many(self, events: Iterable[DomainEvent], routing_key: str = '') -> None:
+        """Encola varios eventos con un único INSERT por lote."""
+        rows = []
+        for event in events:
+            message = translate_event(event)
+            rows.append(OutboxEvent(
+                event_type=message["event_type"],
+                routing_key=routing_key or '',
+                payload=message,
+            ))
+        OutboxEvent.objects.bulk_create(rows, batch_size=1000)
+
+
+def build_event_publisher() -> EventPublisher:
+    """
+    Devuelve el publicador configurado en ``settings.EVENT_DELIVERY_MODE``.
+
+    - ``outbox`` (default): eventos al outbox, publicados por el relay.
+    - ``direct``: publicación síncrona en RabbitMQ dentro del request.
+
+    En ambos casos se decora con ``PrincipalCacheInvalidator`` para que la
+    caché de autenticación se invalide al desactivar/cambiar el email.
+    """
+    if getattr(settings, "EVENT_DELIVERY_MODE", "outbox") == "direct":
+        return PrincipalCacheInvalidator(RabbitMQEventPublisher())
+    return PrincipalCacheInvalidator(OutboxEventPublisher())
+
+
+# Clave del advisory lock de PostgreSQL que serializa los relays
+RELAY_LOCK_KEY = 0x7573_6f62  # "usob"
+
+
+@dataclass
+class RelayBatchResult:
+    """Resultado de publicar un lote del outbox."""
+    published: int
+    failed: int
+    elapsed: float
+    dead_lettered: int = 0
+
+    @property
+    def events_per_second(self) -> float:
+        """Throughput del lote (eventos publicados por segundo)."""
+        return self.published / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class OutboxRelay:
+    """
+    Drena la tabla outbox publicando los eventos pendientes en RabbitMQ.
+
+    Los eventos se publican en orden de inserción. Ante el primer fallo el
+    lote se corta (para no reordenar eventos de un mismo usuario) y el
+    evento fallido queda pendiente con ``attempts`` incrementado. Al llegar
+    a ``max_attempts`` el evento pasa a dead letter (``failed_at``, log de
+    error) y el relay sigue con los siguientes.
+
+    El orden requiere un único relay activo: en PostgreSQL cada lote toma
+    el advisory lock ``RELAY_LOCK_KEY`` y, si otro relay lo tiene, no
+    publica nada.
+    """
+
+    def __init__(
+        self,
+        publisher: Optional[RabbitMQEventPublisher] = None,
+        batch_size: int = 100,
+        max_attempts: int = 10,
+    ):
+        self.publisher = publisher or RabbitMQEventPublisher()
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+
+    def relay_batch(self) -> RelayBatchResult:
+        """Publica un lote de eventos pendientes y los marca como publicados."""
+        started = time.perf_counter()
+        published_ids: list[int] = []
+        failed = 0
+        dead_lettered = 0
+
+        with transaction.atomic():
+            if not self._acquire_relay_lock():
+                return RelayBatchResult(published=0, failed=0, elapsed=time.perf_counter() - started)
+
+            pending = OutboxEvent.objects.filter(published_at__isnull=True, failed_at__isnull=True).order_by('id')
+            for outbox_event in pending[:self.batch_size]:
+                try:
+                    self.publisher.publish_message(outbox_event.payload)
+                except Exception as exc:
+                    attempts = outbox_event.attempts + 1
+                    update = {'attempts': attempts, 'last_error': str(exc)[:1000]}
+                    if attempts < self.max_attempts:
+                        logger.warning("Fallo publicando evento outbox #%s: %s", outbox_event.id, exc)
+                        OutboxEvent.objects.filter(pk=outbox_event.pk).update(**update)
+                        failed = 1
+                        break
+                    logger.error(
+                        "Evento outbox #%s (%s) descartado tras %s intentos: %s",
+                        outbox_event.id, outbox_event.event_type, attempts, exc,
+                    )
+                    OutboxEvent.objects.filter(pk=outbox_event.pk).update(failed_at=timezone.now(), **update)
+                    dead_lettered += 1
+                    continue
+                published_ids.append(outbox_event.id)
+
+            if published_ids:
+                OutboxEvent.objects.filter(pk__in=published_ids).update(
+                    published_at=timezone.now(),
+                    attempts=F('attempts') + 1,
+                )
+
+        return RelayBatchResult(
+            published=len(published_ids),
+            failed=failed,
+            elapsed=time.perf_counter() - started,
+            dead_lettered=dead_lettered,
+        )
+
+    @staticmethod
+    def _acquire_relay_lock() -> bool:
+        """Advisory lock de la transacción actual (solo PostgreSQL)."""
+        if connection.vendor != 'postgresql':
+            return True
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [RELAY_LOCK_KEY])
+            return cursor.fetchone()[0]
+
+    def drain(self, max_batches: Optional[int] = None) -> RelayBatchResult:
+        """
+        Publica lotes hasta vaciar el outbox, fallar o agotar ``max_batches``.
+
+        Returns:
+            Resultado agregado de todos los lotes procesados
+        """
+        total = RelayBatchResult(published=0, failed=0, elapsed=0.0)
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            result = self.relay_batch()
+            batches += 1
+            total.published += result.published
+            total.failed += result.failed
+            total.dead_lettered += result.dead_lettered
+            total.elapsed += result.elapsed
+            if result.failed or result.published + result.dead_lettered < self.batch_size:
+                break
+        return total
+
+    def run_forever(
+        self,
+        interval: float,
+        on_batch: Optional[Callable[[RelayBatchResult], Any]] = None,
+        should_stop: Callable[[], bool] = lambda: False,
+    ) -> None:
+        """
+        Bucle del relay: drena el outbox y duerme ``interval`` segundos
+        cuando no quedan eventos pendientes.
+        """
+        while not should_stop():
+            result = self.drain()
+            if on_batch and (result.published or result.failed or result.dead_lettered):
+                on_batch(result)
+            time.sleep(interval)
+
+    @staticmethod
+    def purge_published(older_than: timedelta) -> int:
+        """Elimina eventos ya publicados hace más de ``older_than``."""
+        cutoff = timezone.now() - older_than
+        deleted, _ = OutboxEvent.objects.filter(published_at__lt=cutoff).delete()
+        return deleted
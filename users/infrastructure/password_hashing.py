@@ -0,0 +1,262 @@
+"""
+Motor de hashing de passwords.
+
+- ``DjangoPasswordHasher``: implementa el puerto ``PasswordHasher`` con los
+  hashers de Django (``settings.PASSWORD_HASHERS``: PBKDF2 calibrado por
+  defecto, scrypt, argon2 o bcrypt). Verifica también el formato legacy
+  SHA-256 sin salt y lo marca para rehash.
+- ``HashingPool``: pool de hilos acotado donde corren hash y verificación.
+  Un KDF es CPU-bound a propósito; el pool limita cuántos corren a la vez
+  y cuántos esperan. Si la cola está llena más de ``acquire_timeout``
+  segundos se responde 503 en vez de degradar a todos los requests.
+- ``calibrate_pbkdf2_iterations``: iteraciones de PBKDF2 para una latencia
+  objetivo en el hardware actual (``manage.py calibrate_password_hasher``).
+
+Configuración (settings):
+    PASSWORD_HASHER: pbkdf2 | scrypt | argon2 | bcrypt (preferido).
+    PASSWORD_HASH_ITERATIONS: iteraciones de PBKDF2 (default 450000,
+        calibrado a ~250 ms; 0 = default de Django).
+    PASSWORD_HASH_WORKERS: hilos del pool (0 desactiva el pool).
+    PASSWORD_HASH_MAX_PENDING: operaciones en espera admitidas.
+    PASSWORD_HASH_TIMEOUT: segundos de espera por un lugar en la cola.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher,
+    get_hasher,
+    identify_hasher,
+    make_password,
+    verify_password,
+)
+from rest_framework.exceptions import APIException
+
+from ..domain.password_hasher import LegacySha256PasswordHasher, PasswordHasher, is_legacy_sha256
+
+T = TypeVar("T")
+
+
+class CalibratedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 con iteraciones configurables (``PASSWORD_HASH_ITERATIONS``).
+
+    Usa el mismo identificador ``pbkdf2_sha256`` que Django, por lo que los
+    hashes son intercambiables; al cambiar las iteraciones los hashes
+    existentes se regeneran en el siguiente login (``must_update``).
+    """
+
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        return int(getattr(settings, "PASSWORD_HASH_ITERATIONS", 0) or PBKDF2PasswordHasher.iterations)
+
+
+class DjangoPasswordHasher(PasswordHasher):
+    """Hasher basado en ``django.contrib.auth.hashers`` con soporte legacy."""
+
+    def __init__(self):
+        self._legacy = LegacySha256PasswordHasher()
+
+    def hash(self, password: str) -> str:
+        return make_password(password)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        if is_legacy_sha256(encoded):
+            return self._legacy.verify(password, encoded)
+        is_correct, _ = verify_password(password, encoded)
+        return is_correct
+
+    def needs_rehash(self, encoded: str) -> bool:
+        if is_legacy_sha256(encoded):
+            return True
+        try:
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            return True
+        preferred = get_hasher("default")
+        return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+class PasswordHashingBusy(APIException):
+    """El pool de hashing está saturado (503)."""
+    status_code = 503
+    default_detail = "Servicio de autenticación saturado, reintente en unos segundos."
+    default_code = "password_hashing_busy"
+
+
+class HashingPool:
+    """
+    Pool de hilos acotado para operaciones de hashing.
+
+    Admite ``max_workers`` operaciones en curso más ``max_pending`` en cola;
+    quien no consigue lugar en ``acquire_timeout`` segundos recibe
+    ``PasswordHashingBusy``. Los KDF de ``hashlib`` liberan el GIL, por lo
+    que los hilos corren en paralelo real.
+
+    Args:
+        max_workers: Hilos de hashing.
+        max_pending: Operaciones en espera admitidas.
+        acquire_timeout: Segundos de espera por un lugar en la cola.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32, acquire_timeout: float = 5.0):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.acquire_timeout = acquire_timeout
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pwhash")
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_pending)
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._running = 0
+        self._counters: Dict[str, float] = {
+            "completed": 0,
+            "rejected": 0,
+            "queue_wait_seconds": 0.0,
+            "hash_seconds": 0.0,
+        }
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Ejecuta ``fn(*args)`` en el pool y espera el resultado.
+
+        Raises:
+            PasswordHashingBusy: Si la cola está llena durante ``acquire_timeout``.
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            with self._lock:
+                self._counters["rejected"] += 1
+            raise PasswordHashingBusy()
+
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self._submitted += 1
+
+        def task() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._counters["queue_wait_seconds"] += started - enqueued_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._counters["hash_seconds"] += time.perf_counter() - started
+
+        try:
+            return self._executor.submit(task).result()
+        finally:
+            with self._lock:
+                self._submitted -= 1
+                self._counters["completed"] += 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot de profundidad de cola, ocupación y latencias medias."""
+        with self._lock:
+            completed = int(self._counters["completed"])
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": self._running,
+                "queue_depth": self._submitted - self._running,
+                "completed": completed,
+                "rejected": int(self._counters["rejected"]),
+                "avg_queue_wait_ms": round(1000 * self._counters["queue_wait_seconds"] / completed, 2)
+                if completed else 0.0,
+                "avg_hash_ms": round(1000 * self._counters["hash_seconds"] / completed, 2) if completed else 0.0,
+            }
+
+    def reset_after_fork(self) -> None:
+        """Descarta los hilos heredados del proceso padre (no sobreviven al fork)."""
+        self._reset_state()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+class PooledPasswordHasher(PasswordHasher):
+    """Decorador que ejecuta hash y verificación de ``inner`` en un ``HashingPool``."""
+
+    def __init__(self, inner: PasswordHasher, pool: HashingPool):
+        self.inner = inner
+        self.pool = pool
+
+    def hash(self, password: str) -> str:
+        return self.pool.run(self.inner.hash, password)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return self.pool.run(self.inner.verify, password, encoded)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return self.inner.needs_rehash(encoded)
+
+
+_hashing_pool: Optional[HashingPool] = None
+_hashing_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> HashingPool:
+    """Pool de hashing del proceso (se crea con la configuración de settings)."""
+    global _hashing_pool
+    if _hashing_pool is None:
+        with _hashing_pool_lock:
+            if _hashing_pool is None:
+                _hashing_pool = HashingPool(
+                    max_workers=getattr(settings, "PASSWORD_HASH_WORKERS", 4),
+                    max_pending=getattr(settings, "PASSWORD_HASH_MAX_PENDING", 32),
+                    acquire_timeout=getattr(settings, "PASSWORD_HASH_TIMEOUT", 5.0),
+                )
+    return _hashing_pool
+
+
+def hashing_pool_stats() -> Optional[Dict[str, Any]]:
+    """Estadísticas del pool, o ``None`` si aún no se creó."""
+    return _hashing_pool.stats() if _hashing_pool is not None else None
+
+
+def shutdown_hashing_pool() -> None:
+    """Detiene los hilos del pool de hashing, si se creó (shutdown)."""
+    if _hashing_pool is not None:
+        _hashing_pool.shutdown()
+
+
+def build_password_hasher() -> PasswordHasher:
+    """Hasher de producción: KDF de Django, en el pool salvo ``PASSWORD_HASH_WORKERS=0``."""
+    hasher = DjangoPasswordHasher()
+    if getattr(settings, "PASSWORD_HASH_WORKERS", 4) <= 0:
+        return hasher
+    return PooledPasswordHasher(hasher, get_hashing_pool())
+
+
+def calibrate_pbkdf2_iterations(target_ms: float, sample_iterations: int = 100_000) -> int:
+    """
+    Iteraciones de PBKDF2-SHA256 que tardan ~``target_ms`` en este hardware.
+
+    El resultado se redondea a miles y nunca baja de ``sample_iterations``.
+    """
+    started = time.perf_counter()
+    hashlib.pbkdf2_hmac("sha256", b"calibration-password", os.urandom(16), sample_iterations)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    iterations = int(sample_iterations * target_ms / max(elapsed_ms, 1e-3))
+    return max(sample_iterations, round(iterations, -3))
+
+
+def _reset_pool_after_fork() -> None:
+    if _hashing_pool is not None:
+        _hashing_pool.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
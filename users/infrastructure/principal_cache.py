@@ -0,0 +1,175 @@
+"""
+Caché por proceso de usuarios autenticados (principals).
+
+Los autenticadores JWT consultan la tabla ``users`` en cada request solo
+para verificar ``is_active``. Esta caché LRU + TTL, indexada por user id,
+evita esa consulta mientras la entrada esté vigente.
+
+Invalidación:
+- Inmediata al publicar ``UserDeactivated`` o ``UserEmailChanged``
+  (``PrincipalCacheInvalidator`` decora el publicador de eventos) y de
+  nuevo tras el commit, para descartar lecturas concurrentes previas.
+- Al eliminar un usuario (``DjangoUserRepository.delete``).
+- En los demás procesos/workers, por expiración del TTL.
+
+Configuración (settings):
+    AUTH_PRINCIPAL_CACHE_SIZE: entradas máximas (0 desactiva la caché).
+    AUTH_PRINCIPAL_CACHE_TTL: segundos de vida de cada entrada.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from ..domain.event_publisher import EventPublisher
+from ..domain.events import DomainEvent, UserDeactivated, UserEmailChanged
+from .metrics import PRINCIPAL_CACHE_LOOKUPS
+
+
+class PrincipalCache:
+    """
+    Caché LRU acotada con expiración por TTL. Thread-safe.
+
+    Args:
+        max_size: Número máximo de entradas (0 desactiva la caché).
+        ttl: Segundos de vida de cada entrada.
+        clock: Fuente de tiempo monotónico (inyectable en tests).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max(0, max_size)
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, user_id: str) -> Optional[Any]:
+        """Devuelve el principal cacheado o ``None`` (miss o expirado)."""
+        if not self.enabled:
+            return None
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                PRINCIPAL_CACHE_LOOKUPS.labels("miss").inc()
+                return None
+            expires_at, principal = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                PRINCIPAL_CACHE_LOOKUPS.labels("miss").inc()
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            PRINCIPAL_CACHE_LOOKUPS.labels("hit").inc()
+            return principal
+
+    def put(self, user_id: str, principal: Any) -> None:
+        """Guarda un principal, desalojando el menos usado si se llena."""
+        if not self.enabled:
+            return
+        key = str(user_id)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, user_id: str) -> None:
+        """Elimina la entrada de un usuario (si existe)."""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Vacía la caché (los contadores se conservan)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot de contadores y ocupación."""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hit_ratio": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+
+_principal_cache: Optional[PrincipalCache] = None
+_principal_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Caché de principals del proceso (se crea con la configuración de settings)."""
+    global _principal_cache
+    if _principal_cache is None:
+        with _principal_cache_lock:
+            if _principal_cache is None:
+                _principal_cache = PrincipalCache(
+                    max_size=getattr(settings, "AUTH_PRINCIPAL_CACHE_SIZE", 1024),
+                    ttl=getattr(settings, "AUTH_PRINCIPAL_CACHE_TTL", 30.0),
+                )
+    return _principal_cache
+
+
+class PrincipalCacheInvalidator(EventPublisher):
+    """
+    Decorador de ``EventPublisher`` que invalida la caché de principals
+    cuando se publica un evento que cambia el estado de autenticación.
+    """
+
+    INVALIDATING_EVENTS = (UserDeactivated, UserEmailChanged)
+
+    def __init__(self, inner: EventPublisher, cache: Optional[PrincipalCache] = None):
+        self.inner = inner
+        self._cache = cache
+
+    @property
+    def cache(self) -> PrincipalCache:
+        return self._cache or get_principal_cache()
+
+    def publish(self, event: DomainEvent, routing_key: str = '') -> None:
+        self._invalidate(event)
+        self.inner.publish(event, routing_key)
+
+    def publish_many(self, events: Iterable[DomainEvent], routing_key: str = '') -> None:
+        events = list(events)
+        for event in events:
+            self._invalidate(event)
+        self.inner.publish_many(events, routing_key)
+
+    def _invalidate(self, event: DomainEvent) -> None:
+        if isinstance(event, self.INVALIDATING_EVENTS):
+            cache = self.cache
+            user_id = str(event.user_id)
+            cache.invalidate(user_id)
+            transaction.on_commit(lambda: cache.invalidate(user_id))
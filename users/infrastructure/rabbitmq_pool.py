@@ -0,0 +1,309 @@
+"""
+Pool de conexiones RabbitMQ - Reutiliza conexiones y canales entre requests.
+
+Abrir un ``pika.BlockingConnection`` por evento implica un handshake TCP +
+AMQP completo en cada publicación. Este módulo mantiene, por proceso, un
+pool acotado de pares (conexión, canal) que se reutilizan entre requests.
+
+Características:
+- Un pool por proceso y por host (``get_channel_pool``).
+- Seguro frente a ``fork`` (gunicorn): el proceso hijo descarta las
+  conexiones heredadas del padre sin cerrarlas (los sockets son del padre).
+- Los canales rotos se descartan y se recrean en el siguiente checkout.
+- Estadísticas del pool vía ``stats()``.
+
+⚠️ ``BlockingConnection`` NO es thread-safe: cada par se usa por un único
+thread a la vez mientras está prestado (checkout), nunca en paralelo.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional, Set
+
+import pika
+from pika.exceptions import AMQPError
+
+logger = logging.getLogger(__name__)
+
+# Errores tras los cuales una conexión/canal no debe volver al pool
+RECONNECTABLE_ERRORS = (AMQPError, OSError)
+
+
+class RabbitMQPoolExhausted(RuntimeError):
+    """Se lanza cuando no hay canales libres dentro del timeout de checkout."""
+
+
+@dataclass
+class PooledChannel:
+    """Par (conexión, canal) prestado por el pool."""
+    connection: pika.BlockingConnection
+    channel: "pika.adapters.blocking_connection.BlockingChannel"
+    declared_exchanges: Set[str] = field(default_factory=set)
+
+    def is_open(self) -> bool:
+        """True si tanto la conexión como el canal siguen abiertos."""
+        return bool(self.connection.is_open and self.channel.is_open)
+
+
+class RabbitMQChannelPool:
+    """
+    Pool acotado de canales RabbitMQ reutilizables.
+
+    Args:
+        connection_factory: Callable que abre una nueva ``BlockingConnection``.
+        max_size: Número máximo de conexiones abiertas por proceso.
+        acquire_timeout: Segundos a esperar por un canal libre cuando el pool
+            está lleno antes de lanzar ``RabbitMQPoolExhausted``.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], pika.BlockingConnection],
+        max_size: int = 2,
+        acquire_timeout: float = 5.0,
+    ):
+        self._connection_factory = connection_factory
+        self.max_size = max(1, max_size)
+        self.acquire_timeout = acquire_timeout
+        self._lock = threading.Lock()
+        self._reset_state()
+        _live_pools.add(self)
+
+    def _reset_state(self) -> None:
+        """Inicializa (o reinicia tras un fork) el estado interno del pool."""
+        self._pid = os.getpid()
+        self._idle: "queue.LifoQueue[PooledChannel]" = queue.LifoQueue()
+        self._size = 0
+        self._in_use = 0
+        self._counters: Dict[str, int] = {
+            "connections_created": 0,
+            "checkouts": 0,
+            "reuses": 0,
+            "discarded": 0,
+            "exhausted": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def channel(self) -> Iterator[PooledChannel]:
+        """
+        Presta un canal del pool durante el bloque ``with``.
+
+        Si el bloque lanza un error de conexión/AMQP el par se descarta
+        (no vuelve al pool) y el error se propaga al llamador.
+        """
+        pooled = self._checkout()
+        try:
+            yield pooled
+        except RECONNECTABLE_ERRORS:
+            self._discard(pooled)
+            raise
+        except BaseException:
+            self._checkin(pooled)
+            raise
+        else:
+            self._checkin(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot de las estadísticas del pool (para health/métricas)."""
+        with self._lock:
+            return {
+                **self._counters,
+                "size": self._size,
+                "idle": self._idle.qsize(),
+                "in_use": self._in_use,
+                "max_size": self.max_size,
+            }
+
+    def close(self) -> None:
+        """Cierra todas las conexiones inactivas (shutdown ordenado)."""
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close_quietly(pooled)
+            with self._lock:
+                self._size -= 1
+
+    def reset_after_fork(self) -> None:
+        """
+        Olvida las conexiones heredadas del proceso padre.
+
+        No se cierran: el socket pertenece al padre y cerrarlo desde el hijo
+        enviaría un ``connection.close`` sobre la conexión del padre.
+        """
+        self._lock = threading.Lock()
+        self._reset_state()
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _checkout(self) -> PooledChannel:
+        if self._pid != os.getpid():
+            self.reset_after_fork()
+
+        while True:
+            pooled = self._take_idle()
+            if pooled is None:
+                break
+            if self._is_healthy(pooled):
+                with self._lock:
+                    self._in_use += 1
+                    self._counters["checkouts"] += 1
+                    self._counters["reuses"] += 1
+                return pooled
+            self._discard(pooled, in_use=False)
+
+        with self._lock:
+            can_create = self._size < self.max_size
+            if can_create:
+                self._size += 1
+
+        if can_create:
+            try:
+                pooled = self._open()
+            except BaseException:
+                with self._lock:
+                    self._size -= 1
+                raise
+            with self._lock:
+                self._in_use += 1
+                self._counters["checkouts"] += 1
+                self._counters["connections_created"] += 1
+            return pooled
+
+        # Pool lleno: esperar a que otro thread devuelva un canal
+        try:
+            pooled = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            with self._lock:
+                self._counters["exhausted"] += 1
+            raise RabbitMQPoolExhausted(
+                f"No hay canales RabbitMQ libres tras {self.acquire_timeout}s "
+                f"(max_size={self.max_size})"
+            )
+        if not self._is_healthy(pooled):
+            self._discard(pooled, in_use=False)
+            return self._checkout()
+        with self._lock:
+            self._in_use += 1
+            self._counters["checkouts"] += 1
+            self._counters["reuses"] += 1
+        return pooled
+
+    def _take_idle(self) -> Optional[PooledChannel]:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _checkin(self, pooled: PooledChannel) -> None:
+        with self._lock:
+            self._in_use -= 1
+        if pooled.is_open():
+            self._idle.put(pooled)
+        else:
+            self._discard(pooled, in_use=False)
+
+    def _discard(self, pooled: PooledChannel, in_use: bool = True) -> None:
+        self._close_quietly(pooled)
+        with self._lock:
+            self._size -= 1
+            if in_use:
+                self._in_use -= 1
+            self._counters["discarded"] += 1
+
+    def _open(self) -> PooledChannel:
+        connection = self._connection_factory()
+        return PooledChannel(connection=connection, channel=connection.channel())
+
+    @staticmethod
+    def _is_healthy(pooled: PooledChannel) -> bool:
+        """
+        Verifica el par y atiende heartbeats pendientes.
+
+        ``BlockingConnection`` solo procesa heartbeats cuando se le da tiempo
+        de I/O; una conexión ociosa puede haber sido cerrada por el broker.
+        """
+        if not pooled.is_open():
+            return False
+        try:
+            pooled.connection.process_data_events(time_limit=0)
+        except RECONNECTABLE_ERRORS:
+            return False
+        return pooled.is_open()
+
+    @staticmethod
+    def _close_quietly(pooled: PooledChannel) -> None:
+        try:
+            if pooled.connection.is_open:
+                pooled.connection.close()
+        except RECONNECTABLE_ERRORS:
+            logger.debug("Error cerrando conexión RabbitMQ descartada", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Pools por proceso
+# ---------------------------------------------------------------------------
+
+_live_pools: "weakref.WeakSet[RabbitMQChannelPool]" = weakref.WeakSet()
+_pools: Dict[str, RabbitMQChannelPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_channel_pool(host: str) -> RabbitMQChannelPool:
+    """
+    Devuelve el pool del proceso para ``host`` (creándolo si no existe).
+
+    Tamaño y timeout se leen de ``RABBITMQ_POOL_SIZE`` y
+    ``RABBITMQ_POOL_TIMEOUT`` (variables de entorno).
+    """
+    pool = _pools.get(host)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(host)
+        if pool is None:
+            pool = RabbitMQChannelPool(
+                connection_factory=lambda: pika.BlockingConnection(
+                    pika.ConnectionParameters(host=host)
+                ),
+                max_size=int(os.environ.get('RABBITMQ_POOL_SIZE', '2')),
+                acquire_timeout=float(os.environ.get('RABBITMQ_POOL_TIMEOUT', '5')),
+            )
+            _pools[host] = pool
+        return pool
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """Estadísticas de todos los pools del proceso, indexadas por host."""
+    return {host: pool.stats() for host, pool in list(_pools.items())}
+
+
+def close_all_pools() -> None:
+    """Cierra las conexiones inactivas de todos los pools (shutdown)."""
+    for pool in list(_pools.values()):
+        pool.close()
+
+
+def _reset_pools_after_fork() -> None:
+    global _pools_lock
+    _pools_lock = threading.Lock()
+    for pool in list(_live_pools):
+        pool.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
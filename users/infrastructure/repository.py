@@ -3,11 +3,91 @@ Django Repository - Implementación del repositorio usando Django ORM.
 Adaptador que traduce entre el dominio y la persistencia.
 """
 
-from typing import Optional, List
+import csv
+import heapq
+import io
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional, List, Sequence, Set, Tuple
+from uuid import UUID
 
+from django.db import IntegrityError, connection, transaction
+from django.conf import settings
+from django.db.models import Count, F, Max, Q, QuerySet
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from ..domain.changes import ChangeFeed, UserChange
 from ..domain.entities import User as DomainUser, UserRole
+from ..domain.exceptions import ConcurrentModification, UserAlreadyExists, UserNotFound
+from ..domain.pagination import Page, PageKey, PageRequest
+from ..domain.read_models import UserSummary
 from ..domain.repositories import UserRepository
-from ..models import User as DjangoUser
+from ..models import User as DjangoUser, UserTombstone
+from .identity_map import current_identity_map
+from .principal_cache import get_principal_cache
+from .token_revocation import revoke_tokens_on_commit
+
+# Columnas de ``UserSummary``: las rutas de solo lectura no cargan
+# ``password_hash``, ``token_version`` ni ``version``
+SUMMARY_COLUMNS = ('id', 'email', 'username', 'role', 'is_active', 'created_at')
+
+# Restricciones únicas de ``users`` -> campo del dominio. Se buscan en el
+# nombre de la restricción (PostgreSQL) o en el mensaje del error (SQLite:
+# "UNIQUE constraint failed: users.username" / "index 'users_email_lower_uniq'")
+_UNIQUE_FIELDS = (
+    ('users_email_lower_uniq', 'email'),
+    ('users_username_uniq', 'username'),
+    ('users.email', 'email'),
+    ('users.username', 'username'),
+)
+
+
+def optimistic_locking_enabled() -> bool:
+    """``USERS_OPTIMISTIC_LOCKING``: las actualizaciones verifican la versión de la fila."""
+    return getattr(settings, 'USERS_OPTIMISTIC_LOCKING', True)
+
+
+def conflicting_field(error: IntegrityError) -> Optional[str]:
+    """Campo (``email`` / ``username``) cuya restricción única violó ``error``, o None."""
+    diag = getattr(error.__cause__, 'diag', None)
+    text = getattr(diag, 'constraint_name', None) or str(error)
+    for marker, field_name in _UNIQUE_FIELDS:
+        if marker in text:
+            return field_name
+    return None
+
+
+@contextmanager
+def unique_violations_as_conflicts(user: DomainUser) -> Iterator[None]:
+    """
+    Convierte la violación de una restricción única en ``UserAlreadyExists``.
+
+    Dentro de una transacción la escritura va en un savepoint, para que la
+    transacción siga utilizable si quien llama captura la excepción. En
+    autocommit no hace falta: la sentencia fallida no deja nada abierto.
+    """
+    try:
+        with transaction.atomic() if connection.in_atomic_block else nullcontext():
+            yield
+    except IntegrityError as error:
+        field_name = conflicting_field(error)
+        if field_name is None:
+            raise
+        raise UserAlreadyExists(getattr(user, field_name), field_name) from error
+
+
+def changes_settle_seconds() -> float:
+    """
+    ``USERS_CHANGES_SETTLE_SECONDS``: antigüedad mínima de un cambio para
+    entrar en el feed.
+
+    ``updated_at`` se asigna antes del COMMIT: una transacción lenta puede
+    hacer visible un cambio con una fecha anterior a otros ya entregados.
+    Esperar a que los cambios "se asienten" evita que el cursor los salte.
+    """
+    return getattr(settings, 'USERS_CHANGES_SETTLE_SECONDS', 5)
 
 
 class DjangoUserRepository(UserRepository):
@@ -25,29 +105,95 @@ class DjangoUserRepository(UserRepository):
 
         Returns:
             La entidad con el ID asignado
+
+        Raises:
+            UserAlreadyExists: Si el email o el username ya pertenecen a otro
+                usuario (restricción única; también ante escrituras concurrentes)
         """
         if user.id:
-            # Actualizar usuario existente
-            django_user = DjangoUser.objects.get(pk=user.id)
-            django_user.email = user.email
-            django_user.username = user.username
-            django_user.password_hash = user.password_hash
-            django_user.is_active = user.is_active
-            django_user.role = user.role.value  # Convertir enum a string
-            django_user.save(update_fields=['email', 'username', 'password_hash', 'is_active', 'role'])
+            # Actualizar usuario existente: un UPDATE con los campos modificados
+            self._update(user)
         else:
-            # Crear nuevo usuario
-            django_user = DjangoUser.objects.create(
-                email=user.email,
-                username=user.username,
-                password_hash=user.password_hash,
-                is_active=user.is_active,
-                role=user.role.value  # Convertir enum a string
-            )
+            # Crear nuevo usuario: un solo INSERT, sin consultar antes
+            with unique_violations_as_conflicts(user):
+                django_user = DjangoUser.objects.create(
+                    email=user.email,
+                    username=user.username,
+                    password_hash=user.password_hash,
+                    is_active=user.is_active,
+                    role=user.role.value  # Convertir enum a string
+                )
             user.id = str(django_user.id)
+            user.version = django_user.version
+            user.mark_clean()
+            self._register(django_user)
 
         return user
 
+    def _update(self, user: DomainUser) -> None:
+        """
+        ``UPDATE users SET <campos modificados>, version = version + 1 WHERE id = ...``
+
+        Con seguimiento de cambios (entidad cargada por el repositorio) es una
+        sola sentencia y, con ``USERS_OPTIMISTIC_LOCKING``, exige que la
+        versión de la fila no haya cambiado desde la lectura. Una entidad sin
+        seguimiento se compara antes con la fila para detectar la revocación
+        de tokens y escribe todos los campos.
+
+        Raises:
+            UserNotFound: Si el usuario no existe
+            ConcurrentModification: Si otra operación modificó la fila
+            UserAlreadyExists: Si el nuevo email / username ya está en uso
+        """
+        dirty = user.dirty_fields()
+        if user.is_tracking_changes():
+            if not dirty:
+                return
+            tokens_revoked = 'token_version' in dirty
+            expected_version = user.version if optimistic_locking_enabled() else None
+            new_version = user.version + 1
+        else:
+            try:
+                current = self._load(user.id)
+            except DjangoUser.DoesNotExist:
+                raise UserNotFound(user.id)
+            tokens_revoked = current.token_version != user.token_version
+            expected_version = None
+            new_version = current.version + 1
+
+        values = {name: self._column_value(user, name) for name in dirty}
+        values['updated_at'] = timezone.now()
+        queryset = DjangoUser.objects.filter(pk=user.id)
+        if expected_version is not None:
+            queryset = queryset.filter(version=expected_version)
+        guard = unique_violations_as_conflicts(user) if dirty & {'email', 'username'} else nullcontext()
+        with guard:
+            updated = queryset.update(version=F('version') + 1, **values)
+        if not updated:
+            if expected_version is not None and DjangoUser.objects.filter(pk=user.id).exists():
+                raise ConcurrentModification(user.id)
+            raise UserNotFound(user.id)
+
+        user.version = new_version
+        user.mark_clean()
+        self._sync_identity_map(user.id, {**values, 'version': new_version})
+        if tokens_revoked:
+            revoke_tokens_on_commit(str(user.id), user.token_version)
+
+    @staticmethod
+    def _column_value(user: DomainUser, name: str) -> Any:
+        value = getattr(user, name)
+        return value.value if isinstance(value, UserRole) else value
+
+    @staticmethod
+    def _sync_identity_map(user_id: str, values: dict) -> None:
+        """Refleja en la fila del identity map (si está cargada) lo que se escribió."""
+        identity_map = current_identity_map()
+        row = identity_map.peek(user_id) if identity_map is not None else None
+        if row is not None:
+            for name, value in values.items():
+                setattr(row, name, value)
+
     def find_by_id(self, user_id: str) -> Optional[DomainUser]:
         """
         Busca un usuario por ID y lo convierte a entidad de dominio.
@@ -59,11 +205,24 @@ class DjangoUserRepository(UserRepository):
             Entidad de dominio o None si no existe
         """
         try:
-            django_user = DjangoUser.objects.get(pk=user_id)
+            django_user = self._load(user_id)
             return self._to_domain(django_user)
         except DjangoUser.DoesNotExist:
             return None
 
+    def find_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """
+        Vista de solo lectura de un usuario por ID.
+
+        Usa la fila o la vista del identity map si el request ya la cargó
+        (p.ej. al calcular el ETag); si no, consulta solo ``SUMMARY_COLUMNS``.
+        """
+        summary = self._summary_in_identity_map(user_id)
+        if summary is not None:
+            return summary
+        values = DjangoUser.objects.filter(pk=user_id).values(*SUMMARY_COLUMNS).first()
+        return self._to_summary(values) if values else None
+
     def find_by_email(self, email: str) -> Optional[DomainUser]:
         """
         Busca un usuario por email.
@@ -75,20 +234,107 @@ class DjangoUserRepository(UserRepository):
             Entidad de dominio o None si no existe
         """
         try:
-            django_user = DjangoUser.objects.get(email=email.lower())
+            django_user = self._register(self._email_queryset([email]).get())
             return self._to_domain(django_user)
         except DjangoUser.DoesNotExist:
             return None
 
-    def find_all(self) -> List[DomainUser]:
+    def find_by_ids(self, user_ids: Iterable[str]) -> List[UserSummary]:
+        """
+        Busca varios usuarios por ID con un solo ``WHERE id IN (...)``.
+
+        Las filas ya cargadas en el identity map del request no se vuelven
+        a pedir. Los IDs que no son UUID válidos se omiten.
+
+        Args:
+            user_ids: IDs a buscar
+
+        Returns:
+            Vistas de solo lectura, en el orden de ``user_ids``
+        """
+        keys = self._uuid_keys(user_ids)
+        found, pending = self._summaries_in_identity_map(keys)
+        if pending:
+            found.update(self._summaries_by(
+                DjangoUser.objects.filter(pk__in=pending).order_by().values(*SUMMARY_COLUMNS), 'id'
+            ))
+        return [found[key] for key in keys if key in found]
+
+    def find_by_emails(self, emails: Iterable[str]) -> List[UserSummary]:
+        """
+        Busca varios usuarios por email con un solo ``WHERE email IN (...)``.
+
+        Args:
+            emails: Emails a buscar (se normalizan a minúsculas)
+
+        Returns:
+            Vistas de solo lectura, en el orden de ``emails``
+        """
+        keys = self._email_keys(emails)
+        if not keys:
+            return []
+        found = self._summaries_by(self._email_queryset(keys).values(*SUMMARY_COLUMNS), 'email')
+        return [found[key] for key in keys if key in found]
+
+    @staticmethod
+    def _uuid_keys(user_ids: Iterable[str]) -> List[str]:
+        """IDs en forma canónica, sin repetidos ni valores que no sean UUID."""
+        keys: dict[str, None] = {}
+        for user_id in user_ids:
+            try:
+                keys.setdefault(str(UUID(str(user_id))), None)
+            except ValueError:
+                continue
+        return list(keys)
+
+    @staticmethod
+    def _email_keys(emails: Iterable[str]) -> List[str]:
+        return list(dict.fromkeys(email.lower() for email in emails))
+
+    @classmethod
+    def _email_queryset(cls, emails: Iterable[str]) -> QuerySet:
+        """
+        ``WHERE LOWER(email) IN (...)``: usa el índice único ``users_email_lower_uniq``.
+
+        Sin ``ORDER BY`` (el ``Meta.ordering`` del modelo forzaría un sort).
+        """
+        keys = cls._email_keys(emails)
+        queryset = DjangoUser.objects.alias(email_lower=Lower('email')).order_by()
+        if len(keys) == 1:
+            return queryset.filter(email_lower=keys[0])
+        return queryset.filter(email_lower__in=keys)
+
+    @classmethod
+    def _summary_in_identity_map(cls, key: str) -> Optional[UserSummary]:
+        """Vista del usuario a partir de su fila o su vista ya cargadas en el request."""
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return None
+        row = identity_map.get(key)
+        if row is not None:
+            return cls._summary_of(row)
+        return identity_map.get_summary(key)
+
+    @classmethod
+    def _summaries_in_identity_map(cls, keys: List[str]) -> Tuple[dict, List[str]]:
+        """Vistas de las filas de ``keys`` ya cargadas en el request y las claves que faltan consultar."""
+        found = {key: summary for key in keys if (summary := cls._summary_in_identity_map(key)) is not None}
+        return found, [key for key in keys if key not in found]
+
+    @classmethod
+    def _summaries_by(cls, rows: Iterable[Mapping[str, Any]], field_name: str) -> dict:
+        """Vistas de ``rows`` (de ``values()``) indexadas por ``field_name`` en minúsculas."""
+        return {str(row[field_name]).lower(): cls._to_summary(row) for row in rows}
+
+    def find_all(self) -> List[UserSummary]:
         """
         Obtiene todos los usuarios ordenados por fecha de creación.
 
         Returns:
-            Lista de entidades de dominio
+            Lista de vistas de solo lectura
         """
-        django_users = DjangoUser.objects.all().order_by('-created_at')
-        return [self._to_domain(du) for du in django_users]
+        rows = DjangoUser.objects.order_by('-created_at').values(*SUMMARY_COLUMNS)
+        return [self._to_summary(row) for row in rows]
 
     def exists_by_email(self, email: str) -> bool:
         """
@@ -100,18 +346,29 @@ class DjangoUserRepository(UserRepository):
         Returns:
             True si existe
         """
-        return DjangoUser.objects.filter(email=email.lower()).exists()
+        return self._email_queryset([email]).exists()
 
     def delete(self, user_id: str) -> None:
         """
         Elimina un usuario por ID.
 
+        Si la fila existía deja una marca de baja (``UserTombstone``) para
+        el feed de cambios, en la misma transacción.
+
         Args:
             user_id: ID del usuario a eliminar
         """
-        DjangoUser.objects.filter(pk=user_id).delete()
+        with transaction.atomic():
+            deleted, _ = DjangoUser.objects.filter(pk=user_id).delete()
+            if deleted:
+                UserTombstone.objects.create(user_id=user_id, deleted_at=timezone.now())
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            identity_map.discard(user_id)
+        get_principal_cache().invalidate(str(user_id))
+        revoke_tokens_on_commit(str(user_id), None)
 
-    def find_by_role(self, role: UserRole) -> List[DomainUser]:
+    def find_by_role(self, role: UserRole) -> List[UserSummary]:
         """
         Busca usuarios por rol.
 
@@ -119,10 +376,183 @@ class DjangoUserRepository(UserRepository):
             role: Rol a filtrar (UserRole enum)
 
         Returns:
-            Lista de entidades de dominio con ese rol
+            Lista de vistas de solo lectura con ese rol
+        """
+        rows = DjangoUser.objects.filter(role=role.value).order_by('username').values(*SUMMARY_COLUMNS)
+        return [self._to_summary(row) for row in rows]
+
+    def find_page(self, page: PageRequest, is_active: Optional[bool] = None) -> Page[UserSummary]:
+        """
+        Obtiene una página de usuarios ordenados por ``(created_at, id)`` desc.
+
+        Una sola consulta por página (``LIMIT size + 1``), sin OFFSET, sobre
+        el índice ``(created_at, id)`` (o el parcial de activos).
+
+        Args:
+            page: Tamaño y clave de posición de la página
+            is_active: Filtrar por usuarios activos / inactivos (None = todos)
+
+        Returns:
+            Página de vistas de solo lectura
+        """
+        return self._keyset_page(
+            self._listing_queryset(is_active), ('created_at', 'id'), descending=True, page=page
+        )
+
+    @staticmethod
+    def _listing_queryset(is_active: Optional[bool]) -> QuerySet:
+        queryset = DjangoUser.objects.all()
+        return queryset if is_active is None else queryset.filter(is_active=is_active)
+
+    def find_page_by_role(self, role: UserRole, page: PageRequest) -> Page[UserSummary]:
         """
-        django_users = DjangoUser.objects.filter(role=role.value).order_by('username')
-        return [self._to_domain(du) for du in django_users]
+        Obtiene una página de usuarios de un rol ordenados por ``(username, id)``.
+
+        Args:
+            role: Rol a filtrar (UserRole enum)
+            page: Tamaño y clave de posición de la página
+
+        Returns:
+            Página de vistas de solo lectura
+        """
+        return self._keyset_page(
+            DjangoUser.objects.filter(role=role.value), ('username', 'id'), descending=False, page=page
+        )
+
+    def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Emails (de los dados) que ya existen, en una sola consulta."""
+        return set(
+            self._email_queryset(emails).values_list('email', flat=True)
+        )
+
+    def find_existing_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        """Usernames (de los dados) que ya existen, en una sola consulta."""
+        return set(
+            DjangoUser.objects.filter(username__in=list(usernames)).values_list('username', flat=True)
+        )
+
+    def find_updated_at(self, user_id: str) -> Optional[datetime]:
+        """
+        ``updated_at`` del usuario: de la fila del identity map si ya se
+        cargó. Si no, dentro de un request la misma consulta trae también
+        ``SUMMARY_COLUMNS`` y registra la vista, que el detalle reutiliza
+        (ETag + GET en una consulta); fuera de un request solo lee
+        ``updated_at``.
+        """
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return DjangoUser.objects.filter(pk=user_id).values_list('updated_at', flat=True).first()
+        row = identity_map.get(user_id)
+        if row is not None:
+            return row.updated_at
+        values = DjangoUser.objects.filter(pk=user_id).values(*SUMMARY_COLUMNS, 'updated_at').first()
+        return self._remember_summary(identity_map, user_id, values)
+
+    @classmethod
+    def _remember_summary(cls, identity_map, user_id: str, values: Optional[Mapping[str, Any]]) -> Optional[datetime]:
+        """Registra la vista de ``values`` (si existe la fila) y devuelve su ``updated_at``."""
+        if values is None:
+            return None
+        identity_map.register_summary(user_id, cls._to_summary(values))
+        return values['updated_at']
+
+    def collection_state(self, role: Optional[UserRole] = None) -> Tuple[int, Optional[datetime]]:
+        """Una sola consulta de agregación: ``COUNT(*)`` y ``MAX(updated_at)``."""
+        state = self._collection_queryset(role).aggregate(count=Count('id'), last_updated=Max('updated_at'))
+        return state['count'], state['last_updated']
+
+    @staticmethod
+    def _collection_queryset(role: Optional[UserRole]) -> QuerySet:
+        queryset = DjangoUser.objects.all()
+        return queryset if role is None else queryset.filter(role=role.value)
+
+    def find_changes(self, since: Optional[PageKey], limit: int) -> ChangeFeed:
+        """
+        Cambios posteriores a ``since`` en orden ``(changed_at, user_id)``.
+
+        Dos consultas keyset (``LIMIT limit + 1``) sobre los índices
+        ``(updated_at, id)`` de ``users`` y ``(deleted_at, user_id)`` de
+        ``users_tombstones``, mezcladas en memoria. Solo entran los cambios
+        con más de ``USERS_CHANGES_SETTLE_SECONDS`` de antigüedad.
+        """
+        page = PageRequest(size=limit, after=since)
+        settled = timezone.now() - timedelta(seconds=changes_settle_seconds())
+
+        users = self._keyset_queryset(
+            DjangoUser.objects.filter(updated_at__lte=settled).values(*SUMMARY_COLUMNS, 'updated_at'),
+            ('updated_at', 'id'), False, page,
+        )
+        tombstones = self._keyset_queryset(
+            UserTombstone.objects.filter(deleted_at__lte=settled), ('deleted_at', 'user_id'), False, page
+        )
+        merged = heapq.merge(
+            (UserChange(str(row['id']), row['updated_at'], self._to_summary(row)) for row in users),
+            (UserChange(str(row.user_id), row.deleted_at) for row in tombstones),
+            key=lambda change: (change.changed_at, change.user_id),
+        )
+        changes = list(islice(merged, limit + 1))
+
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        cursor = since
+        if changes:
+            last = changes[-1]
+            cursor = (self._key_value(last.changed_at), last.user_id)
+        return ChangeFeed(changes=changes, cursor=cursor, has_more=has_more)
+
+    def bulk_insert(self, users: List[DomainUser]) -> List[DomainUser]:
+        """
+        Inserta un lote de usuarios en una sola sentencia.
+
+        En PostgreSQL usa ``COPY ... FROM STDIN``; en otros motores
+        ``bulk_create``. Si el lote choca con filas insertadas en paralelo
+        (IntegrityError), se reintenta ignorando los conflictos y se
+        devuelven solo los usuarios que quedaron persistidos.
+
+        Args:
+            users: Entidades de dominio sin ID
+
+        Returns:
+            Usuarios insertados, con su ID asignado
+        """
+        if not users:
+            return []
+
+        now = timezone.now()
+        rows = [
+            DjangoUser(
+                email=user.email,
+                username=user.username,
+                password_hash=user.password_hash,
+                is_active=user.is_active,
+                role=user.role.value,
+                token_version=user.token_version,
+                version=0,
+                created_at=now,
+                updated_at=now,
+            )
+            for user in users
+        ]
+
+        try:
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    self._copy_insert(rows)
+                else:
+                    DjangoUser.objects.bulk_create(rows)
+            inserted_ids = {row.pk for row in rows}
+        except IntegrityError:
+            DjangoUser.objects.bulk_create(rows, ignore_conflicts=True)
+            inserted_ids = set(
+                DjangoUser.objects.filter(pk__in=[row.pk for row in rows]).values_list('pk', flat=True)
+            )
+
+        inserted = []
+        for user, row in zip(users, rows):
+            if row.pk in inserted_ids:
+                user.id = str(row.pk)
+                inserted.append(user)
+        return inserted
 
     def to_django_model(self, domain_user: DomainUser) -> DjangoUser:
         """
@@ -138,7 +568,7 @@ class DjangoUserRepository(UserRepository):
         if domain_user.id:
             # Si tiene ID, buscar el modelo existente para mantener metadata de Django
             try:
-                django_user = DjangoUser.objects.get(pk=domain_user.id)
+                django_user = self._load(domain_user.id)
                 # Actualizar valores desde la entidad de dominio
                 django_user.email = domain_user.email
                 django_user.username = domain_user.username
@@ -156,26 +586,187 @@ class DjangoUserRepository(UserRepository):
             password_hash=domain_user.password_hash,
             is_active=domain_user.is_active,
             role=domain_user.role.value,  # Convertir enum a string
-            created_at=getattr(domain_user, 'created_at', None)
+            created_at=getattr(domain_user, 'created_at', None),
+            token_version=domain_user.token_version,
         )
 
+    # Todas las columnas concretas: las migraciones no dejan DEFAULT en la
+    # base de datos, así que COPY debe escribir también ``version``
+    _COPY_COLUMNS = (
+        'id', 'email', 'username', 'password_hash', 'is_active',
+        'role', 'token_version', 'version', 'created_at', 'updated_at',
+    )
+
+    def _copy_insert(self, rows: List[DjangoUser]) -> None:
+        """Inserta ``rows`` con ``COPY ... FROM STDIN (FORMAT csv)`` (PostgreSQL)."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([getattr(row, column) for column in self._COPY_COLUMNS])
+
+        sql = (
+            f"COPY {DjangoUser._meta.db_table} ({', '.join(self._COPY_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy_expert'):
+                # psycopg2
+                buffer.seek(0)
+                cursor.cursor.copy_expert(sql, buffer)
+            else:
+                # psycopg 3
+                with cursor.cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def _keyset_page(
+        self,
+        queryset: QuerySet,
+        fields: Sequence[str],
+        descending: bool,
+        page: PageRequest,
+    ) -> Page[UserSummary]:
+        """
+        Pagina ``queryset`` por keyset sobre ``fields``.
+
+        Para retroceder (``page.before``) se consulta en orden inverso y se
+        invierte el resultado, de modo que la página siempre se devuelve en
+        el orden natural. Se leen solo ``SUMMARY_COLUMNS``.
+        """
+        rows = list(self._keyset_queryset(queryset.values(*SUMMARY_COLUMNS), fields, descending, page))
+        return self._build_page(rows, fields, page)
+
+    def _keyset_queryset(
+        self,
+        queryset: QuerySet,
+        fields: Sequence[str],
+        descending: bool,
+        page: PageRequest,
+    ) -> QuerySet:
+        """Consulta de una página: filtro por clave, orden y ``LIMIT size + 1``."""
+        backwards = page.before is not None
+        key = page.before if backwards else page.after
+        query_descending = descending != backwards
+
+        if key is not None:
+            queryset = queryset.filter(self._keyset_filter(fields, key, query_descending))
+
+        ordering = [f'-{f}' if query_descending else f for f in fields]
+        return queryset.order_by(*ordering)[:page.size + 1]
+
+    def _build_page(
+        self,
+        rows: List[Mapping[str, Any]],
+        fields: Sequence[str],
+        page: PageRequest,
+    ) -> Page[UserSummary]:
+        """Arma la ``Page`` a partir de las filas (``values()``) de ``_keyset_queryset``."""
+        backwards = page.before is not None
+        has_more = len(rows) > page.size
+        rows = rows[:page.size]
+        if backwards:
+            rows.reverse()
+
+        def key_of(row: Mapping[str, Any]) -> PageKey:
+            return tuple(self._key_value(row[f]) for f in fields)
+
+        if not rows:
+            return Page(items=[], next_key=page.before, prev_key=None)
+
+        if backwards:
+            next_key: Optional[PageKey] = key_of(rows[-1])
+            prev_key = key_of(rows[0]) if has_more else None
+        else:
+            next_key = key_of(rows[-1]) if has_more else None
+            prev_key = key_of(rows[0]) if page.after is not None else None
+
+        return Page(
+            items=[self._to_summary(row) for row in rows],
+            next_key=next_key,
+            prev_key=prev_key,
+        )
+
+    @staticmethod
+    def _keyset_filter(fields: Sequence[str], key: PageKey, descending: bool) -> Q:
+        """
+        Condición "estrictamente después de ``key``" en el orden dado:
+        ``(a, b) > (ka, kb)`` ≡ ``a > ka OR (a = ka AND b > kb)``.
+        """
+        op = 'lt' if descending else 'gt'
+        condition = Q()
+        equal_prefix: dict[str, Any] = {}
+        # strict: una clave corta perdería el desempate por id
+        for field_name, value in zip(fields, key, strict=True):
+            condition |= Q(**equal_prefix, **{f'{field_name}__{op}': value})
+            equal_prefix[field_name] = value
+        return condition
+
+    @staticmethod
+    def _key_value(value: Any) -> Any:
+        """Convierte un valor de la clave a un primitivo serializable."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+    @staticmethod
+    def _load(user_id: str) -> DjangoUser:
+        """
+        Fila del usuario por ID, reutilizando la del identity map del request.
+
+        Raises:
+            DjangoUser.DoesNotExist: Si el usuario no existe
+        """
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return DjangoUser.objects.get(pk=user_id)
+        return identity_map.get_or_load(user_id, lambda: DjangoUser.objects.get(pk=user_id))
+
+    @staticmethod
+    def _register(django_user: DjangoUser) -> DjangoUser:
+        """Registra una fila cargada por otra vía en el identity map (si hay uno activo)."""
+        identity_map = current_identity_map()
+        return identity_map.register(django_user) if identity_map is not None else django_user
+
     @staticmethod
     def _to_domain(django_user: DjangoUser) -> DomainUser:
         """
         Convierte un modelo Django a entidad de dominio.
 
+        La fila ya fue validada al guardarse: se hidrata con
+        ``User.from_persisted``, sin repetir la validación del dominio.
+
         Args:
             django_user: Modelo Django
 
         Returns:
-            Entidad de dominio
+            Entidad de dominio (limpia, con seguimiento de cambios)
         """
-        return DomainUser(
+        return DomainUser.from_persisted(
             id=str(django_user.id),
             email=django_user.email,
             username=django_user.username,
             password_hash=django_user.password_hash,
             is_active=django_user.is_active,
             role=UserRole(django_user.role),  # Convertir string a enum
-            created_at=django_user.created_at
+            created_at=django_user.created_at,
+            token_version=django_user.token_version,
+            version=django_user.version,
         )
+
+    @staticmethod
+    def _to_summary(row: Mapping[str, Any]) -> UserSummary:
+        """Convierte una fila de ``values(*SUMMARY_COLUMNS)`` a vista de solo lectura."""
+        return UserSummary(
+            id=str(row['id']),
+            email=row['email'],
+            username=row['username'],
+            role=UserRole(row['role']),
+            is_active=row['is_active'],
+            created_at=row['created_at'],
+        )
+
+    @classmethod
+    def _summary_of(cls, django_user: DjangoUser) -> UserSummary:
+        """Vista de solo lectura de una fila completa (p.ej. del identity map)."""
+        return cls._to_summary({column: getattr(django_user, column) for column in SUMMARY_COLUMNS})
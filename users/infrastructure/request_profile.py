@@ -0,0 +1,173 @@
+"""
+Perfil por request: tiempo por fase (``Server-Timing``) y presupuesto de
+consultas a la base de datos.
+
+Fases (se acumulan si una fase ocurre varias veces en el request):
+
+- ``auth``: autenticación JWT (``CookieJWTAuthentication``).
+- ``validation``: validación de los serializers de entrada.
+- ``use_case``: ejecución del caso de uso (incluye su transacción).
+- ``serialization``: resource objects JSON:API y render del cuerpo.
+
+El tiempo en la base de datos sale del conteo de consultas de
+``users.infrastructure.metrics`` y se solapa con las fases anteriores.
+
+Presupuesto de consultas: ``@query_budget(n)`` sobre una acción declara
+el máximo de consultas del request completo (autenticación incluida). Si
+se supera, ``USERS_QUERY_BUDGET_MODE`` decide: ``warn`` (log, default),
+``raise`` (``QueryBudgetExceeded``; la suite de tests lo activa) u ``off``.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+BUDGET_WARN = "warn"
+BUDGET_RAISE = "raise"
+BUDGET_OFF = "off"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Un request ejecutó más consultas que el presupuesto de su vista."""
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    view: str
+    max_queries: int
+
+
+class RequestProfile:
+    """Fases medidas y presupuesto declarado de un request."""
+
+    __slots__ = ("phases", "budget", "_active")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.budget: Optional[QueryBudget] = None
+        self._active: set = set()
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def server_timing(self, total: float, queries: Optional[int] = None, db_seconds: float = 0.0) -> str:
+        """Valor de la cabecera ``Server-Timing`` (duraciones en ms)."""
+        entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.phases.items()]
+        if queries is not None:
+            entries.append(f'db;dur={db_seconds * 1000:.2f};desc="{queries} queries"')
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+    def check_budget(self, queries: int) -> None:
+        """Aplica ``USERS_QUERY_BUDGET_MODE`` si el request superó su presupuesto."""
+        budget = self.budget
+        if budget is None or queries <= budget.max_queries:
+            return
+        mode = getattr(settings, "USERS_QUERY_BUDGET_MODE", BUDGET_WARN)
+        if mode == BUDGET_OFF:
+            return
+        message = f"{budget.view} ejecutó {queries} consultas (presupuesto: {budget.max_queries})"
+        if mode == BUDGET_RAISE:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+_profile: ContextVar[Optional[RequestProfile]] = ContextVar("users_request_profile", default=None)
+
+
+def current_request_profile() -> Optional[RequestProfile]:
+    """Perfil del request actual, o ``None`` fuera de un request."""
+    return _profile.get()
+
+
+@contextmanager
+def request_profile_scope() -> Iterator[RequestProfile]:
+    """Abre el perfil del request (lo hace ``ServerTimingMiddleware``)."""
+    profile = RequestProfile()
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Suma la duración del bloque a la fase ``name`` del request actual.
+
+    Sin perfil activo no hace nada; una fase anidada en sí misma no se
+    cuenta dos veces.
+    """
+    profile = _profile.get()
+    if profile is None or name in profile._active:
+        yield
+        return
+    profile._active.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile._active.discard(name)
+        profile.add(name, time.perf_counter() - started)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorador equivalente a ``with phase(name)`` (funciones síncronas)."""
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declara el máximo de consultas del request que atiende la vista.
+
+    Ejemplo::
+
+        @query_budget(2)
+        def retrieve(self, request, pk=None): ...
+
+    Se registra al entrar en la acción y ``ServerTimingMiddleware`` lo
+    comprueba al terminar el request. Admite vistas síncronas y async.
+    """
+    def decorator(func: F) -> F:
+        budget = QueryBudget(func.__qualname__, max_queries)
+
+        def declare() -> None:
+            profile = _profile.get()
+            if profile is not None:
+                profile.budget = budget
+
+        if iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                declare()
+                return await func(*args, **kwargs)
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                declare()
+                return func(*args, **kwargs)
+            wrapper = sync_wrapper
+        wrapper.query_budget = budget  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+    return decorator
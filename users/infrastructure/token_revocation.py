@@ -0,0 +1,97 @@
+"""
+Revocación de JWT para el modo de autenticación sin estado (claims-only).
+
+En modo ``JWT_STATELESS_AUTH`` el autenticador no consulta la tabla
+``users``: confía en los claims del token. Para poder revocar tokens sin
+volver a un fetch completo por request, cada usuario tiene un
+``token_version`` que se incrementa al desactivarlo o cambiar su email.
+
+La versión vigente se publica en la caché de Django (alias
+``TOKEN_REVOCATION_CACHE``). La verificación por request es una sola
+lectura de caché: un token es válido mientras su claim ``token_version``
+sea mayor o igual a la versión registrada. En despliegues con varios
+workers la caché debe ser compartida (Redis, Memcached o
+``DatabaseCache``): ``check_revocation_cache`` (system check) avisa si es
+``LocMemCache`` y falla si es ``DummyCache``.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.db import transaction
+
+# Versión "infinita": revoca todos los tokens (usuario eliminado)
+_REVOKE_ALL = 2 ** 31
+
+_KEY_PREFIX = "users:token_version:"
+
+
+def _cache():
+    return caches[getattr(settings, "TOKEN_REVOCATION_CACHE", "default")]
+
+
+# Backends que no comparten las revocaciones entre workers
+_PER_PROCESS_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+_DUMMY_BACKEND = "django.core.cache.backends.dummy.DummyCache"
+
+
+def check_revocation_cache(app_configs=None, **kwargs) -> list:
+    """
+    System check: con ``JWT_STATELESS_AUTH`` la caché de revocación debe
+    ser compartida entre workers.
+
+    ``LocMemCache`` (el default de Django) es un warning: una revocación
+    solo se ve en el worker que la registró. ``DummyCache`` es un error: las
+    revocaciones se pierden siempre (``migrate`` no arranca).
+    """
+    if not getattr(settings, "JWT_STATELESS_AUTH", False):
+        return []
+    alias = getattr(settings, "TOKEN_REVOCATION_CACHE", "default")
+    backend = settings.CACHES.get(alias, {}).get("BACKEND", "")
+    if backend == _DUMMY_BACKEND:
+        return [checks.Error(
+            f"TOKEN_REVOCATION_CACHE ('{alias}') usa DummyCache: los tokens revocados siguen siendo válidos.",
+            hint="Configure una caché compartida (Redis, Memcached o DatabaseCache).",
+            id="users.E001",
+        )]
+    if backend == _PER_PROCESS_BACKEND:
+        return [checks.Warning(
+            f"TOKEN_REVOCATION_CACHE ('{alias}') usa LocMemCache: con varios workers una "
+            "revocación solo se ve en el worker que la registró.",
+            hint="Configure una caché compartida (Redis, Memcached o DatabaseCache).",
+            id="users.W001",
+        )]
+    return []
+
+
+def _timeout() -> int:
+    """Basta con recordar la revocación mientras vivan los refresh tokens."""
+    lifetime = settings.SIMPLE_JWT.get("REFRESH_TOKEN_LIFETIME")
+    return int(lifetime.total_seconds()) if lifetime else 24 * 60 * 60
+
+
+def revoke_tokens(user_id: str, token_version: Optional[int]) -> None:
+    """
+    Registra la versión vigente de tokens de un usuario.
+
+    Args:
+        user_id: ID del usuario
+        token_version: Nueva versión; ``None`` revoca todos los tokens
+    """
+    version = _REVOKE_ALL if token_version is None else token_version
+    _cache().set(f"{_KEY_PREFIX}{user_id}", version, timeout=_timeout())
+
+
+def revoke_tokens_on_commit(user_id: str, token_version: Optional[int]) -> None:
+    """Como ``revoke_tokens`` pero tras el commit de la transacción actual."""
+    transaction.on_commit(lambda: revoke_tokens(user_id, token_version))
+
+
+def is_token_revoked(user_id: str, token_version: int) -> bool:
+    """True si existe una versión registrada posterior a la del token."""
+    current = _cache().get(f"{_KEY_PREFIX}{user_id}")
+    return current is not None and token_version < current
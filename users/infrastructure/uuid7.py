@@ -0,0 +1,70 @@
+"""
+UUIDv7 (RFC 9562) - identificadores ordenados por tiempo.
+
+Un UUIDv4 es aleatorio: cada alta cae en una hoja distinta del índice de
+la PK, así que el B-tree se parte en páginas medio vacías y las hojas
+"calientes" no caben en caché. Un UUIDv7 empieza con el timestamp Unix en
+milisegundos: las altas se agregan al final del índice, como con un
+autoincremental, pero los ids siguen siendo globales y no adivinables.
+
+Estructura (128 bits):
+
+    unix_ts_ms (48) | ver=7 (4) | contador (12) | var=0b10 (2) | aleatorio (62)
+
+Los 12 bits ``rand_a`` se usan como contador (método 1 de RFC 9562 §6.2):
+dentro del mismo milisegundo los ids de un proceso son estrictamente
+crecientes. El contador arranca en un valor aleatorio de 11 bits para
+dejar margen; si se desborda, o si el reloj retrocede, se sigue con el
+último milisegundo emitido. Python 3.14+ trae ``uuid.uuid7``; este módulo
+lo usa si está disponible.
+
+Los ids existentes (v4) siguen siendo válidos: la columna es la misma
+``uuid`` y nada depende de la versión.
+"""
+
+import secrets
+import threading
+import time
+import uuid
+
+_MAX_COUNTER = 0xFFF
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def _uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = secrets.randbits(11)
+        else:
+            _counter += 1
+            if _counter > _MAX_COUNTER:
+                _last_ms += 1
+                _counter = secrets.randbits(11)
+        timestamp, counter = _last_ms, _counter
+
+    value = (timestamp & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= secrets.randbits(62)
+    return uuid.UUID(int=value)
+
+
+_generate = getattr(uuid, "uuid7", _uuid7)
+
+
+def uuid7() -> uuid.UUID:
+    """Genera un UUIDv7 (ordenado por tiempo de creación)."""
+    return _generate()
+
+
+def uuid7_timestamp_ms(value: uuid.UUID) -> int:
+    """Milisegundos Unix codificados en un UUIDv7."""
+    return value.int >> 80
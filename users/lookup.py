@@ -0,0 +1,94 @@
+"""
+users/lookup.py
+
+Filtros ``filter[...]`` de ``GET /api/users/``.
+
+``filter[is_active]=true|false`` restringe el listado paginado a usuarios
+activos o inactivos.
+
+Resolución de usuarios por lote para otros servicios.
+
+En lugar de un ``GET /api/users/{id}/`` por usuario, el cliente pide todos
+de una vez:
+
+  GET  /api/users/?filter[id]=a,b,c&filter[email]=x@example.com
+  POST /api/users/lookup/  {"ids": ["a", "b"], "emails": ["x@example.com"]}
+
+La variante POST evita el límite de longitud de la URL con lotes grandes.
+En ambas el total de IDs + emails está acotado por ``USERS_LOOKUP_MAX`` y
+se resuelve con una consulta ``IN`` por criterio. La respuesta es una
+colección JSON:API (sin paginar) con los valores no encontrados en
+``meta.missing``.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+
+from .api_response import collection_response, user_resource
+from .application.use_cases import ResolveUsersCommand, ResolveUsersResult
+
+FILTER_ID_PARAM = "filter[id]"
+FILTER_EMAIL_PARAM = "filter[email]"
+FILTER_ACTIVE_PARAM = "filter[is_active]"
+
+_BOOLEANS = {"true": True, "1": True, "false": False, "0": False}
+
+
+def lookup_max() -> int:
+    return getattr(settings, "USERS_LOOKUP_MAX", 200)
+
+
+def _split(values: Iterable[str]) -> List[str]:
+    """Valores separados por coma (admite el parámetro repetido)."""
+    return [v.strip() for raw in values for v in raw.split(",") if v.strip()]
+
+
+def active_filter_from_query(request) -> Optional[bool]:
+    """
+    Valor de ``filter[is_active]`` (None si no se envía).
+
+    Raises:
+        ParseError: Si no es ``true`` / ``false``.
+    """
+    raw = request.query_params.get(FILTER_ACTIVE_PARAM)
+    if raw is None or raw == "":
+        return None
+    try:
+        return _BOOLEANS[raw.lower()]
+    except KeyError:
+        raise ParseError(f"{FILTER_ACTIVE_PARAM} debe ser true o false")
+
+
+def resolve_command_from_query(request) -> Optional[ResolveUsersCommand]:
+    """
+    Comando de resolución a partir de ``filter[id]`` / ``filter[email]``, o
+    None si el request no trae esos filtros.
+
+    Raises:
+        ParseError: Si se piden más de ``USERS_LOOKUP_MAX`` valores.
+    """
+    params = request.query_params
+    if FILTER_ID_PARAM not in params and FILTER_EMAIL_PARAM not in params:
+        return None
+    command = ResolveUsersCommand(
+        ids=_split(params.getlist(FILTER_ID_PARAM)),
+        emails=_split(params.getlist(FILTER_EMAIL_PARAM)),
+    )
+    if len(command.ids) + len(command.emails) > lookup_max():
+        raise ParseError(f"Se admiten como máximo {lookup_max()} valores en {FILTER_ID_PARAM} y {FILTER_EMAIL_PARAM}")
+    return command
+
+
+def resolve_response(request, result: ResolveUsersResult) -> Response:
+    """Colección JSON:API con los usuarios resueltos y ``meta.missing``."""
+    return collection_response(
+        [user_resource(u, request=request) for u in result.users],
+        status=status.HTTP_200_OK,
+        meta_extra={"missing": {"ids": result.missing_ids, "emails": result.missing_emails}},
+    )
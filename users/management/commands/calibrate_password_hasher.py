@@ -0,0 +1,43 @@
+"""
+manage.py calibrate_password_hasher
+
+Mide este hardware y sugiere ``PASSWORD_HASH_ITERATIONS`` (PBKDF2) para que
+un hash tarde aproximadamente la latencia objetivo.
+
+Uso:
+    python manage.py calibrate_password_hasher --target-ms 250
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.infrastructure.password_hashing import calibrate_pbkdf2_iterations
+
+
+class Command(BaseCommand):
+    help = "Calcula las iteraciones de PBKDF2 para una latencia de hash objetivo."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=250.0,
+            help="Latencia objetivo por hash en milisegundos (default: 250).",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=3,
+            help="Mediciones a promediar (default: 3).",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        samples = [calibrate_pbkdf2_iterations(options["target_ms"]) for _ in range(max(1, options["rounds"]))]
+        iterations = round(sum(samples) / len(samples), -3)
+        self.stderr.write(
+            f"[HASH] objetivo={options['target_ms']:.0f}ms muestras={samples} "
+            f"tiempo={time.perf_counter() - started:.2f}s"
+        )
+        self.stdout.write(f"PASSWORD_HASH_ITERATIONS={int(iterations)}")
@@ -0,0 +1,71 @@
+"""
+manage.py export_users
+
+Exporta todos los usuarios en streaming (NDJSON o CSV, opcionalmente gzip)
+a un archivo o a stdout, con memoria constante.
+
+Uso:
+    python manage.py export_users > users.ndjson
+    python manage.py export_users --format csv --output users.csv
+    python manage.py export_users --gzip --output users.ndjson.gz
+"""
+
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.infrastructure.export import FORMAT_CSV, FORMAT_NDJSON, default_chunk_size, export_users
+
+
+class Command(BaseCommand):
+    help = "Exporta la tabla de usuarios en streaming (NDJSON/CSV, opcional gzip)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=[FORMAT_NDJSON, FORMAT_CSV],
+            default=FORMAT_NDJSON,
+            help="Formato de salida (default: ndjson).",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Archivo de salida ('-' para stdout, default).",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Comprime la salida con gzip.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=default_chunk_size(),
+            help="Filas por fetch del cursor de base de datos (default: USERS_EXPORT_CHUNK_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        chunks = export_users(options["format"], gzip=options["gzip"], chunk_size=options["chunk_size"])
+
+        written = 0
+        if options["output"] != "-":
+            with open(options["output"], "wb") as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+                    written += len(chunk)
+        elif options["gzip"]:
+            # gzip es binario: se escribe directo al buffer de stdout
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+                written += len(chunk)
+            sys.stdout.buffer.flush()
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk.decode("utf-8"), ending="")
+                written += len(chunk)
+
+        self.stderr.write(
+            f"[EXPORT] {written} bytes escritos en {time.perf_counter() - started:.2f}s"
+        )
@@ -0,0 +1,135 @@
+"""
+manage.py import_users
+
+Alta masiva de usuarios desde un archivo CSV o NDJSON.
+
+Columnas / claves: ``email``, ``username``, ``password`` y opcionalmente
+``role`` (USER por defecto). Las filas se validan con ``UserFactory``, los
+passwords se hashean en paralelo y se insertan por lotes (``COPY`` en
+PostgreSQL). Los conflictos no detienen la importación: se resumen al final
+y pueden volcarse a un CSV con ``--report``.
+
+El hash usa el KDF configurado pero no el pool acotado de los requests
+(``PASSWORD_HASH_WORKERS``): ``--workers`` decide cuántos corren a la vez.
+
+Uso:
+    python manage.py import_users tenant.csv
+    python manage.py import_users tenant.ndjson --batch-size 5000 --workers 8
+    python manage.py import_users tenant.csv --report rechazados.csv
+"""
+
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from users.application.use_cases import (
+    ImportUserRow,
+    ImportUsersCommand,
+    ImportUsersResult,
+    ImportUsersUseCase,
+)
+from users.infrastructure.outbox import build_event_publisher
+from users.infrastructure.password_hashing import DjangoPasswordHasher
+from users.infrastructure.repository import DjangoUserRepository
+
+
+class Command(BaseCommand):
+    help = "Importa usuarios en lote desde un archivo CSV o NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo a importar (.csv, .ndjson o .jsonl).")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            default=None,
+            help="Formato del archivo (por defecto se deduce de la extensión).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Filas por lote/INSERT (default: 1000).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Hilos para hashear passwords (default: número de CPUs).",
+        )
+        parser.add_argument(
+            "--report",
+            default=None,
+            help="CSV donde volcar las filas rechazadas (línea, email, código, detalle).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"No existe el archivo: {path}")
+        fmt = options["format"] or ("csv" if path.lower().endswith(".csv") else "ndjson")
+
+        with open(path, newline="", encoding="utf-8") as fh:
+            rows = _read_csv(fh) if fmt == "csv" else _read_ndjson(fh)
+            with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as executor:
+                use_case = ImportUsersUseCase(
+                    repository=DjangoUserRepository(),
+                    event_publisher=build_event_publisher(),
+                    executor=executor,
+                    password_hasher=DjangoPasswordHasher(),
+                    atomic=transaction.atomic,
+                )
+                result = use_case.execute(ImportUsersCommand(rows=rows, batch_size=options["batch_size"]))
+
+        self._report(result)
+        if options["report"]:
+            self._write_rejections(options["report"], result)
+
+    def _report(self, result: ImportUsersResult) -> None:
+        self.stdout.write(
+            f"[IMPORT] creados={result.created} conflictos={len(result.conflicts)} "
+            f"invalidos={len(result.invalid)} eventos={result.events_published} "
+            f"tiempo={result.elapsed:.2f}s throughput={result.rows_per_second:.1f} filas/s"
+        )
+
+    @staticmethod
+    def _write_rejections(path: str, result: ImportUsersResult) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["line", "email", "code", "detail"])
+            for error in sorted(result.invalid + result.conflicts, key=lambda e: e.line):
+                writer.writerow([error.line, error.email, error.code, error.detail])
+
+
+def _read_csv(fh) -> Iterator[ImportUserRow]:
+    reader = csv.DictReader(fh)
+    missing = {"email", "username", "password"} - set(reader.fieldnames or [])
+    if missing:
+        raise CommandError(f"Faltan columnas en el CSV: {', '.join(sorted(missing))}")
+    for record in reader:
+        yield _to_row(record, reader.line_num)
+
+
+def _read_ndjson(fh) -> Iterator[ImportUserRow]:
+    for line_number, line in enumerate(fh, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            raise CommandError(f"JSON inválido en la línea {line_number}")
+        yield _to_row(record, line_number)
+
+
+def _to_row(record: dict, line: int) -> ImportUserRow:
+    return ImportUserRow(
+        email=record.get("email") or "",
+        username=record.get("username") or "",
+        password=record.get("password") or "",
+        role=record.get("role"),
+        line=line,
+    )
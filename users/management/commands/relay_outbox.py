@@ -0,0 +1,91 @@
+"""
+manage.py relay_outbox
+
+Publica en RabbitMQ los eventos pendientes del outbox (``users_outbox``).
+
+Uso:
+    python manage.py relay_outbox                    # bucle continuo
+    python manage.py relay_outbox --once             # drena y termina
+    python manage.py relay_outbox --batch-size 500 --interval 0.5
+    python manage.py relay_outbox --max-attempts 5   # dead letter tras 5 fallos
+"""
+
+import os
+import signal
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from users.infrastructure.outbox import OutboxRelay, RelayBatchResult
+
+
+class Command(BaseCommand):
+    help = "Publica en RabbitMQ los eventos pendientes del outbox en lotes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=int(os.environ.get("OUTBOX_RELAY_BATCH_SIZE", "100")),
+            help="Eventos por lote/transacción (default: 100).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=float(os.environ.get("OUTBOX_RELAY_INTERVAL", "1.0")),
+            help="Segundos de espera cuando el outbox está vacío (default: 1.0).",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=int(os.environ.get("OUTBOX_RELAY_MAX_ATTEMPTS", "10")),
+            help="Intentos antes de descartar un evento (dead letter, default: 10).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drena el outbox una vez y termina.",
+        )
+        parser.add_argument(
+            "--purge-after-hours",
+            type=float,
+            default=None,
+            help="Elimina eventos publicados hace más de N horas antes de empezar.",
+        )
+
+    def handle(self, *args, **options):
+        relay = OutboxRelay(batch_size=options["batch_size"], max_attempts=options["max_attempts"])
+
+        if options["purge_after_hours"] is not None:
+            purged = relay.purge_published(timedelta(hours=options["purge_after_hours"]))
+            self.stdout.write(f"[OUTBOX] {purged} eventos publicados eliminados")
+
+        if options["once"]:
+            self._report(relay.drain())
+            return
+
+        stop = {"requested": False}
+
+        def _request_stop(signum, frame):
+            stop["requested"] = True
+
+        signal.signal(signal.SIGTERM, _request_stop)
+        signal.signal(signal.SIGINT, _request_stop)
+
+        self.stdout.write(
+            f"[OUTBOX] Relay iniciado (batch_size={relay.batch_size}, "
+            f"max_attempts={relay.max_attempts}, interval={options['interval']}s)"
+        )
+        relay.run_forever(
+            interval=options["interval"],
+            on_batch=self._report,
+            should_stop=lambda: stop["requested"],
+        )
+        self.stdout.write("[OUTBOX] Relay detenido")
+
+    def _report(self, result: RelayBatchResult) -> None:
+        self.stdout.write(
+            f"[OUTBOX] publicados={result.published} fallidos={result.failed} "
+            f"descartados={result.dead_lettered} "
+            f"tiempo={result.elapsed:.3f}s throughput={result.events_per_second:.1f} ev/s"
+        )
@@ -7,17 +7,34 @@ Responsabilidades:
 - Content negotiation: valida Accept y Content-Type.
 - Inyección de cabeceras estándar (X-Request-ID, Cache-Control, Vary).
 - Seguridad: X-Content-Type-Options, etc.
+- Identity map por request (una sola carga de cada fila de usuario).
+- Read-your-writes con réplica de lectura (cookie de "leer del primario").
+- Métricas por request: latencia y consultas a la base de datos.
+- Server-Timing por fase y presupuesto de consultas por vista.
+
+Todos los middlewares soportan el modo sync (WSGI) y async (ASGI): con vistas
+async no fuerzan un salto a un hilo por petición.
 """
 
 from __future__ import annotations
 
+import re
+import time
 import uuid
 import logging
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Optional
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
 
 from .api_response import set_request_id
+from .infrastructure.db_router import db_routing_scope, replica_configured
+from .infrastructure.identity_map import IdentityMap, identity_map_scope
+from .infrastructure.metrics import QueryStats, observe_request, query_stats_scope
+from .infrastructure.request_profile import RequestProfile, request_profile_scope
 
 logger = logging.getLogger(__name__)
 
@@ -33,35 +50,58 @@ class APIHeadersMiddleware:
     Cabeceras añadidas:
     - X-Request-ID: identificador único para trazabilidad.
     - X-Content-Type-Options: nosniff (seguridad).
-    - Cache-Control: no-store para endpoints API (datos sensibles).
+    - Cache-Control: no-store para endpoints API (datos sensibles);
+      ``private, no-cache`` si la respuesta lleva ETag.
     - Vary: Accept, Authorization (content negotiation correcta).
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request_id = self._prepare(request)
+        return self._finalize(request, self.get_response(request), request_id)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        request_id = self._prepare(request)
+        return self._finalize(request, await self.get_response(request), request_id)
+
+    @staticmethod
+    def _prepare(request: HttpRequest) -> str:
         # Generar o propagar X-Request-ID para trazabilidad
         request_id = request.META.get("HTTP_X_REQUEST_ID") or str(uuid.uuid4())
         request.META["HTTP_X_REQUEST_ID"] = request_id
 
-        # Almacenar en thread-local para que _meta() lo incluya en el body
+        # Almacenar en el contexto para que _meta() lo incluya en el body
         set_request_id(request_id)
+        return request_id
 
-        response: HttpResponse = self.get_response(request)
-
+    @staticmethod
+    def _finalize(request: HttpRequest, response: HttpResponse, request_id: str) -> HttpResponse:
         # ── Cabeceras en TODAS las respuestas ──────────────────────────
         response["X-Request-ID"] = request_id
         response["X-Content-Type-Options"] = "nosniff"
 
         # ── Cabeceras solo para rutas /api/ ────────────────────────────
         if request.path.startswith("/api/"):
-            # Datos de API no deben cachearse (contienen info de usuario)
+            # Datos de API no deben cachearse (contienen info de usuario).
+            # Con ETag el cliente puede guardarla, pero revalida siempre
+            # (If-None-Match -> 304) y solo en su caché privada.
             if not response.has_header("Cache-Control"):
-                response["Cache-Control"] = "no-store, no-cache, must-revalidate"
+                if response.has_header("ETag"):
+                    response["Cache-Control"] = "private, no-cache"
+                else:
+                    response["Cache-Control"] = "no-store, no-cache, must-revalidate"
 
             # Vary indica a proxies que la respuesta depende de estos headers
-            response["Vary"] = "Accept, Authorization, Cookie"
+            patch_vary_headers(response, ("Accept", "Authorization", "Cookie"))
 
         return response
 
@@ -92,25 +132,42 @@ class ContentNegotiationMiddleware:
     SUPPORTED_ACCEPT = {
         "application/json",
         "application/vnd.api+json",
+        # Exportación en streaming (GET /api/users/export/)
+        "application/x-ndjson",
+        "text/csv",
         "*/*",
     }
 
     METHODS_WITH_BODY = {"POST", "PUT", "PATCH"}
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._reject(request) or self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return self._reject(request) or await self.get_response(request)
+
+    def _reject(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """Respuesta 406/415 si la petición no es aceptable, o None."""
         path = request.path
 
         # Solo interceptar rutas de API
         if not path.startswith("/api/"):
-            return self.get_response(request)
+            return None
 
         # Excluir rutas exentas
         for prefix in _EXEMPT_PREFIXES:
             if path.startswith(prefix):
-                return self.get_response(request)
+                return None
 
         # ── Validar Content-Type en métodos con body (RFC 9110 §8.3) ──
         if request.method in self.METHODS_WITH_BODY:
@@ -180,4 +237,208 @@ class ContentNegotiationMiddleware:
                 content_type="application/vnd.api+json",
             )
 
-        return self.get_response(request)
+        return None
+
+
+class IdentityMapMiddleware:
+    """
+    Abre un identity map por request (``users.infrastructure.identity_map``).
+
+    La autenticación y el repositorio comparten las filas de usuario ya
+    cargadas, así que cada fila se consulta como mucho una vez por request.
+    Con ``DEBUG`` la respuesta incluye ``X-Identity-Map`` con las filas
+    cargadas y las consultas ahorradas.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with identity_map_scope() as identity_map:
+            return self._report(request, self.get_response(request), identity_map)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with identity_map_scope() as identity_map:
+            return self._report(request, await self.get_response(request), identity_map)
+
+    @staticmethod
+    def _report(request: HttpRequest, response: HttpResponse, identity_map: IdentityMap) -> HttpResponse:
+        if settings.DEBUG:
+            response["X-Identity-Map"] = f"loaded={identity_map.loads}; saved-queries={identity_map.hits}"
+            logger.debug(
+                "identity map %s %s: %d filas cargadas, %d consultas ahorradas",
+                request.method, request.path, identity_map.loads, identity_map.hits,
+            )
+        return response
+
+
+class ReadYourWritesMiddleware:
+    """
+    Abre el alcance de enrutamiento del request (``users.infrastructure.db_router``).
+
+    Si el request escribió en la base de datos y hay réplica configurada, la
+    respuesta lleva la cookie ``PRIMARY_COOKIE`` con el instante hasta el
+    que ese cliente debe leer del primario
+    (``USERS_READ_YOUR_WRITES_SECONDS``). Así sus lecturas siguientes ven
+    la escritura aunque la réplica tenga retraso.
+    """
+
+    PRIMARY_COOKIE = "users_read_primary_until"
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with db_routing_scope(pinned=self._recently_wrote(request)) as state:
+            response = self.get_response(request)
+        return self._mark(response, state.wrote)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with db_routing_scope(pinned=self._recently_wrote(request)) as state:
+            response = await self.get_response(request)
+        return self._mark(response, state.wrote)
+
+    def _recently_wrote(self, request: HttpRequest) -> bool:
+        try:
+            return float(request.COOKIES.get(self.PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def _mark(self, response: HttpResponse, wrote: bool) -> HttpResponse:
+        if wrote and replica_configured():
+            window = settings.USERS_READ_YOUR_WRITES_SECONDS
+            response.set_cookie(
+                self.PRIMARY_COOKIE,
+                f"{time.time() + window:.3f}",
+                max_age=max(1, int(window + 0.999)),
+                httponly=True,
+                secure=not settings.DEBUG,
+                samesite="Lax",
+                path="/",
+            )
+        return response
+
+
+# Grupos con nombre de las rutas (regex o convertidores) -> "{nombre}"
+_ROUTE_PARAM = re.compile(r"\(\?P<(\w+)>[^)]*\)|<(?:\w+:)?(\w+)>")
+_ROUTE_LOOKAHEAD = re.compile(r"\(\?[!=][^)]*\)")
+_KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+@lru_cache(maxsize=256)
+def _route_label(route: str) -> str:
+    """``api/users/(?P<pk>[^/.]+)/$`` -> ``/api/users/{pk}/``."""
+    route = _ROUTE_LOOKAHEAD.sub("", route)
+    route = _ROUTE_PARAM.sub(lambda m: "{%s}" % (m.group(1) or m.group(2)), route)
+    return "/" + route.replace("^", "").replace("$", "")
+
+
+class MetricsMiddleware:
+    """
+    Registra cada request en las métricas de ``GET /metrics``
+    (``users.infrastructure.metrics``): latencia por ruta, método y status,
+    y cantidad y tiempo de las consultas a la base de datos.
+
+    La ruta es el patrón de URL resuelto (``/api/users/{pk}/``), no el path,
+    para acotar las series; los paths sin ruta se agrupan en ``unmatched``.
+    En respuestas en streaming se mide hasta devolver la respuesta, no hasta
+    enviar el último byte.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        with query_stats_scope() as queries:
+            response = self.get_response(request)
+        return self._observe(request, response, time.perf_counter() - started, queries)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        with query_stats_scope() as queries:
+            response = await self.get_response(request)
+        return self._observe(request, response, time.perf_counter() - started, queries)
+
+    @staticmethod
+    def _observe(request: HttpRequest, response: HttpResponse, seconds: float, queries: QueryStats) -> HttpResponse:
+        match = getattr(request, "resolver_match", None)
+        route = _route_label(match.route) if match is not None and match.route else "unmatched"
+        method = request.method if request.method in _KNOWN_METHODS else "OTHER"
+        observe_request(route, method, response.status_code, seconds, queries)
+        return response
+
+
+class ServerTimingMiddleware:
+    """
+    Perfil por request (``users.infrastructure.request_profile``).
+
+    - Las respuestas de ``/api/`` llevan ``Server-Timing`` con las fases
+      ``auth``, ``validation``, ``use_case``, ``serialization``, ``db``
+      (con el número de consultas) y ``total``. ``USERS_SERVER_TIMING=false``
+      la omite.
+    - Si la vista declaró ``@query_budget(n)`` y el request ejecutó más de
+      ``n`` consultas, aplica ``USERS_QUERY_BUDGET_MODE`` (log o excepción).
+
+    Reutiliza el conteo de consultas de ``MetricsMiddleware`` si va antes.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        with request_profile_scope() as profile, query_stats_scope(reuse=True) as queries:
+            before = queries.count, queries.seconds
+            response = self.get_response(request)
+        return self._report(request, response, profile, queries, before, time.perf_counter() - started)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        with request_profile_scope() as profile, query_stats_scope(reuse=True) as queries:
+            before = queries.count, queries.seconds
+            response = await self.get_response(request)
+        return self._report(request, response, profile, queries, before, time.perf_counter() - started)
+
+    @staticmethod
+    def _report(
+        request: HttpRequest,
+        response: HttpResponse,
+        profile: RequestProfile,
+        queries: QueryStats,
+        before: tuple,
+        total: float,
+    ) -> HttpResponse:
+        count, db_seconds = queries.count - before[0], queries.seconds - before[1]
+        if request.path.startswith("/api/") and getattr(settings, "USERS_SERVER_TIMING", True):
+            response["Server-Timing"] = profile.server_timing(total, count, db_seconds)
+        profile.check_budget(count)
+        return response
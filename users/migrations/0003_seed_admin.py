@@ -10,12 +10,15 @@ ni crea duplicados.
 Credenciales del admin:
   - username : admin
   - email    : admin@sofkau.com
-  - password : Admin@SofkaU_2026!   (hash SHA-256, igual que usa el servicio)
+  - password : Admin@SofkaU_2026!   (hash con el KDF de settings.PASSWORD_HASHERS)
+
+Las bases creadas antes de este cambio conservan el hash SHA-256 legacy,
+que se regenera con el KDF en el primer login del admin.
 """
 
-import hashlib
 import uuid
 
+from django.contrib.auth.hashers import make_password
 from django.db import migrations
 
 
@@ -26,8 +29,8 @@ ADMIN_PASSWORD = "Admin@SofkaU_2026!"
 
 
 def _hash_password(password: str) -> str:
-    """SHA-256, idéntico al método usado en users/application/use_cases.py."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash con salt usando el hasher preferido (ver users/infrastructure/password_hashing.py)."""
+    return make_password(password)
 
 
 def seed_admin(apps, schema_editor):
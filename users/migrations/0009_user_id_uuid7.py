@@ -0,0 +1,19 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:40
+
+import users.infrastructure.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_user_index_pass'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=users.infrastructure.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
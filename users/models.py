@@ -26,7 +26,9 @@ Define SOLO la estructura de persistencia en base de datos.
 """
 
 from django.db import models
-import uuid
+from django.db.models.functions import Lower
+
+from .infrastructure.uuid7 import uuid7
 
 
 class User(models.Model):
@@ -37,21 +39,17 @@ class User(models.Model):
         ADMIN = "ADMIN", "Admin"
         USER = "USER", "User"
 
+    # UUIDv7: ordenado por tiempo, las altas se agregan al final del índice
+    # de la PK (los ids v4 existentes siguen siendo válidos)
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
-    email = models.EmailField(
-        unique=True,
-        max_length=255,
-        db_index=True
-    )
-    username = models.CharField(
-        max_length=50,
-        unique=True,
-        db_index=True
-    )
+    # Unicidad e índices en Meta.constraints / Meta.indexes (un índice por
+    # columna: unique + db_index + Index duplicaban el costo de cada escritura)
+    email = models.EmailField(max_length=255)
+    username = models.CharField(max_length=50)
     password_hash = models.CharField(max_length=255)
     is_active = models.BooleanField(default=True)
     role = models.CharField(
@@ -59,6 +57,10 @@ class User(models.Model):
         choices=RoleChoices.choices,
         default=RoleChoices.USER
     )
+    # Se incrementa al desactivar/cambiar email: revoca los JWT emitidos antes
+    token_version = models.PositiveIntegerField(default=0)
+    # Se incrementa en cada UPDATE del repositorio (bloqueo optimista)
+    version = models.PositiveIntegerField(default=0)
 
     @property
     def is_authenticated(self):
@@ -71,10 +73,82 @@ class User(models.Model):
     class Meta:
         db_table = 'users'
         ordering = ['-created_at']
+        constraints = [
+            # Email único sin distinguir mayúsculas; las búsquedas por email
+            # filtran por LOWER(email) para usar este índice
+            models.UniqueConstraint(Lower('email'), name='users_email_lower_uniq'),
+            models.UniqueConstraint(fields=['username'], name='users_username_uniq'),
+        ]
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['username']),
+            # Listado keyset (más recientes primero)
+            models.Index(fields=['created_at', 'id'], name='users_created_at_id_idx'),
+            # Listado de usuarios activos (filter[is_active]=true)
+            models.Index(
+                fields=['created_at', 'id'],
+                condition=models.Q(is_active=True),
+                name='users_active_created_idx',
+            ),
+            # Usuarios de un rol ordenados por (username, id)
+            models.Index(fields=['role', 'username', 'id'], name='users_role_username_idx'),
+            # Feed de cambios: keyset sobre (updated_at, id)
+            models.Index(fields=['updated_at', 'id'], name='users_updated_at_id_idx'),
         ]
 
     def __str__(self):
         return f"{self.username} ({self.email}) - {self.role}"
+
+
+class UserTombstone(models.Model):
+    """
+    Marca de un usuario eliminado, para el feed de cambios.
+
+    Los consumidores del feed la reciben como una baja; la fila del usuario
+    ya no existe. Se inserta en la misma transacción que el DELETE.
+    """
+
+    user_id = models.UUIDField(primary_key=True)
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'users_tombstones'
+        indexes = [
+            models.Index(fields=['deleted_at', 'user_id'], name='users_tomb_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} (eliminado {self.deleted_at})"
+
+
+class OutboxEvent(models.Model):
+    """
+    Evento de dominio pendiente de publicar (patrón Transactional Outbox).
+
+    Se inserta en la MISMA transacción que el cambio del usuario; el comando
+    ``manage.py relay_outbox`` lo publica después en RabbitMQ.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=64)
+    routing_key = models.CharField(max_length=64, blank=True, default='')
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    published_at = models.DateTimeField(null=True, blank=True)
+    # Descartado tras agotar los intentos del relay (dead letter): deja de
+    # bloquear a los eventos posteriores
+    failed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+    class Meta:
+        db_table = 'users_outbox'
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['id'],
+                condition=models.Q(published_at__isnull=True, failed_at__isnull=True),
+                name='users_outbox_pending_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.id}"
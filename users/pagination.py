@@ -0,0 +1,224 @@
+"""
+users/pagination.py
+
+Paginación por cursor para las colecciones JSON:API.
+
+Parámetros de query (convención JSON:API ``page[...]``):
+
+  page[size]    Tamaño de página (default ``USERS_PAGE_SIZE``, máximo
+                ``USERS_PAGE_SIZE_MAX``).
+  page[after]   Cursor opaco: devuelve los elementos posteriores.
+  page[before]  Cursor opaco: devuelve los elementos anteriores.
+
+El cursor es la clave keyset del dominio (``PageKey``) serializada como
+JSON y codificada en base64url. Los enlaces ``links.next`` / ``links.prev``
+de la respuesta ya traen el cursor listo para usar.
+
+Cada colección declara el tipo de cada componente de su clave
+(``CREATED_AT_KEY``, ``USERNAME_KEY``, ``CHANGED_AT_KEY``): un cursor con
+otra cantidad de componentes o con valores que no se pueden convertir
+(fecha ISO con zona horaria, UUID, texto) es un 400, nunca llega al ORM.
+
+El feed de cambios (``GET /api/users/changes/``) usa el mismo cursor en
+``since`` y el mismo ``page[size]``.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+from uuid import UUID
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+
+from .domain.changes import ChangeFeed
+from .domain.pagination import Page, PageKey, PageRequest
+
+SIZE_PARAM = "page[size]"
+AFTER_PARAM = "page[after]"
+BEFORE_PARAM = "page[before]"
+SINCE_PARAM = "since"
+
+
+def default_page_size() -> int:
+    return getattr(settings, "USERS_PAGE_SIZE", 50)
+
+
+def max_page_size() -> int:
+    return getattr(settings, "USERS_PAGE_SIZE_MAX", 200)
+
+
+def _aware_datetime(value: Any) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError(value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        raise ValueError(value)
+    return parsed
+
+
+def _uuid(value: Any) -> UUID:
+    if not isinstance(value, str):
+        raise ValueError(value)
+    return UUID(value)
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(value)
+    return value
+
+
+# Conversión de cada componente de la clave keyset, en orden
+CursorKey = Tuple[Callable[[Any], Any], ...]
+
+CREATED_AT_KEY: CursorKey = (_aware_datetime, _uuid)   # (created_at, id)
+USERNAME_KEY: CursorKey = (_text, _uuid)               # (username, id)
+CHANGED_AT_KEY: CursorKey = (_aware_datetime, _uuid)   # (changed_at, user_id)
+
+
+def _json_key_value(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} no es serializable en un cursor")
+
+
+def encode_cursor(key: PageKey) -> str:
+    """Codifica una clave keyset como cursor opaco (base64url sin padding)."""
+    raw = json.dumps(list(key), separators=(",", ":"), default=_json_key_value).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, key: CursorKey) -> PageKey:
+    """
+    Decodifica un cursor generado por ``encode_cursor`` para la clave ``key``.
+
+    Cada componente se convierte con su conversor (fechas a ``datetime``,
+    ids a ``UUID``).
+
+    Raises:
+        ParseError: Si el cursor no es válido o no corresponde a ``key``
+            (400 Bad Request).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(value, list) or len(value) != len(key):
+            raise ValueError(value)
+        return tuple(convert(component) for convert, component in zip(key, value))
+    except (ValueError, binascii.Error, UnicodeError):
+        raise ParseError("Cursor de paginación inválido")
+
+
+def page_size_from_query(request) -> int:
+    """
+    Tamaño de página de ``page[size]`` (default y máximo según settings).
+
+    Raises:
+        ParseError: Si ``page[size]`` no es un entero positivo.
+    """
+    raw_size = request.query_params.get(SIZE_PARAM)
+    if raw_size is None or raw_size == "":
+        return default_page_size()
+    try:
+        size = int(raw_size)
+    except ValueError:
+        raise ParseError(f"{SIZE_PARAM} debe ser un entero")
+    if size < 1:
+        raise ParseError(f"{SIZE_PARAM} debe ser mayor que 0")
+    return min(size, max_page_size())
+
+
+def since_from_query(request) -> Optional[PageKey]:
+    """
+    Posición del feed de cambios (``since``), o None para empezar desde el inicio.
+
+    Raises:
+        ParseError: Si el cursor es inválido.
+    """
+    since = request.query_params.get(SINCE_PARAM)
+    return decode_cursor(since, CHANGED_AT_KEY) if since else None
+
+
+def page_request_from_query(request, key: CursorKey) -> PageRequest:
+    """
+    Construye el ``PageRequest`` a partir de los query params.
+
+    ``key`` describe la clave keyset de la colección (p.ej. ``CREATED_AT_KEY``).
+
+    Raises:
+        ParseError: Si ``page[size]`` no es un entero positivo, si el cursor
+            es inválido o si se envían ``page[after]`` y ``page[before]`` a la vez.
+    """
+    params = request.query_params
+    size = page_size_from_query(request)
+
+    after = params.get(AFTER_PARAM)
+    before = params.get(BEFORE_PARAM)
+    if after and before:
+        raise ParseError(f"{AFTER_PARAM} y {BEFORE_PARAM} son excluyentes")
+
+    return PageRequest(
+        size=size,
+        after=decode_cursor(after, key) if after else None,
+        before=decode_cursor(before, key) if before else None,
+    )
+
+
+def pagination_links(request, page: Page, page_request: PageRequest) -> Dict[str, Optional[str]]:
+    """
+    Enlaces JSON:API de paginación (``self``, ``next``, ``prev``).
+
+    Los enlaces son relativos al path del request y conservan los demás
+    query params (p.ej. filtros).
+    """
+    base_params = [
+        (k, v) for k, values in request.query_params.lists() for v in values
+        if k not in (SIZE_PARAM, AFTER_PARAM, BEFORE_PARAM)
+    ]
+    base_params.append((SIZE_PARAM, str(page_request.size)))
+
+    def link(extra: Optional[tuple] = None) -> str:
+        params = base_params + ([extra] if extra else [])
+        return f"{request.path}?{urlencode(params)}"
+
+    self_cursor = None
+    if page_request.after is not None:
+        self_cursor = (AFTER_PARAM, encode_cursor(page_request.after))
+    elif page_request.before is not None:
+        self_cursor = (BEFORE_PARAM, encode_cursor(page_request.before))
+
+    return {
+        "self": link(self_cursor),
+        "next": link((AFTER_PARAM, encode_cursor(page.next_key))) if page.next_key else None,
+        "prev": link((BEFORE_PARAM, encode_cursor(page.prev_key))) if page.prev_key else None,
+    }
+
+
+def change_feed_links(
+    request, since: Optional[PageKey], feed: ChangeFeed, size: int,
+) -> Dict[str, Optional[str]]:
+    """
+    Enlaces del feed de cambios: ``self`` y ``next``.
+
+    ``next`` trae la nueva posición y siempre está presente (salvo con el
+    feed vacío): el cliente lo guarda y lo vuelve a pedir para recibir los
+    cambios posteriores.
+    """
+    def link(cursor: Optional[PageKey]) -> str:
+        params = [(SIZE_PARAM, str(size))]
+        if cursor is not None:
+            params.insert(0, (SINCE_PARAM, encode_cursor(cursor)))
+        return f"{request.path}?{urlencode(params)}"
+
+    return {
+        "self": link(since),
+        "next": link(feed.cursor) if feed.cursor is not None else None,
+    }
@@ -0,0 +1,133 @@
+"""
+users/renderers.py
+
+Renderers y parsers DRF del servicio.
+
+- ``FastJSONRenderer`` / ``JSONAPIRenderer``: serializan los envelopes
+  JSON:API con ``orjson`` si está instalado (varias veces más rápido que
+  ``json``), o con la librería estándar si no. Ambos caminos serializan
+  ``datetime`` (ISO 8601) y ``UUID`` sin conversión previa, y producen el
+  mismo JSON compacto en UTF-8.
+- ``FastJSONParser`` / ``JSONAPIParser``: parsean los cuerpos JSON con el
+  mismo backend.
+
+Los renderers de exportación (NDJSON / CSV) solo participan en la content
+negotiation de ``GET /api/users/export/``: el cuerpo de la exportación se
+genera en streaming (``StreamingHttpResponse``) y no pasa por ``render``.
+Las respuestas de error de ese endpoint sí se renderizan, como JSON:API y
+con ``Content-Type: application/json`` (no el tipo negociado).
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any
+
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from .infrastructure.request_profile import phase
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Tipos que ni ``orjson`` ni ``json`` serializan por sí mismos."""
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return _default(obj)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serializa ``data`` a JSON compacto (UTF-8)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_default, option=option)
+    return json.dumps(
+        data,
+        default=_stdlib_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    """Parsea JSON (UTF-8)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` respaldado por ``orjson`` (o stdlib)."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        with phase("serialization"):
+            return dumps(data, indent=bool(self.get_indent(accepted_media_type, renderer_context or {})))
+
+
+class JSONAPIRenderer(FastJSONRenderer):
+    media_type = "application/vnd.api+json"
+    format = "vnd.api+json"
+
+
+class FastJSONParser(JSONParser):
+    """``JSONParser`` respaldado por ``orjson`` (o stdlib)."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class JSONAPIParser(FastJSONParser):
+    media_type = "application/vnd.api+json"
+    renderer_class = JSONAPIRenderer
+
+
+class _ExportRenderer(FastJSONRenderer):
+    """Base de los renderers de exportación: errores como JSON."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get("response")
+        if response is not None and response.exception:
+            # DRF ya fijó el tipo negociado (NDJSON / CSV); el cuerpo es JSON
+            response["Content-Type"] = FastJSONRenderer.media_type
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class NDJSONRenderer(_ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class CSVRenderer(_ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
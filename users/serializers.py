@@ -30,7 +30,7 @@ Transforma datos entre JSON (HTTP) y objetos Python.
 
         # NO incluimos password en el output por seguridad
 
-    class DeactivateUserSerializer(serializers.Serializer):
+    class DeactivateUserSerializer(InputSerializer):
         '''Serializer para desactivar un usuario'''
         reason = serializers.CharField(max_length=200, required=True)
 
@@ -41,8 +41,19 @@ Transforma datos entre JSON (HTTP) y objetos Python.
 import re
 from rest_framework import serializers
 
+from .infrastructure.request_profile import phase
+from .lookup import lookup_max
 
-class RegisterUserSerializer(serializers.Serializer):
+
+class InputSerializer(serializers.Serializer):
+    """Base de los serializers de INPUT: su validación cuenta como fase ``validation``."""
+
+    def is_valid(self, *, raise_exception=False):
+        with phase("validation"):
+            return super().is_valid(raise_exception=raise_exception)
+
+
+class RegisterUserSerializer(InputSerializer):
     """Serializer para registrar un nuevo usuario (INPUT).
 
     SEGURIDAD: No se acepta campo 'role'. Todo registro público
@@ -115,7 +126,7 @@ class RegisterUserSerializer(serializers.Serializer):
         return value
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginSerializer(InputSerializer):
     """Serializer para login de usuario (INPUT)."""
     email = serializers.EmailField(
         required=True,
@@ -162,7 +173,7 @@ class AuthResponseSerializer(serializers.Serializer):
     user = AuthUserSerializer()
 
 
-class UpdateUserSerializer(serializers.Serializer):
+class UpdateUserSerializer(InputSerializer):
     """Serializer para actualizar el email de un usuario (PATCH /api/users/{id}/)."""
     email = serializers.EmailField(
         required=True,
@@ -175,7 +186,7 @@ class UpdateUserSerializer(serializers.Serializer):
     )
 
 
-class DeactivateUserSerializer(serializers.Serializer):
+class DeactivateUserSerializer(InputSerializer):
     """Serializer para desactivar un usuario (POST /api/users/{id}/deactivate/)."""
     reason = serializers.CharField(
         max_length=200,
@@ -186,3 +197,26 @@ class DeactivateUserSerializer(serializers.Serializer):
             "max_length": "Reason must not exceed 200 characters.",
         },
     )
+
+
+class ResolveUsersSerializer(InputSerializer):
+    """Serializer para resolver usuarios por lote (POST /api/users/lookup/)."""
+    ids = serializers.ListField(
+        child=serializers.CharField(max_length=64),
+        required=False,
+        default=list,
+    )
+    emails = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        required=False,
+        default=list,
+    )
+
+    def validate(self, attrs):
+        """Al menos un valor y como máximo ``USERS_LOOKUP_MAX`` en total."""
+        total = len(attrs["ids"]) + len(attrs["emails"])
+        if total == 0:
+            raise serializers.ValidationError("At least one of 'ids' or 'emails' is required.")
+        if total > lookup_max():
+            raise serializers.ValidationError(f"At most {lookup_max()} ids and emails can be resolved at once.")
+        return attrs
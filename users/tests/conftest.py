@@ -0,0 +1,17 @@
+"""
+Fixtures compartidas por la suite.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(settings):
+    """PBKDF2 con pocas iteraciones: el costo de producción haría la suite lenta."""
+    settings.PASSWORD_HASH_ITERATIONS = 1000
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings):
+    """Superar el ``@query_budget`` de una vista hace fallar el test (en producción solo avisa)."""
+    settings.USERS_QUERY_BUDGET_MODE = "raise"
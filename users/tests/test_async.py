@@ -0,0 +1,141 @@
+"""
+Tests del camino async (repositorio, casos de uso y vistas ASGI).
+
+Las vistas async se invocan directamente con ``AsyncRequestFactory`` y se
+comparan con la respuesta del viewset síncrono para el mismo request.
+"""
+
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from rest_framework.test import APIClient
+
+from users.application.async_use_cases import AsyncGetUserUseCase, AsyncGetUsersByRoleUseCase
+from users.application.use_cases import GetUsersByRoleCommand, _generate_tokens
+from users.async_views import AsyncUserDetailView, AsyncUserListView, AsyncUsersByRoleView
+from users.domain.entities import UserRole
+from users.domain.exceptions import InvalidRole, UserNotFound
+from users.domain.factories import UserFactory
+from users.domain.pagination import PageRequest
+from users.infrastructure.async_repository import AsyncDjangoUserRepository
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User
+
+
+@pytest.fixture
+def users(db):
+    User.objects.all().delete()
+    repository = DjangoUserRepository()
+    return [
+        repository.save(UserFactory.create(
+            email=f"async{i}@test.com",
+            username=f"async{i}",
+            password="Password123",
+            role=UserRole.ADMIN if i % 2 else UserRole.USER,
+        ))
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def access_token(users):
+    return _generate_tokens(users[0])["access"]
+
+
+def _call(view, path, token=None, method="get", **kwargs):
+    factory = AsyncRequestFactory()
+    request = getattr(factory, method)(path)
+    if token:
+        request.COOKIES["access_token"] = token
+    response = async_to_sync(view.as_view())(request, **kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def _data(response):
+    return json.loads(response.content)["data"]
+
+
+class TestAsyncRepository:
+
+    def test_lookups(self, users):
+        repository = AsyncDjangoUserRepository()
+
+        found = async_to_sync(repository.find_by_id)(users[1].id)
+        by_email = async_to_sync(repository.find_by_email)("ASYNC2@test.com")
+
+        assert found.email == "async1@test.com" and found.role == UserRole.ADMIN
+        assert by_email.username == "async2"
+        assert async_to_sync(repository.exists_by_email)("async3@test.com") is True
+        assert async_to_sync(repository.find_by_email)("nope@test.com") is None
+
+    def test_pages_match_sync_repository(self, users):
+        page_request = PageRequest(size=2)
+
+        sync_page = DjangoUserRepository().find_page(page_request)
+        async_page = async_to_sync(AsyncDjangoUserRepository().find_page)(page_request)
+
+        assert [u.id for u in async_page.items] == [u.id for u in sync_page.items]
+        assert async_page.next_key == sync_page.next_key
+
+
+class TestAsyncUseCases:
+
+    def test_get_user_not_found(self, users):
+        use_case = AsyncGetUserUseCase(AsyncDjangoUserRepository())
+        with pytest.raises(UserNotFound):
+            async_to_sync(use_case.execute)("00000000-0000-0000-0000-000000000000")
+
+    def test_by_role_validates_role(self, users):
+        use_case = AsyncGetUsersByRoleUseCase(AsyncDjangoUserRepository())
+
+        page = async_to_sync(use_case.execute_page)(GetUsersByRoleCommand(role="admin"), PageRequest(size=10))
+
+        assert [u.username for u in page.items] == ["async1", "async3"]
+        with pytest.raises(InvalidRole):
+            async_to_sync(use_case.execute_page)(GetUsersByRoleCommand(role="ROOT"), PageRequest(size=10))
+
+
+class TestAsyncViews:
+
+    def test_list_matches_sync_viewset(self, users, access_token):
+        client = APIClient()
+        client.cookies["access_token"] = access_token
+        sync_response = client.get("/api/users/", {"page[size]": 2})
+
+        response = _call(AsyncUserListView, "/api/users/?page%5Bsize%5D=2", access_token)
+
+        assert response.status_code == 200
+        body, sync_body = json.loads(response.content), sync_response.json()
+        assert body["data"] == sync_body["data"]
+        assert body["links"] == sync_body["links"]
+
+    def test_detail_and_not_found(self, users, access_token):
+        response = _call(AsyncUserDetailView, "/api/users/x/", access_token, pk=str(users[2].id))
+        missing = _call(
+            AsyncUserDetailView, "/api/users/x/", access_token, pk="00000000-0000-0000-0000-000000000000",
+        )
+
+        assert _data(response)["attributes"]["email"] == "async2@test.com"
+        assert missing.status_code == 404
+        assert json.loads(missing.content)["errors"][0]["code"] == "user_not_found"
+
+    def test_by_role(self, users, access_token):
+        response = _call(AsyncUsersByRoleView, "/api/auth/by-role/ADMIN/", access_token, role="ADMIN")
+
+        assert [r["attributes"]["username"] for r in _data(response)] == ["async1", "async3"]
+
+    def test_requires_authentication(self, users):
+        response = _call(AsyncUserListView, "/api/users/")
+
+        assert response.status_code == 401
+        assert response["WWW-Authenticate"] == "Bearer"
+
+    def test_writes_are_delegated_to_sync_viewset(self, users, access_token):
+        response = _call(AsyncUserDetailView, "/api/users/x/", access_token, method="delete", pk=str(users[4].id))
+
+        assert response.status_code == 204
+        assert not User.objects.filter(pk=users[4].id).exists()
@@ -0,0 +1,156 @@
+"""
+Tests del feed de cambios (GET /api/users/changes/).
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.factories import UserFactory
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User as DjangoUser, UserTombstone
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(settings):
+    settings.USERS_CHANGES_SETTLE_SECONDS = 0
+
+
+def _drain(repository, since=None, limit=50):
+    """Recorre el feed completo desde ``since``; devuelve (cambios, cursor)."""
+    changes = []
+    while True:
+        feed = repository.find_changes(since, limit)
+        changes += feed.changes
+        since = feed.cursor
+        if not feed.has_more:
+            return changes, since
+
+
+@pytest.mark.django_db
+class TestRepositoryChanges:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+        self.users = [
+            self.repository.save(UserFactory.create(f"feed{i}@test.com", f"feeduser{i}", "Password123"))
+            for i in range(3)
+        ]
+
+    def test_full_sync_in_change_order(self):
+        changes, cursor = _drain(self.repository, limit=1)
+
+        ids = [c.user_id for c in changes]
+        assert set(u.id for u in self.users) <= set(ids)
+        assert len(ids) == DjangoUser.objects.count() == len(set(ids))
+        keys = [(c.changed_at, c.user_id) for c in changes]
+        assert keys == sorted(keys)
+        assert cursor == (changes[-1].changed_at.isoformat(), changes[-1].user_id)
+
+    def test_only_changes_after_cursor(self):
+        _, cursor = _drain(self.repository)
+
+        user = self.repository.find_by_id(self.users[1].id)
+        user.change_email("feed-changed@test.com")
+        self.repository.save(user)
+        feed = self.repository.find_changes(cursor, 50)
+
+        assert [c.user_id for c in feed.changes] == [user.id]
+        assert feed.changes[0].user.email == "feed-changed@test.com"
+        assert not feed.has_more
+
+    def test_delete_leaves_tombstone_in_feed(self):
+        _, cursor = _drain(self.repository)
+
+        self.repository.delete(self.users[0].id)
+        feed = self.repository.find_changes(cursor, 50)
+
+        assert len(feed.changes) == 1
+        assert feed.changes[0].deleted and feed.changes[0].user_id == self.users[0].id
+
+    def test_deleting_missing_user_leaves_no_tombstone(self):
+        self.repository.delete("00000000-0000-0000-0000-000000000000")
+
+        assert not UserTombstone.objects.exists()
+
+    def test_empty_feed_keeps_cursor(self):
+        _, cursor = _drain(self.repository)
+
+        feed = self.repository.find_changes(cursor, 50)
+
+        assert feed.changes == [] and feed.cursor == cursor and not feed.has_more
+
+    def test_recent_changes_wait_for_settle_window(self, settings):
+        settings.USERS_CHANGES_SETTLE_SECONDS = 60
+        DjangoUser.objects.exclude(pk=self.users[2].id).update(updated_at=timezone.now() - timedelta(minutes=5))
+
+        changes, _ = _drain(self.repository)
+
+        assert self.users[2].id not in [c.user_id for c in changes]
+
+    def test_two_queries_per_call(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.repository.find_changes(None, 2)
+
+        assert len(ctx.captured_queries) == 2
+
+
+@pytest.mark.django_db
+class TestChangesEndpoint:
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        self.repository = DjangoUserRepository()
+        self.user = self.repository.save(UserFactory.create("feedapi@test.com", "feedapiuser", "Password123"))
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    def _sync(self, url="/api/users/changes/?page[size]=1"):
+        data = []
+        while True:
+            body = self.client.get(url).json()
+            data += body["data"]
+            url = body["links"]["next"]
+            if not body["meta"]["has_more"]:
+                return data, body
+
+    def test_follows_next_link_until_caught_up(self):
+        data, body = self._sync()
+
+        assert self.user.id in [r["id"] for r in data]
+        assert body["meta"]["cursor"] is not None
+        assert body["links"]["next"].startswith("/api/users/changes/?since=")
+
+    def test_upserts_and_deletions(self):
+        _, body = self._sync()
+        other = self.repository.save(UserFactory.create("feedapi2@test.com", "feedapiuser2", "Password123"))
+        gone = self.repository.save(UserFactory.create("feedapi3@test.com", "feedapiuser3", "Password123"))
+        self.repository.delete(gone.id)
+
+        response = self.client.get("/api/users/changes/", {"since": body["meta"]["cursor"]})
+        data = response.json()["data"]
+
+        assert response.status_code == 200
+        assert [r["id"] for r in data] == [other.id, gone.id]
+        assert data[0]["attributes"]["email"] == "feedapi2@test.com"
+        assert data[0]["meta"]["deleted"] is False and "changed_at" in data[0]["meta"]
+        assert data[1] == {
+            "type": "users", "id": gone.id,
+            "meta": {"deleted": True, "changed_at": data[1]["meta"]["changed_at"]},
+        }
+
+    def test_invalid_cursor_is_bad_request(self):
+        response = self.client.get("/api/users/changes/?since=not-a-cursor")
+
+        assert response.status_code == 400
+
+    def test_requires_authentication(self):
+        response = APIClient().get("/api/users/changes/")
+
+        assert response.status_code == 401
@@ -0,0 +1,104 @@
+"""
+Tests de los GET condicionales (ETag / If-None-Match).
+"""
+
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.async_views import AsyncUserListView
+from users.conditional import weak_etag
+from users.domain.entities import UserRole
+from users.domain.factories import UserFactory
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        self.repository = DjangoUserRepository()
+        self.user = self.repository.save(UserFactory.create("etag@test.com", "etaguser", "Password123"))
+        self.other = self.repository.save(
+            UserFactory.create("etag2@test.com", "etaguser2", "Password123", role=UserRole.ADMIN)
+        )
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    @pytest.mark.parametrize("path", ["/api/users/", "/api/auth/me/", "/api/auth/by-role/ADMIN/", "detail"])
+    def test_revalidation_returns_304_without_body(self, path):
+        path = f"/api/users/{self.other.id}/" if path == "detail" else path
+        first = self.client.get(path)
+        etag = first["ETag"]
+
+        second = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        assert first.status_code == 200 and etag.startswith('W/"')
+        assert first["Cache-Control"] == "private, no-cache"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second["ETag"] == etag
+
+    def test_detail_etag_changes_after_update(self):
+        path = f"/api/users/{self.other.id}/"
+        etag = self.client.get(path)["ETag"]
+
+        user = self.repository.find_by_id(self.other.id)
+        user.change_email("changed@test.com")
+        self.repository.save(user)
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_collection_etag_changes_when_a_user_is_added_or_removed(self):
+        etag = self.client.get("/api/users/")["ETag"]
+
+        self.repository.delete(self.other.id)
+        response = self.client.get("/api/users/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_collection_etag_depends_on_page(self):
+        first = self.client.get("/api/users/", {"page[size]": 1})["ETag"]
+        second = self.client.get("/api/users/", {"page[size]": 2})["ETag"]
+
+        assert first != second
+
+    def test_304_skips_loading_users(self):
+        etag = self.client.get("/api/users/")["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/users/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        # El principal sale de la caché: solo la agregación COUNT/MAX, no se carga la página
+        assert len(selects) == 1
+        assert "MAX" in selects[0]
+
+    def test_errors_are_not_conditional(self):
+        response = self.client.get("/api/users/not-a-uuid/", HTTP_IF_NONE_MATCH=weak_etag("x"))
+
+        assert response.status_code != 304
+        assert not response.has_header("ETag")
+
+    def test_async_view_matches_sync_etag(self):
+        sync_etag = self.client.get("/api/users/")["ETag"]
+        request = AsyncRequestFactory().get("/api/users/", headers={"If-None-Match": sync_etag})
+        request.COOKIES["access_token"] = _generate_tokens(self.user)["access"]
+
+        response = async_to_sync(AsyncUserListView.as_view())(request)
+
+        assert response.status_code == 304
+        assert response["ETag"] == sync_etag
+        assert json.loads(self.client.get("/api/users/").content)["data"]
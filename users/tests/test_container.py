@@ -0,0 +1,114 @@
+"""
+Tests del contenedor de dependencias: singletons por proceso, reemplazos en
+tests y ciclo de vida.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from rest_framework.test import APIClient
+
+from users.container import Container, get_container
+from users.infrastructure.outbox import OutboxEventPublisher
+
+
+class TestSingletons:
+
+    def setup_method(self):
+        self.container = Container()
+
+    def test_dependencies_are_built_once(self):
+        assert self.container.repository is self.container.repository
+        assert self.container.event_publisher is self.container.event_publisher
+        assert self.container.register_user is self.container.register_user
+
+    def test_use_cases_share_infrastructure(self):
+        register = self.container.register_user
+        deactivate = self.container.deactivate_user
+
+        assert register.repository is deactivate.repository is self.container.repository
+        assert register.event_publisher is deactivate.event_publisher is self.container.event_publisher
+        assert self.container.async_repository._sync is self.container.repository
+
+    def test_reset_rebuilds_on_next_access(self):
+        repository = self.container.repository
+
+        self.container.reset()
+
+        assert self.container.repository is not repository
+
+    def test_delivery_mode_change_resets_process_container(self, settings):
+        settings.EVENT_DELIVERY_MODE = "direct"
+        direct = get_container().event_publisher
+
+        settings.EVENT_DELIVERY_MODE = "outbox"
+
+        assert get_container().event_publisher is not direct
+        assert isinstance(get_container().event_publisher.inner, OutboxEventPublisher)
+
+
+class TestOverride:
+
+    def setup_method(self):
+        self.container = Container()
+
+    def test_override_rewires_dependents_and_restores(self):
+        original = self.container.repository
+        fake = Mock()
+
+        with self.container.override(repository=fake):
+            assert self.container.get_user.repository is fake
+            assert self.container.async_repository._sync is fake
+
+        assert self.container.repository is original
+        assert self.container.get_user.repository is original
+
+    def test_unknown_dependency_is_rejected(self):
+        with pytest.raises(AttributeError):
+            with self.container.override(mailer=Mock()):
+                pass
+
+    @pytest.mark.django_db
+    def test_views_use_overridden_publisher(self):
+        publisher = Mock()
+
+        with get_container().override(event_publisher=publisher):
+            response = APIClient().post(
+                "/api/auth/",
+                {"email": "wired@test.com", "username": "wireduser", "password": "Password123"},
+                format="json",
+            )
+
+        assert response.status_code == 201
+        publisher.publish.assert_called_once()
+        assert publisher.publish.call_args.args[1] == "user.created"
+
+
+class TestLifecycle:
+
+    def test_shutdown_closes_shared_resources(self):
+        container = Container()
+        repository = container.repository
+
+        with patch("users.container.close_all_pools") as close_pools, \
+                patch("users.container.shutdown_hashing_pool") as shutdown_hashing, \
+                patch("users.container.connections") as connections:
+            container.shutdown()
+
+        close_pools.assert_called_once()
+        shutdown_hashing.assert_called_once()
+        connections.all.assert_called_once_with(initialized_only=True)
+        assert container.repository is not repository
+
+    def test_post_fork_discards_inherited_connections(self):
+        container = Container()
+        repository = container.repository
+        inherited = Mock()
+
+        with patch("users.container.connections") as connections:
+            connections.all.return_value = [inherited]
+            container.post_fork()
+
+        assert inherited.connection is None
+        inherited.close.assert_not_called()
+        assert container.repository is not repository
@@ -0,0 +1,79 @@
+"""
+Tests de la configuración de conexiones a la base de datos y su reporte.
+El pool de psycopg se sustituye por un mock con la misma ``get_stats()``.
+"""
+
+import runpy
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from rest_framework.test import APIClient
+
+from users.infrastructure.db_pool import (
+    MODE_PER_REQUEST,
+    MODE_PERSISTENT,
+    MODE_POOL,
+    connection_stats,
+)
+
+SETTINGS_PATH = Path(__file__).resolve().parents[2] / "user_service" / "settings.py"
+
+
+def _load_settings(monkeypatch, **env):
+    monkeypatch.setenv("POSTGRES_DB", "users_db")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return runpy.run_path(str(SETTINGS_PATH))
+
+
+class TestDatabaseSettings:
+
+    def test_postgres_uses_persistent_connections_with_health_checks(self, monkeypatch):
+        monkeypatch.delenv("POSTGRES_POOL", raising=False)
+        default = _load_settings(monkeypatch)["DATABASES"]["default"]
+
+        assert default["CONN_MAX_AGE"] == 60
+        assert default["CONN_HEALTH_CHECKS"] is True
+        assert "pool" not in default.get("OPTIONS", {})
+
+    def test_pool_replaces_persistent_connections(self, monkeypatch):
+        pytest.importorskip("psycopg_pool")
+        default = _load_settings(monkeypatch, POSTGRES_POOL="true", POSTGRES_POOL_MAX_SIZE="8")["DATABASES"]["default"]
+
+        assert default["CONN_MAX_AGE"] == 0
+        assert default["OPTIONS"]["pool"]["max_size"] == 8
+        assert callable(default["OPTIONS"]["pool"]["check"])
+
+
+class TestConnectionStats:
+
+    def _connection(self, pool=None, **settings_dict):
+        return SimpleNamespace(vendor="postgresql", settings_dict=settings_dict, pool=pool)
+
+    def test_modes(self):
+        assert connection_stats(self._connection(CONN_MAX_AGE=0))["mode"] == MODE_PER_REQUEST
+        assert connection_stats(self._connection(CONN_MAX_AGE=60))["mode"] == MODE_PERSISTENT
+
+    def test_pool_utilization(self):
+        pool = MagicMock()
+        pool.get_stats.return_value = {
+            "pool_min": 2, "pool_max": 4, "pool_size": 3, "pool_available": 1,
+            "requests_waiting": 0, "requests_errors": 1,
+        }
+
+        stats = connection_stats(self._connection(pool, CONN_MAX_AGE=0, OPTIONS={"pool": {"max_size": 4}}))
+
+        assert stats["mode"] == MODE_POOL
+        assert stats["in_use"] == 2 and stats["utilization"] == 0.5
+        assert stats["max_size"] == 4 and stats["timeouts"] == 1
+
+
+@pytest.mark.django_db
+def test_health_reports_database_connections():
+    response = APIClient().get("/api/health/")
+
+    database = response.json()["data"]["pools"]["database"]
+    assert response.status_code == 200
+    assert database["default"]["mode"] in (MODE_PER_REQUEST, MODE_PERSISTENT, MODE_POOL)
@@ -0,0 +1,155 @@
+"""
+Tests del router primario/réplica (read-your-writes).
+
+El primario es la base de datos de test y la réplica un archivo SQLite
+aparte con el mismo esquema: una fila que solo existe en uno de los dos
+indica de dónde se leyó. Los tests son transaccionales porque dentro de
+``atomic`` (el envoltorio de los tests normales) el router siempre usa el
+primario.
+"""
+
+import copy
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.factories import UserFactory
+from users.infrastructure.db_router import (
+    REPLICA_ALIAS,
+    PrimaryReplicaRouter,
+    db_routing_scope,
+    reset_routing_stats,
+    routing_stats,
+)
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+from users.middleware import ReadYourWritesMiddleware
+from users.models import OutboxEvent, User as DjangoUser, UserTombstone
+
+
+@pytest.fixture(scope="module")
+def replica_database(tmp_path_factory, django_db_setup, django_db_blocker):
+    """
+    Alias ``replica`` apuntando a un segundo archivo SQLite.
+
+    Es de módulo para existir antes de que pytest-django valide los
+    ``databases`` de cada test.
+    """
+    replica_settings = copy.deepcopy(connections[DEFAULT_DB_ALIAS].settings_dict)
+    replica_settings["NAME"] = str(tmp_path_factory.mktemp("replica") / "replica.sqlite3")
+    connections.settings[REPLICA_ALIAS] = replica_settings
+    with django_db_blocker.unblock(), connections[REPLICA_ALIAS].schema_editor() as editor:
+        editor.create_model(DjangoUser)
+        editor.create_model(UserTombstone)
+    yield
+    connections[REPLICA_ALIAS].close()
+    del connections[REPLICA_ALIAS]
+    del connections.settings[REPLICA_ALIAS]
+
+
+@pytest.fixture
+def replica(replica_database, settings):
+    settings.USERS_READ_YOUR_WRITES_SECONDS = 30
+    reset_routing_stats()
+    get_principal_cache().clear()
+    yield
+    # El flush de pytest-django respeta allow_migrate, que excluye la réplica
+    DjangoUser.objects.using(REPLICA_ALIAS).all().delete()
+
+
+def _replicate(*users):
+    """Copia las filas del primario a la réplica (replicación simulada)."""
+    rows = list(DjangoUser.objects.using(DEFAULT_DB_ALIAS).filter(pk__in=[u.id for u in users]))
+    DjangoUser.objects.using(REPLICA_ALIAS).bulk_create(rows)
+
+
+def _create(email, username):
+    return DjangoUserRepository().save(UserFactory.create(email, username, "Password123"))
+
+
+@pytest.mark.django_db(transaction=True, databases=[DEFAULT_DB_ALIAS, REPLICA_ALIAS])
+@pytest.mark.usefixtures("replica")
+class TestRouter:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+
+    def test_request_reads_go_to_replica(self):
+        user = _create("replicated@test.com", "replicated")
+        _replicate(user)
+        primary_only = _create("primary@test.com", "primaryonly")
+
+        with db_routing_scope():
+            assert self.repository.find_by_id(user.id) is not None
+            assert self.repository.find_by_id(primary_only.id) is None
+            assert not self.repository.exists_by_email("primary@test.com")
+
+        assert routing_stats()["replica"] == 3
+
+    def test_reads_after_a_write_stick_to_primary(self):
+        with db_routing_scope() as state:
+            user = _create("sticky@test.com", "stickyuser")
+            found = self.repository.find_by_id(user.id)
+
+        assert state.wrote and found is not None
+        assert routing_stats()["primary_pinned"] >= 1 and routing_stats()["replica"] == 0
+
+    def test_reads_inside_transaction_use_primary(self):
+        user = _create("tx@test.com", "txuser")
+
+        with db_routing_scope(), transaction.atomic():
+            assert self.repository.find_by_id(user.id) is not None
+
+        assert routing_stats()["primary_transaction"] == 1
+
+    def test_reads_outside_requests_use_primary(self):
+        user = _create("cmd@test.com", "cmduser")
+
+        assert self.repository.find_by_id(user.id) is not None
+        assert routing_stats()["primary_unscoped"] == 1
+
+    def test_only_user_models_are_routed(self):
+        router = PrimaryReplicaRouter()
+
+        with db_routing_scope():
+            assert router.db_for_read(OutboxEvent) is None
+            assert router.db_for_read(DjangoUser) == REPLICA_ALIAS
+        assert router.allow_migrate(REPLICA_ALIAS, "users") is False
+
+
+@pytest.mark.django_db(transaction=True, databases=[DEFAULT_DB_ALIAS, REPLICA_ALIAS])
+@pytest.mark.usefixtures("replica")
+class TestReadYourWritesCookie:
+
+    @pytest.fixture(autouse=True)
+    def _user(self, replica):
+        self.user = _create("ryw@test.com", "rywuser")
+        _replicate(self.user)
+        self.token = _generate_tokens(self.user)["access"]
+
+    def _client(self):
+        client = APIClient()
+        client.cookies["access_token"] = self.token
+        return client
+
+    def test_writer_reads_own_write_while_others_see_replica(self):
+        writer = self._client()
+
+        patched = writer.patch(f"/api/users/{self.user.id}/", {"email": "ryw-new@test.com"}, format="json")
+        own_read = writer.get(f"/api/users/{self.user.id}/")
+        other_read = self._client().get(f"/api/users/{self.user.id}/")
+
+        assert patched.status_code == 200
+        assert ReadYourWritesMiddleware.PRIMARY_COOKIE in patched.cookies
+        assert own_read.json()["data"]["attributes"]["email"] == "ryw-new@test.com"
+        # La réplica (sin replicación real en el test) todavía tiene el email anterior
+        assert other_read.json()["data"]["attributes"]["email"] == "ryw@test.com"
+
+    def test_reads_do_not_set_cookie(self):
+        response = self._client().get(f"/api/users/{self.user.id}/")
+
+        assert response.status_code == 200
+        assert ReadYourWritesMiddleware.PRIMARY_COOKIE not in response.cookies
+        assert routing_stats()["replica"] >= 1
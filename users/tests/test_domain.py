@@ -6,10 +6,12 @@ Prueban reglas de negocio, entidades, factories y excepciones.
 import pytest
 from datetime import datetime
 
-from users.domain.entities import User, UserRole
+from users.domain.entities import User, UserRole, parse_role
 from users.domain.factories import UserFactory
+from users.domain.password_hasher import get_password_hasher, is_legacy_sha256
 from users.domain.exceptions import (
     InvalidEmail,
+    InvalidRole,
     InvalidUsername,
     InvalidUserData,
     UserAlreadyInactive,
@@ -187,6 +189,27 @@ class TestUserEntity:
         assert len(events) == 0  # No se generaron eventos
         assert user.email == "test@example.com"
 
+    def test_deactivate_and_change_email_revoke_tokens(self):
+        """Desactivar o cambiar el email incrementa token_version."""
+        user = User(
+            id="123",
+            email="old@example.com",
+            username="testuser",
+            password_hash="hash",
+            is_active=True,
+            role=UserRole.USER,
+            created_at=datetime.now()
+        )
+
+        user.change_email("test@example.com")
+        assert user.token_version == 1
+
+        user.change_email("test@example.com")  # Idempotente: no revoca
+        assert user.token_version == 1
+
+        user.deactivate()
+        assert user.token_version == 2
+
     def test_multiple_operations_generate_multiple_events(self):
         """Múltiples operaciones generan múltiples eventos."""
         user = User(
@@ -229,6 +252,59 @@ class TestUserEntity:
         events = user.collect_domain_events()
         assert len(events) == 0
 
+    def test_tracks_changed_fields_after_mark_clean(self):
+        """Tras mark_clean solo se registran los campos realmente modificados."""
+        user = User(
+            id="123",
+            email="test@example.com",
+            username="testuser",
+            password_hash="hash",
+            is_active=True,
+            role=UserRole.USER,
+            created_at=datetime.now()
+        )
+        user.mark_clean()
+
+        user.deactivate()
+        user.username = "testuser"  # mismo valor: no cuenta como cambio
+
+        assert user.dirty_fields() == {"is_active", "token_version"}
+
+    def test_untracked_user_reports_all_fields_dirty(self):
+        """Una entidad construida a mano no tiene seguimiento de cambios."""
+        user = User.create(email="test@example.com", username="testuser", password_hash="hash")
+
+        assert not user.is_tracking_changes()
+        assert {"email", "is_active", "role"} <= user.dirty_fields()
+
+    def test_from_persisted_skips_validation_and_starts_clean(self):
+        """La hidratación de filas persistidas no revalida y deja la entidad limpia."""
+        user = User.from_persisted(
+            id="123",
+            email="legacy-without-tld@localhost",  # inválido hoy, aceptado al guardarse
+            username="ab",
+            password_hash="hash",
+            is_active=True,
+            role=UserRole.ADMIN,
+            created_at=datetime.now(),
+            token_version=2,
+            version=5,
+        )
+
+        assert user.is_tracking_changes() and user.dirty_fields() == frozenset()
+        assert (user.token_version, user.version) == (2, 5)
+
+        user.change_email("new@example.com")
+
+        assert user.dirty_fields() == {"email", "token_version"}
+        assert len(user.collect_domain_events()) == 1
+
+    def test_user_has_no_instance_dict(self):
+        """La entidad usa __slots__ (sin __dict__ por instancia)."""
+        user = User.create(email="test@example.com", username="testuser", password_hash="hash")
+
+        assert not hasattr(user, "__dict__")
+
 
 class TestUserFactory:
     """Tests del factory para crear usuarios válidos."""
@@ -244,7 +320,7 @@ class TestUserFactory:
         assert user.email == "test@example.com"
         assert user.username == "testuser"
         assert user.password_hash != "mypassword123"  # Debe estar hasheado
-        assert len(user.password_hash) == 64  # SHA-256 hex = 64 chars
+        assert get_password_hasher().verify("mypassword123", user.password_hash)
         assert user.is_active is True
 
     def test_factory_validates_email_format(self):
@@ -301,19 +377,13 @@ class TestUserFactory:
                 password=""
             )
 
-    def test_factory_hashes_password_with_sha256(self):
-        """El factory hashea el password con SHA-256."""
-        user = UserFactory.create(
-            email="test@example.com",
-            username="testuser",
-            password="mypassword123"
-        )
-
-        # SHA-256 de "mypassword123"
-        import hashlib
-        expected_hash = hashlib.sha256("mypassword123".encode()).hexdigest()
+    def test_factory_hashes_password_with_salted_kdf(self):
+        """El factory usa el hasher registrado (KDF con salt, no SHA-256 legacy)."""
+        first = UserFactory.create(email="a@example.com", username="usera", password="mypassword123")
+        second = UserFactory.create(email="b@example.com", username="userb", password="mypassword123")
 
-        assert user.password_hash == expected_hash
+        assert not is_legacy_sha256(first.password_hash)
+        assert first.password_hash != second.password_hash  # salt distinto
 
     def test_factory_creates_user_with_created_at(self):
         """El factory asigna created_at automáticamente."""
@@ -327,6 +397,24 @@ class TestUserFactory:
         assert user.created_at <= datetime.now()
 
 
+class TestParseRole:
+    """Tests de ``parse_role`` (compartido por casos de uso y vistas)."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("admin", UserRole.ADMIN),
+        (" USER ", UserRole.USER),
+        (UserRole.ADMIN, UserRole.ADMIN),
+        ("", None),
+        (None, None),
+    ])
+    def test_parses_role(self, value, expected):
+        assert parse_role(value) is expected
+
+    def test_unknown_role_raises(self):
+        with pytest.raises(InvalidRole):
+            parse_role("root")
+
+
 class TestDomainEvents:
     """Tests de los eventos de dominio."""
 
@@ -0,0 +1,133 @@
+"""
+Tests de la exportación en streaming (endpoint y comando export_users).
+"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.http import StreamingHttpResponse
+from rest_framework.test import APIClient
+
+from users.domain.factories import UserFactory
+from users.infrastructure import export
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User
+
+
+@pytest.fixture
+def seeded_users(db):
+    User.objects.all().delete()
+    repository = DjangoUserRepository()
+    for i in range(5):
+        repository.save(UserFactory.create(
+            email=f"export{i}@test.com",
+            username=f"export{i}",
+            password="Password123",
+        ))
+    return User.objects.order_by("created_at", "id")
+
+
+def _body(response):
+    return b"".join(response.streaming_content)
+
+
+class TestExportSerializers:
+
+    def test_ndjson_is_chunked(self, monkeypatch):
+        monkeypatch.setattr(export, "_ROWS_PER_CHUNK", 2)
+        rows = [("id", f"e{i}@x.com", f"u{i}", "USER", True, _FakeDate()) for i in range(5)]
+
+        chunks = list(export.iter_ndjson(rows))
+
+        assert len(chunks) == 3
+        lines = "".join(chunks).splitlines()
+        assert [json.loads(line)["email"] for line in lines] == [f"e{i}@x.com" for i in range(5)]
+
+    def test_gzip_stream_round_trip(self):
+        data = [b"hola ", b"mundo"]
+        assert gzip.decompress(b"".join(export.gzip_stream(iter(data)))) == b"hola mundo"
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError):
+            export.export_users("xml")
+
+
+class _FakeDate:
+    def isoformat(self):
+        return "2026-01-01T00:00:00+00:00"
+
+
+class TestExportEndpoint:
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_streams_ndjson_by_default(self, seeded_users):
+        self.client.force_authenticate(user=seeded_users.first())
+
+        response = self.client.get("/api/users/export/")
+
+        assert response.status_code == 200
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "application/x-ndjson"
+        records = [json.loads(line) for line in _body(response).decode().splitlines()]
+        assert [r["email"] for r in records] == [u.email for u in seeded_users]
+        assert set(records[0]) == set(export.EXPORT_FIELDS)
+
+    def test_csv_via_accept_header(self, seeded_users):
+        self.client.force_authenticate(user=seeded_users.first())
+
+        response = self.client.get("/api/users/export/", HTTP_ACCEPT="text/csv")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(_body(response).decode())))
+        assert len(rows) == 5
+        assert "password_hash" not in rows[0]
+
+    def test_gzip_when_accepted(self, seeded_users):
+        self.client.force_authenticate(user=seeded_users.first())
+
+        response = self.client.get("/api/users/export/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert len(gzip.decompress(_body(response)).decode().splitlines()) == 5
+        assert "Accept-Encoding" in response["Vary"]
+
+    @pytest.mark.parametrize("accept", ["text/csv", "application/x-ndjson"])
+    def test_errors_are_json_whatever_format_was_negotiated(self, seeded_users, accept):
+        response = self.client.get("/api/users/export/", HTTP_ACCEPT=accept)
+
+        assert response.status_code == 401
+        assert response["Content-Type"] == "application/json"
+        assert "errors" in json.loads(response.content)
+
+
+class TestExportCommand:
+
+    def test_writes_csv_file(self, seeded_users, tmp_path):
+        target = tmp_path / "users.csv"
+
+        call_command("export_users", "--format", "csv", "--output", str(target), stderr=io.StringIO())
+
+        rows = list(csv.DictReader(target.open()))
+        assert [r["email"] for r in rows] == [u.email for u in seeded_users]
+
+    def test_writes_gzip_file(self, seeded_users, tmp_path):
+        target = tmp_path / "users.ndjson.gz"
+
+        call_command("export_users", "--gzip", "--output", str(target), stderr=io.StringIO())
+
+        with gzip.open(target, "rt") as fh:
+            assert len(fh.readlines()) == 5
+
+    def test_writes_ndjson_to_stdout(self, seeded_users):
+        out = io.StringIO()
+
+        call_command("export_users", stdout=out, stderr=io.StringIO())
+
+        assert len(out.getvalue().splitlines()) == 5
@@ -0,0 +1,103 @@
+"""
+Tests del identity map por request (autenticación + repositorio).
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.factories import UserFactory
+from users.infrastructure.identity_map import IdentityMap, current_identity_map, identity_map_scope
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+
+
+def _user_selects_by_pk(ctx, user_id):
+    """SELECTs sobre la tabla users filtrando por la PK del usuario."""
+    return [
+        q for q in ctx.captured_queries
+        if q["sql"].startswith("SELECT") and 'FROM "users"' in q["sql"]
+        and user_id.replace("-", "") in q["sql"]
+    ]
+
+
+class TestIdentityMap:
+
+    def test_loads_once_per_key(self):
+        identity_map = IdentityMap()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return object()
+
+        first = identity_map.get_or_load("u1", loader)
+        second = identity_map.get_or_load("u1", loader)
+
+        assert first is second and len(calls) == 1
+        assert (identity_map.loads, identity_map.hits) == (1, 1)
+
+    def test_register_keeps_existing_instance(self):
+        identity_map = IdentityMap()
+        original = type("Row", (), {"pk": "u1"})()
+        duplicate = type("Row", (), {"pk": "u1"})()
+
+        identity_map.register(original)
+
+        assert identity_map.register(duplicate) is original
+
+    def test_scope_is_nested_and_reset(self):
+        assert current_identity_map() is None
+        with identity_map_scope() as outer:
+            with identity_map_scope() as inner:
+                assert current_identity_map() is inner
+            assert current_identity_map() is outer
+        assert current_identity_map() is None
+
+
+@pytest.mark.django_db
+class TestRequestScopedLoading:
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        self.user = DjangoUserRepository().save(
+            UserFactory.create("self@test.com", "selfuser", "Password123")
+        )
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    def test_get_self_loads_row_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"/api/users/{self.user.id}/")
+
+        assert response.status_code == 200
+        assert len(_user_selects_by_pk(ctx, self.user.id)) == 1
+
+    def test_patch_self_loads_row_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(
+                f"/api/users/{self.user.id}/", {"email": "new-self@test.com"}, format="json",
+            )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["attributes"]["email"] == "new-self@test.com"
+        assert len(_user_selects_by_pk(ctx, self.user.id)) == 1
+
+    def test_debug_header_reports_saved_queries(self, settings):
+        settings.DEBUG = True
+
+        response = self.client.get(f"/api/users/{self.user.id}/")
+
+        # La fila la carga la autenticación; ETag y find_by_id la reutilizan
+        assert response["X-Identity-Map"] == "loaded=1; saved-queries=2"
+
+    def test_repository_outside_request_queries_database(self):
+        repository = DjangoUserRepository()
+
+        with CaptureQueriesContext(connection) as ctx:
+            repository.find_by_id(self.user.id)
+            repository.find_by_id(self.user.id)
+
+        assert len(_user_selects_by_pk(ctx, self.user.id)) == 2
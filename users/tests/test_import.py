@@ -0,0 +1,218 @@
+"""
+Tests de la importación masiva (ImportUsersUseCase y comando import_users).
+"""
+
+import csv
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from users.application.use_cases import ImportUserRow, ImportUsersCommand, ImportUsersUseCase
+from users.domain.entities import UserRole
+from users.domain.events import UserCreated
+from users.domain.factories import UserFactory
+from users.domain import password_hasher
+from users.domain.password_hasher import get_password_hasher
+from users.infrastructure.outbox import OutboxEventPublisher
+from users.infrastructure.password_hashing import PasswordHashingBusy
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import OutboxEvent, User
+
+
+def _rows(count, start=0):
+    return [
+        ImportUserRow(
+            email=f"bulk{i}@test.com", username=f"bulk{i}", password="Password123", line=i + 2,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+class TestImportUsersUseCase:
+    """Orquestación con repositorio y publicador simulados."""
+
+    def _use_case(self, existing_emails=(), existing_usernames=()):
+        repository = MagicMock()
+        repository.find_existing_emails.return_value = set(existing_emails)
+        repository.find_existing_usernames.return_value = set(existing_usernames)
+
+        def bulk_insert(users):
+            for i, user in enumerate(users):
+                user.id = f"id-{user.username}-{i}"
+            return users
+
+        repository.bulk_insert.side_effect = bulk_insert
+        publisher = MagicMock()
+        return ImportUsersUseCase(repository, publisher), repository, publisher
+
+    def test_inserts_and_publishes_once_per_batch(self):
+        use_case, repository, publisher = self._use_case()
+
+        result = use_case.execute(ImportUsersCommand(rows=iter(_rows(5)), batch_size=2))
+
+        assert result.created == result.events_published == 5
+        assert repository.bulk_insert.call_count == 3
+        assert [len(c.args[0]) for c in publisher.publish_many.call_args_list] == [2, 2, 1]
+        events, routing_key = publisher.publish_many.call_args.args
+        assert routing_key == 'user.created'
+        assert all(isinstance(e, UserCreated) for e in events)
+        publisher.publish.assert_not_called()
+
+    def test_reports_invalid_rows_and_conflicts(self):
+        use_case, _, _ = self._use_case(existing_emails={"bulk1@test.com"})
+        rows = _rows(3) + [
+            ImportUserRow(email="bulk0@test.com", username="other", password="Password123", line=10),
+            ImportUserRow(email="short@test.com", username="short", password="123", line=11),
+            ImportUserRow(email="role@test.com", username="role", password="Password123", role="ROOT", line=12),
+        ]
+
+        result = use_case.execute(ImportUsersCommand(rows=rows))
+
+        assert result.created == 2
+        assert {(e.line, e.code) for e in result.conflicts} == {(3, "email_exists"), (10, "duplicate_in_input")}
+        assert {(e.line, e.code) for e in result.invalid} == {(11, "invalid_user_data"), (12, "invalid_role")}
+
+    def test_hashes_with_executor(self):
+        use_case, repository, _ = self._use_case()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            use_case.executor = executor
+            use_case.execute(ImportUsersCommand(rows=_rows(4)))
+
+        inserted = repository.bulk_insert.call_args.args[0]
+        assert len(inserted) == 4
+        assert all(get_password_hasher().verify("Password123", u.password_hash) for u in inserted)
+
+
+@pytest.mark.django_db
+class TestBulkInsertRepository:
+
+    def test_bulk_insert_is_a_single_insert(self):
+        repository = DjangoUserRepository()
+        users = [UserFactory.create(f"one{i}@test.com", f"one{i}", "Password123") for i in range(10)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            inserted = repository.bulk_insert(users)
+
+        inserts = [q for q in ctx.captured_queries if q["sql"].upper().startswith("INSERT")]
+        assert len(inserts) == 1
+        assert len(inserted) == 10 and all(u.id for u in inserted)
+        assert User.objects.filter(email__startswith="one").count() == 10
+
+    def test_existing_lookups(self):
+        repository = DjangoUserRepository()
+        ImportUsersUseCase(repository, MagicMock()).execute(ImportUsersCommand(rows=_rows(2)))
+
+        assert repository.find_existing_emails(["bulk0@test.com", "nope@test.com"]) == {"bulk0@test.com"}
+        assert repository.find_existing_usernames(["bulk1", "nope"]) == {"bulk1"}
+
+    def test_committed_batches_keep_their_outbox_events(self):
+        repository = DjangoUserRepository()
+        use_case = ImportUsersUseCase(repository, OutboxEventPublisher(), atomic=transaction.atomic)
+        original = repository.bulk_insert
+        calls = []
+
+        def fail_second_batch(users):
+            calls.append(users)
+            if len(calls) == 2:
+                raise RuntimeError("conexión perdida")
+            return original(users)
+
+        repository.bulk_insert = fail_second_batch
+
+        with pytest.raises(RuntimeError):
+            use_case.execute(ImportUsersCommand(rows=_rows(4), batch_size=2))
+
+        assert User.objects.filter(email__startswith="bulk").count() == 2
+        assert OutboxEvent.objects.filter(event_type="user.created").count() == 2
+
+    def test_outbox_publish_many_writes_all_events(self):
+        repository = DjangoUserRepository()
+        use_case = ImportUsersUseCase(repository, OutboxEventPublisher())
+
+        use_case.execute(ImportUsersCommand(rows=_rows(3)))
+
+        assert OutboxEvent.objects.filter(event_type="user.created").count() == 3
+
+
+class TestCopyInsert:
+    """Camino de PostgreSQL (``COPY``); la suite corre en SQLite."""
+
+    def test_copy_columns_cover_every_concrete_field(self):
+        columns = {field.column for field in User._meta.concrete_fields}
+
+        assert set(DjangoUserRepository._COPY_COLUMNS) == columns
+
+    def test_copy_writes_one_csv_line_per_row(self, monkeypatch):
+        raw = MagicMock(spec=["copy_expert"])
+        cursor = MagicMock()
+        cursor.__enter__.return_value.cursor = raw
+        monkeypatch.setattr(connection, "cursor", lambda: cursor)
+        rows = [User(email=f"copy{i}@test.com", username=f"copy{i}", password_hash="hash") for i in range(2)]
+
+        DjangoUserRepository()._copy_insert(rows)
+
+        sql, buffer = raw.copy_expert.call_args.args
+        records = list(csv.reader(io.StringIO(buffer.getvalue())))
+        assert f"({', '.join(DjangoUserRepository._COPY_COLUMNS)})" in sql
+        assert len(records) == 2
+        assert all(len(record) == len(DjangoUserRepository._COPY_COLUMNS) for record in records)
+        assert records[0][DjangoUserRepository._COPY_COLUMNS.index("version")] == "0"
+
+
+@pytest.mark.django_db
+class TestImportUsersCommand:
+
+    def test_imports_csv_and_writes_report(self, tmp_path, settings):
+        settings.EVENT_DELIVERY_MODE = "outbox"
+        source = tmp_path / "tenant.csv"
+        with source.open("w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["email", "username", "password", "role"])
+            writer.writerow(["a@tenant.com", "tenant_a", "Password123", "ADMIN"])
+            writer.writerow(["b@tenant.com", "tenant_b", "Password123", ""])
+            writer.writerow(["bad", "tenant_c", "Password123", ""])
+        report = tmp_path / "rejected.csv"
+        out = io.StringIO()
+
+        call_command("import_users", str(source), "--report", str(report), "--workers", "2", stdout=out)
+
+        assert "creados=2" in out.getvalue()
+        assert User.objects.get(email="a@tenant.com").role == UserRole.ADMIN.value
+        rejected = list(csv.DictReader(report.open()))
+        assert [(r["line"], r["code"]) for r in rejected] == [("4", "invalid_email")]
+
+    def test_workers_are_not_capped_by_the_request_hashing_pool(self, tmp_path, monkeypatch):
+        # El pool de los requests, saturado: cualquier hash que pase por él falla
+        saturated = MagicMock()
+        saturated.hash.side_effect = PasswordHashingBusy()
+        monkeypatch.setattr(password_hasher, "_password_hasher", saturated)
+        source = tmp_path / "tenant.ndjson"
+        records = [{"email": f"w{i}@tenant.com", "username": f"tenant_w{i}", "password": "Password123"}
+                   for i in range(12)]
+        source.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+        out = io.StringIO()
+
+        call_command("import_users", str(source), "--workers", "8", "--batch-size", "4", stdout=out)
+
+        assert "creados=12" in out.getvalue()
+        saturated.hash.assert_not_called()
+        assert User.objects.get(email="w0@tenant.com").password_hash.startswith("pbkdf2_sha256$")
+
+    def test_imports_ndjson_skipping_existing(self, tmp_path):
+        source = tmp_path / "tenant.ndjson"
+        records = [{"email": f"n{i}@tenant.com", "username": f"tenant_n{i}", "password": "Password123"}
+                   for i in range(3)]
+        source.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+        call_command("import_users", str(source), stdout=io.StringIO())
+        out = io.StringIO()
+        call_command("import_users", str(source), stdout=out)
+
+        assert "creados=0 conflictos=3" in out.getvalue()
+        assert User.objects.filter(email__endswith="@tenant.com").count() == 3
@@ -0,0 +1,103 @@
+"""
+Tests del esquema de índices de ``users``: las consultas frecuentes del
+repositorio usan el índice previsto (EXPLAIN) y no hay índices duplicados.
+
+El plan se pide al motor con el que corre la suite. En PostgreSQL se
+desactiva el seq scan: con tablas de test casi vacías el planner lo
+preferiría aunque el índice exista.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+
+from users.domain.entities import UserRole
+from users.domain.factories import UserFactory
+from users.domain.pagination import PageRequest
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User as DjangoUser
+
+AFTER = ("2026-01-01T00:00:00+00:00", "00000000-0000-0000-0000-000000000000")
+
+
+@contextmanager
+def _index_scans_preferred():
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        yield
+
+
+def _plan(queryset) -> str:
+    with _index_scans_preferred():
+        return queryset.explain()
+
+
+@pytest.mark.django_db
+class TestQueryPlans:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+        self.repository.save(UserFactory.create("plan@test.com", "planuser", "Password123"))
+
+    def _keyset(self, queryset, fields, descending, after=None):
+        return self.repository._keyset_queryset(queryset, fields, descending, PageRequest(size=50, after=after))
+
+    def test_email_lookup_uses_lower_email_index(self):
+        single = _plan(self.repository._email_queryset(["Plan@Test.com"]))
+        batch = _plan(self.repository._email_queryset(["plan@test.com", "other@test.com"]))
+
+        assert "users_email_lower_uniq" in single
+        assert "users_email_lower_uniq" in batch
+        assert "TEMP B-TREE" not in batch
+
+    @pytest.mark.parametrize("after", [None, AFTER])
+    def test_listing_uses_created_at_index(self, after):
+        plan = _plan(self._keyset(self.repository._listing_queryset(None), ("created_at", "id"), True, after))
+
+        assert "users_created_at_id_idx" in plan
+
+    def test_active_listing_uses_partial_index(self):
+        plan = _plan(self._keyset(self.repository._listing_queryset(True), ("created_at", "id"), True, AFTER))
+
+        assert "users_active_created_idx" in plan
+
+    def test_role_listing_uses_role_username_index(self):
+        queryset = DjangoUser.objects.filter(role=UserRole.ADMIN.value)
+
+        plan = _plan(self._keyset(queryset, ("username", "id"), False))
+
+        assert "users_role_username_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_change_feed_uses_updated_at_index(self):
+        plan = _plan(self._keyset(DjangoUser.objects.all(), ("updated_at", "id"), False, AFTER))
+
+        assert "users_updated_at_id_idx" in plan
+
+
+@pytest.mark.django_db
+class TestSchema:
+
+    def test_single_index_per_unique_column(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, DjangoUser._meta.db_table)
+
+        for column in ("email", "username"):
+            covering = [c for c in constraints.values() if c["columns"] == [column] and (c["index"] or c["unique"])]
+            assert len(covering) <= 1, column
+
+    def test_email_is_unique_regardless_of_case(self):
+        DjangoUser.objects.create(email="case@test.com", username="caseuser1", password_hash="x")
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            DjangoUser.objects.create(email="CASE@test.com", username="caseuser2", password_hash="x")
+
+    def test_find_by_email_ignores_case(self):
+        DjangoUser.objects.create(email="Mixed@Test.com", username="mixeduser", password_hash="x")
+
+        user = DjangoUserRepository().find_by_email("mixed@test.com")
+
+        assert user is not None and user.username == "mixeduser"
@@ -0,0 +1,137 @@
+"""
+Tests de la resolución de usuarios por lote (filter[id] / POST lookup).
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.async_views import AsyncUserListView
+from users.domain.factories import UserFactory
+from users.infrastructure.async_repository import AsyncDjangoUserRepository
+from users.infrastructure.identity_map import identity_map_scope
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+
+MISSING_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def _user_queries(ctx):
+    return [q for q in ctx.captured_queries if 'FROM "users"' in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestRepositoryBatchLookup:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+        self.users = [
+            self.repository.save(UserFactory.create(f"batch{i}@test.com", f"batchuser{i}", "Password123"))
+            for i in range(3)
+        ]
+
+    def test_find_by_ids_one_query_in_requested_order(self):
+        ids = [self.users[2].id, MISSING_ID, "not-a-uuid", self.users[0].id, self.users[2].id]
+
+        with CaptureQueriesContext(connection) as ctx:
+            found = self.repository.find_by_ids(ids)
+
+        assert [u.id for u in found] == [self.users[2].id, self.users[0].id]
+        assert len(ctx.captured_queries) == 1
+
+    def test_find_by_ids_reuses_identity_map(self):
+        with identity_map_scope():
+            self.repository.find_by_id(self.users[0].id)
+            with CaptureQueriesContext(connection) as ctx:
+                found = self.repository.find_by_ids([self.users[0].id, self.users[1].id])
+
+        assert [u.id for u in found] == [self.users[0].id, self.users[1].id]
+        assert len(ctx.captured_queries) == 1
+        assert self.users[0].id.replace("-", "") not in ctx.captured_queries[0]["sql"]
+
+    def test_find_by_emails_is_case_insensitive(self):
+        found = self.repository.find_by_emails(["BATCH1@test.com", "nobody@test.com"])
+
+        assert [u.id for u in found] == [self.users[1].id]
+
+    def test_async_matches_sync(self):
+        ids = [self.users[1].id, MISSING_ID]
+
+        found = async_to_sync(AsyncDjangoUserRepository().find_by_ids)(ids)
+
+        assert [u.id for u in found] == [self.users[1].id]
+
+
+@pytest.mark.django_db
+class TestBatchLookupEndpoints:
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        self.repository = DjangoUserRepository()
+        self.user = self.repository.save(UserFactory.create("lookup@test.com", "lookupuser", "Password123"))
+        self.other = self.repository.save(UserFactory.create("lookup2@test.com", "lookupuser2", "Password123"))
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    def test_filter_by_ids_reports_missing(self):
+        response = self.client.get("/api/users/", {"filter[id]": f"{self.other.id},{MISSING_ID}"})
+        body = response.json()
+
+        assert response.status_code == 200
+        assert [r["id"] for r in body["data"]] == [self.other.id]
+        assert body["meta"]["missing"] == {"ids": [MISSING_ID], "emails": []}
+        assert "links" not in body
+
+    def test_filter_resolves_ids_in_one_query(self):
+        path = f"/api/users/?filter[id]={self.user.id},{self.other.id}"
+        self.client.get(path)  # calienta la caché de principals
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(path, HTTP_IF_NONE_MATCH='W/"stale"')
+
+        assert len(response.json()["data"]) == 2
+        in_queries = [q for q in _user_queries(ctx) if " IN (" in q["sql"]]
+        assert len(in_queries) == 1
+
+    def test_post_lookup_by_ids_and_emails(self):
+        response = self.client.post(
+            "/api/users/lookup/",
+            {"ids": [self.user.id], "emails": ["LOOKUP2@test.com", "gone@test.com"]},
+            format="json",
+        )
+        body = response.json()
+
+        assert response.status_code == 200
+        assert [r["id"] for r in body["data"]] == [self.user.id, self.other.id]
+        assert body["meta"]["missing"] == {"ids": [], "emails": ["gone@test.com"]}
+
+    def test_cap_is_enforced(self, settings):
+        settings.USERS_LOOKUP_MAX = 2
+        ids = ",".join([self.user.id, self.other.id, MISSING_ID])
+
+        get_response = self.client.get("/api/users/", {"filter[id]": ids})
+        post_response = self.client.post("/api/users/lookup/", {"ids": ids.split(",")}, format="json")
+
+        assert get_response.status_code == 400
+        assert post_response.status_code == 422
+
+    def test_post_lookup_requires_values(self):
+        response = self.client.post("/api/users/lookup/", {}, format="json")
+
+        assert response.status_code == 422
+
+    def test_async_list_view_resolves_filter(self):
+        request = AsyncRequestFactory().get(
+            "/api/users/", {"filter[email]": "lookup@test.com"},
+            headers={"Cookie": f"access_token={self.client.cookies['access_token'].value}"},
+        )
+
+        response = async_to_sync(AsyncUserListView.as_view())(request)
+        response.render()
+
+        assert response.status_code == 200
+        assert b'"missing":{"ids":[],"emails":[]}' in response.content
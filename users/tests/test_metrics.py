@@ -0,0 +1,131 @@
+"""
+Tests de ``GET /metrics``: latencia por ruta, consultas por request,
+publicación en RabbitMQ, caché de principals y agregación entre procesos.
+"""
+
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from django.test import Client
+from prometheus_client import REGISTRY
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.factories import UserFactory
+from users.infrastructure.event_publisher import RabbitMQEventPublisher
+from users.infrastructure.metrics import MULTIPROC_DIR_ENV, render_metrics
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.rabbitmq_pool import RECONNECTABLE_ERRORS
+from users.infrastructure.repository import DjangoUserRepository
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.django_db
+class TestRequestMetrics:
+
+    def setup_method(self):
+        self.user = DjangoUserRepository().save(UserFactory.create("metrics@test.com", "metricsuser", "Password123"))
+        get_principal_cache().clear()
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    def test_latency_is_labelled_by_route_template(self):
+        labels = {"route": "/api/users/{pk}/", "method": "GET", "status": "200"}
+        before = _sample("users_http_request_duration_seconds_count", **labels)
+
+        self.client.get(f"/api/users/{self.user.id}/")
+        self.client.get(f"/api/users/{self.user.id}/")
+
+        assert _sample("users_http_request_duration_seconds_count", **labels) == before + 2
+
+    def test_unresolved_paths_share_one_series(self):
+        before = _sample("users_http_request_duration_seconds_count", route="unmatched", method="GET", status="404")
+
+        Client().get("/nope/1/")
+        Client().get("/nope/2/")
+
+        assert _sample(
+            "users_http_request_duration_seconds_count", route="unmatched", method="GET", status="404",
+        ) == before + 2
+
+    def test_db_queries_are_counted_per_request(self):
+        before_sum = _sample("users_http_request_db_queries_sum", route="/api/users/{pk}/")
+        before_count = _sample("users_http_request_db_queries_count", route="/api/users/{pk}/")
+
+        self.client.get(f"/api/users/{self.user.id}/")
+
+        assert _sample("users_http_request_db_queries_count", route="/api/users/{pk}/") == before_count + 1
+        assert _sample("users_http_request_db_queries_sum", route="/api/users/{pk}/") > before_sum
+        assert _sample("users_http_request_db_duration_seconds_count", route="/api/users/{pk}/") >= 1
+
+    def test_principal_cache_hits_are_counted(self):
+        hits = _sample("users_principal_cache_lookups_total", result="hit")
+        misses = _sample("users_principal_cache_lookups_total", result="miss")
+
+        self.client.get(f"/api/users/{self.user.id}/")
+        self.client.get(f"/api/users/{self.user.id}/")
+
+        assert _sample("users_principal_cache_lookups_total", result="miss") == misses + 1
+        assert _sample("users_principal_cache_lookups_total", result="hit") == hits + 1
+
+    def test_metrics_endpoint_serves_text_format(self):
+        self.client.get(f"/api/users/{self.user.id}/")
+
+        response = Client().get("/metrics")
+
+        names = {family.name for family in text_string_to_metric_families(response.content.decode())}
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert {"users_http_request_duration_seconds", "users_http_request_db_queries"} <= names
+
+
+class TestPublishMetrics:
+
+    def _publisher(self, channel):
+        pool = MagicMock()
+        pool.channel.return_value.__enter__.return_value.channel = channel
+        return RabbitMQEventPublisher(pool=pool)
+
+    def test_publish_latency_is_observed(self):
+        before = _sample("users_rabbitmq_publish_duration_seconds_count", operation="publish")
+
+        self._publisher(MagicMock()).publish_message({"event_type": "user.created"})
+
+        assert _sample("users_rabbitmq_publish_duration_seconds_count", operation="publish") == before + 1
+
+    def test_failure_after_retry_is_counted(self):
+        channel = MagicMock()
+        channel.basic_publish.side_effect = RECONNECTABLE_ERRORS[0]("broker down")
+        before = _sample("users_rabbitmq_publish_failures_total", operation="publish")
+
+        with pytest.raises(RECONNECTABLE_ERRORS):
+            self._publisher(channel).publish_message({"event_type": "user.created"})
+
+        assert _sample("users_rabbitmq_publish_failures_total", operation="publish") == before + 1
+
+
+def test_render_aggregates_worker_processes(tmp_path, monkeypatch):
+    """Dos "workers" escriben en el directorio compartido; /metrics suma ambos."""
+    worker = (
+        "from users.infrastructure.metrics import PRINCIPAL_CACHE_LOOKUPS; "
+        "PRINCIPAL_CACHE_LOOKUPS.labels('hit').inc(3)"
+    )
+    env = {MULTIPROC_DIR_ENV: str(tmp_path), "PATH": ""}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", worker], env=env, check=True)
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    body, _ = render_metrics()
+
+    samples = {
+        (sample.name, sample.labels.get("result")): sample.value
+        for family in text_string_to_metric_families(body.decode())
+        for sample in family.samples
+    }
+    assert samples[("users_principal_cache_lookups_total", "hit")] == 6
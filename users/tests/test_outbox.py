@@ -0,0 +1,155 @@
+"""
+Tests del Transactional Outbox: los eventos se guardan con el usuario y el
+relay los publica en lotes. RabbitMQ se sustituye por un mock.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from users.domain.events import UserCreated
+from users.infrastructure.event_publisher import RabbitMQEventPublisher
+from users.infrastructure.outbox import (
+    OutboxEventPublisher,
+    OutboxRelay,
+    build_event_publisher,
+)
+from users.models import OutboxEvent
+
+
+def _enqueue(n: int) -> None:
+    publisher = OutboxEventPublisher()
+    for i in range(n):
+        publisher.publish(
+            UserCreated(
+                occurred_at=datetime.now(),
+                user_id=str(i),
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+            ),
+            'user.created',
+        )
+
+
+class TestBuildEventPublisher:
+    """Selección del publicador según EVENT_DELIVERY_MODE."""
+
+    @override_settings(EVENT_DELIVERY_MODE="outbox")
+    def test_outbox_mode(self):
+        assert isinstance(build_event_publisher().inner, OutboxEventPublisher)
+
+    @override_settings(EVENT_DELIVERY_MODE="direct")
+    def test_direct_mode(self):
+        assert isinstance(build_event_publisher().inner, RabbitMQEventPublisher)
+
+
+@pytest.mark.django_db
+class TestOutboxRegistration:
+    """El registro escribe el evento en el outbox sin tocar el broker."""
+
+    @override_settings(EVENT_DELIVERY_MODE="outbox")
+    def test_register_writes_outbox_row_without_publishing(self):
+        with patch.object(RabbitMQEventPublisher, "publish") as publish:
+            response = APIClient().post(
+                "/api/auth/",
+                {"email": "outbox@test.com", "username": "outboxuser", "password": "Password123"},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        publish.assert_not_called()
+        event = OutboxEvent.objects.get()
+        assert event.event_type == "user.created"
+        assert event.payload["email"] == "outbox@test.com"
+        assert event.published_at is None
+
+
+@pytest.mark.django_db
+class TestOutboxRelay:
+    """Tests del relay por lotes."""
+
+    def test_drain_publishes_in_batches_and_marks_events(self):
+        _enqueue(5)
+        publisher = MagicMock()
+
+        result = OutboxRelay(publisher=publisher, batch_size=2).drain()
+
+        assert result.published == 5
+        assert publisher.publish_message.call_count == 5
+        published = [c.args[0]["user_id"] for c in publisher.publish_message.call_args_list]
+        assert published == ["0", "1", "2", "3", "4"]
+        assert not OutboxEvent.objects.filter(published_at__isnull=True).exists()
+
+    def test_failure_stops_batch_and_keeps_event_pending(self):
+        _enqueue(3)
+        publisher = MagicMock()
+        publisher.publish_message.side_effect = [None, ConnectionError("broker caído")]
+
+        result = OutboxRelay(publisher=publisher, batch_size=10).relay_batch()
+
+        assert result.published == 1
+        assert result.failed == 1
+        pending = list(OutboxEvent.objects.filter(published_at__isnull=True))
+        assert len(pending) == 2
+        assert pending[0].attempts == 1
+        assert "broker caído" in pending[0].last_error
+
+    def test_poison_event_is_dead_lettered_and_unblocks_the_rest(self, caplog):
+        _enqueue(3)
+        OutboxEvent.objects.filter(payload__user_id="0").update(attempts=2)
+
+        def publish_message(payload):
+            if payload["user_id"] == "0":
+                raise ValueError("payload rechazado")
+
+        publisher = MagicMock()
+        publisher.publish_message.side_effect = publish_message
+
+        with caplog.at_level(logging.ERROR, logger="users.infrastructure.outbox"):
+            result = OutboxRelay(publisher=publisher, batch_size=10, max_attempts=3).drain()
+
+        assert (result.published, result.failed, result.dead_lettered) == (2, 0, 1)
+        poison = OutboxEvent.objects.get(payload__user_id="0")
+        assert poison.failed_at is not None and poison.published_at is None
+        assert poison.attempts == 3
+        assert "descartado tras 3 intentos" in caplog.text
+        assert not OutboxEvent.objects.filter(published_at__isnull=True, failed_at__isnull=True).exists()
+
+    def test_dead_lettered_event_is_not_retried(self):
+        _enqueue(1)
+        OutboxEvent.objects.update(failed_at=timezone.now())
+        publisher = MagicMock()
+
+        assert OutboxRelay(publisher=publisher).relay_batch().published == 0
+        publisher.publish_message.assert_not_called()
+
+    def test_batch_is_skipped_while_another_relay_holds_the_lock(self):
+        _enqueue(2)
+        publisher = MagicMock()
+
+        with patch.object(OutboxRelay, "_acquire_relay_lock", return_value=False):
+            result = OutboxRelay(publisher=publisher).relay_batch()
+
+        assert result.published == 0
+        publisher.publish_message.assert_not_called()
+
+    def test_purge_published(self):
+        _enqueue(2)
+        OutboxEvent.objects.update(published_at=timezone.now() - timedelta(days=2))
+
+        assert OutboxRelay.purge_published(timedelta(days=1)) == 2
+
+    def test_command_once_reports_throughput(self, capsys):
+        _enqueue(3)
+        with patch.object(RabbitMQEventPublisher, "publish_message") as publish_message:
+            call_command("relay_outbox", "--once", "--batch-size", "2")
+
+        assert publish_message.call_count == 3
+        assert "publicados=3" in capsys.readouterr().out
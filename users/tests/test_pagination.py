@@ -0,0 +1,235 @@
+"""
+Tests de la paginación por cursor (keyset) de las colecciones de usuarios.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from users.domain.entities import UserRole
+from users.domain.factories import UserFactory
+from users.domain.pagination import PageRequest
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User
+from users.pagination import CREATED_AT_KEY, USERNAME_KEY, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def empty_users_table(db):
+    """Elimina el admin sembrado por la migración 0003 para contar exacto."""
+    User.objects.all().delete()
+
+
+def _seed(count, role=UserRole.USER, prefix="user"):
+    """Crea ``count`` usuarios; de a pares comparten ``created_at`` para forzar el desempate por id."""
+    repository = DjangoUserRepository()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        user = repository.save(UserFactory.create(
+            email=f"{prefix}{i:03d}@test.com",
+            username=f"{prefix}{i:03d}",
+            password="Password123",
+            role=role,
+        ))
+        # created_at es auto_now_add: save() lo ignora, se fija con UPDATE
+        User.objects.filter(pk=user.id).update(created_at=base + timedelta(minutes=i // 2))
+
+
+def _assert_created_at_ties():
+    created = list(User.objects.values_list("created_at", flat=True))
+    assert len(set(created)) < len(created), "el seed debe repetir created_at"
+
+
+def _walk_forward(fetch, size):
+    seen, key = [], None
+    while True:
+        page = fetch(PageRequest(size=size, after=key))
+        seen.extend(page.items)
+        if page.next_key is None:
+            return seen
+        key = page.next_key
+
+
+class TestCursorCodec:
+
+    def test_round_trip(self):
+        key = ("2026-01-01T00:00:00+00:00", "0192a3b4-5c6d-7e8f-9a0b-1c2d3e4f5a6b")
+
+        decoded = decode_cursor(encode_cursor(key), CREATED_AT_KEY)
+
+        assert decoded == (datetime(2026, 1, 1, tzinfo=timezone.utc), UUID(key[1]))
+        assert encode_cursor(decoded) == encode_cursor(key)
+
+    @pytest.mark.parametrize("cursor", ["%%%", "bm90LWpzb24", "e30"])
+    def test_invalid_cursor_raises_parse_error(self, cursor):
+        with pytest.raises(ParseError):
+            decode_cursor(cursor, CREATED_AT_KEY)
+
+    @pytest.mark.parametrize("key", [
+        [1, 2],
+        ["2026-01-01T00:00:00+00:00"],
+        ["2026-01-01T00:00:00+00:00", str(UUID(int=1)), "extra"],
+        ["yesterday", str(UUID(int=1))],
+        ["2026-01-01T00:00:00", str(UUID(int=1))],
+        ["2026-01-01T00:00:00+00:00", "not-a-uuid"],
+    ])
+    def test_cursor_must_match_the_collection_key(self, key):
+        with pytest.raises(ParseError):
+            decode_cursor(encode_cursor(key), CREATED_AT_KEY)
+
+    def test_username_key_rejects_non_text(self):
+        with pytest.raises(ParseError):
+            decode_cursor(encode_cursor([7, str(UUID(int=1))]), USERNAME_KEY)
+
+
+@pytest.mark.usefixtures("empty_users_table")
+class TestRepositoryKeysetPagination:
+
+    def test_find_page_walks_all_users_in_created_at_desc_order(self):
+        _seed(7)
+        _assert_created_at_ties()
+        repository = DjangoUserRepository()
+
+        users = _walk_forward(repository.find_page, size=3)
+
+        expected = list(User.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        assert [u.id for u in users] == [str(pk) for pk in expected]
+
+    def test_find_page_by_role_orders_by_username(self):
+        _seed(5, role=UserRole.ADMIN, prefix="admin")
+        _seed(3, role=UserRole.USER, prefix="user")
+        repository = DjangoUserRepository()
+
+        users = _walk_forward(lambda p: repository.find_page_by_role(UserRole.ADMIN, p), size=2)
+
+        assert [u.username for u in users] == [f"admin{i:03d}" for i in range(5)]
+
+    def test_before_returns_previous_page_in_natural_order(self):
+        _seed(6)
+        repository = DjangoUserRepository()
+        first = repository.find_page(PageRequest(size=2))
+        second = repository.find_page(PageRequest(size=2, after=first.next_key))
+
+        back = repository.find_page(PageRequest(size=2, before=second.prev_key))
+
+        assert [u.id for u in back.items] == [u.id for u in first.items]
+        assert back.prev_key is None
+        assert back.next_key is not None
+
+    def test_first_and_last_page_keys(self):
+        _seed(3)
+        repository = DjangoUserRepository()
+
+        page = repository.find_page(PageRequest(size=3))
+
+        assert len(page.items) == 3
+        assert page.next_key is None
+        assert page.prev_key is None
+
+    def test_single_query_per_page(self):
+        _seed(5)
+        repository = DjangoUserRepository()
+        first = repository.find_page(PageRequest(size=2))
+
+        with CaptureQueriesContext(connection) as ctx:
+            repository.find_page(PageRequest(size=2, after=first.next_key))
+
+        assert len(ctx.captured_queries) == 1
+        assert "OFFSET" not in ctx.captured_queries[0]["sql"].upper()
+
+
+@pytest.mark.usefixtures("empty_users_table")
+class TestPaginatedEndpoints:
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    def _login(self):
+        _seed(5)
+        user = User.objects.get(email="user000@test.com")
+        self.client.force_authenticate(user=user)
+
+    def test_list_follows_next_links(self):
+        self._login()
+
+        response = self.client.get("/api/users/", {"page[size]": 2})
+        assert response.status_code == 200
+        assert response.data["meta"]["count"] == 2
+        assert response.data["links"]["prev"] is None
+
+        ids = [item["id"] for item in response.data["data"]]
+        next_link = response.data["links"]["next"]
+        while next_link:
+            response = self.client.get(next_link)
+            assert response.status_code == 200
+            ids.extend(item["id"] for item in response.data["data"])
+            next_link = response.data["links"]["next"]
+
+        assert len(ids) == len(set(ids)) == 5
+
+    def test_list_walks_ties_through_encoded_cursors(self):
+        self._login()
+        _assert_created_at_ties()
+
+        ids, link = [], "/api/users/?page%5Bsize%5D=1"
+        while link:
+            response = self.client.get(link)
+            ids.extend(item["id"] for item in response.data["data"])
+            link = response.data["links"]["next"]
+
+        expected = User.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        assert ids == [str(pk) for pk in expected]
+
+    def test_page_size_is_capped(self, settings):
+        settings.USERS_PAGE_SIZE_MAX = 3
+        self._login()
+
+        response = self.client.get("/api/users/", {"page[size]": 1000})
+
+        assert response.data["meta"]["count"] == 3
+        assert "page%5Bsize%5D=3" in response.data["links"]["self"]
+
+    def test_list_filters_by_is_active_across_pages(self):
+        self._login()
+        User.objects.filter(username__in=["user001", "user002", "user003"]).update(is_active=False)
+
+        response = self.client.get("/api/users/", {"filter[is_active]": "false", "page[size]": 2})
+        ids = [item["id"] for item in response.data["data"]]
+        response = self.client.get(response.data["links"]["next"])
+        ids.extend(item["id"] for item in response.data["data"])
+
+        inactive = {str(pk) for pk in User.objects.filter(is_active=False).values_list("id", flat=True)}
+        assert len(ids) == 3 and set(ids) == inactive
+        assert response.data["links"]["next"] is None
+
+    @pytest.mark.parametrize("params", [
+        {"page[size]": "abc"},
+        {"page[size]": "0"},
+        {"page[after]": "not-a-cursor"},
+        {"filter[is_active]": "maybe"},
+        {"page[after]": encode_cursor(("a", "b")), "page[before]": encode_cursor(("a", "b"))},
+        {"page[after]": encode_cursor([1, 2])},
+        {"page[after]": encode_cursor(["2026-01-01T00:00:00+00:00"])},
+        {"page[after]": encode_cursor(["2026-13-01T00:00:00+00:00", str(UUID(int=1))])},
+    ])
+    def test_invalid_pagination_params_return_400(self, params):
+        self._login()
+
+        response = self.client.get("/api/users/", params)
+
+        assert response.status_code == 400
+        assert response.data["errors"][0]["code"] == "parse_error"
+
+    def test_by_role_is_paginated(self):
+        self._login()
+
+        response = self.client.get("/api/auth/by-role/USER/", {"page[size]": 4})
+
+        assert response.status_code == 200
+        assert response.data["meta"]["count"] == 4
+        assert response.data["links"]["next"].startswith("/api/auth/by-role/USER/?")
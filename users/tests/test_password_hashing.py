@@ -0,0 +1,176 @@
+"""
+Tests del motor de hashing: KDF de Django, rehash en login y pool acotado.
+"""
+
+import hashlib
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from django.db.models import F
+
+from users.application.use_cases import LoginCommand, LoginUseCase
+from users.domain.exceptions import InvalidCredentials
+from users.domain.password_hasher import LegacySha256PasswordHasher, is_legacy_sha256
+from users.infrastructure import password_hashing
+from users.infrastructure.password_hashing import (
+    DjangoPasswordHasher,
+    HashingPool,
+    PasswordHashingBusy,
+    PooledPasswordHasher,
+    calibrate_pbkdf2_iterations,
+    shutdown_hashing_pool,
+)
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User
+
+PASSWORD = "Password123"
+
+
+class TestDjangoPasswordHasher:
+
+    def test_hash_and_verify(self):
+        hasher = DjangoPasswordHasher()
+        encoded = hasher.hash(PASSWORD)
+
+        assert encoded.startswith("pbkdf2_sha256$1000$")
+        assert hasher.verify(PASSWORD, encoded)
+        assert not hasher.verify("wrong-password", encoded)
+        assert not hasher.needs_rehash(encoded)
+
+    def test_legacy_sha256_verifies_and_needs_rehash(self):
+        hasher = DjangoPasswordHasher()
+        legacy = hashlib.sha256(PASSWORD.encode()).hexdigest()
+
+        assert is_legacy_sha256(legacy)
+        assert hasher.verify(PASSWORD, legacy)
+        assert not hasher.verify("wrong-password", legacy)
+        assert hasher.needs_rehash(legacy)
+
+    def test_changing_iterations_triggers_rehash(self, settings):
+        hasher = DjangoPasswordHasher()
+        encoded = hasher.hash(PASSWORD)
+
+        settings.PASSWORD_HASH_ITERATIONS = 2000
+
+        assert hasher.verify(PASSWORD, encoded)
+        assert hasher.needs_rehash(encoded)
+
+    def test_calibration_scales_with_target(self):
+        assert calibrate_pbkdf2_iterations(target_ms=1, sample_iterations=1000) >= 1000
+
+
+@pytest.mark.django_db
+class TestRehashOnLogin:
+
+    def test_legacy_hash_is_upgraded_on_successful_login(self):
+        User.objects.create(
+            email="legacy@test.com",
+            username="legacy",
+            password_hash=LegacySha256PasswordHasher().hash(PASSWORD),
+        )
+        use_case = LoginUseCase(DjangoUserRepository(), password_hasher=DjangoPasswordHasher())
+
+        use_case.execute(LoginCommand(email="legacy@test.com", password=PASSWORD))
+
+        stored = User.objects.get(email="legacy@test.com").password_hash
+        assert stored.startswith("pbkdf2_sha256$")
+        # El login sigue funcionando con el hash nuevo
+        use_case.execute(LoginCommand(email="legacy@test.com", password=PASSWORD))
+
+    def test_concurrent_rehash_does_not_fail_the_login(self):
+        legacy = LegacySha256PasswordHasher().hash(PASSWORD)
+        User.objects.create(email="legacy3@test.com", username="legacy3", password_hash=legacy)
+        repository = DjangoUserRepository()
+        original_find = repository.find_by_email
+
+        def find_then_lose_the_race(email):
+            user = original_find(email)
+            # Un login simultáneo hace el rehash entre la lectura y el UPDATE
+            User.objects.filter(email=email).update(
+                password_hash=DjangoPasswordHasher().hash(PASSWORD), version=F("version") + 1,
+            )
+            return user
+
+        repository.find_by_email = find_then_lose_the_race
+        use_case = LoginUseCase(repository, password_hasher=DjangoPasswordHasher())
+
+        result = use_case.execute(LoginCommand(email="legacy3@test.com", password=PASSWORD))
+
+        assert result["user"].email == "legacy3@test.com"
+        assert result["tokens"]["access"]
+        assert User.objects.get(email="legacy3@test.com").password_hash.startswith("pbkdf2_sha256$")
+
+    def test_failed_login_does_not_rehash(self):
+        legacy = LegacySha256PasswordHasher().hash(PASSWORD)
+        User.objects.create(email="legacy2@test.com", username="legacy2", password_hash=legacy)
+        use_case = LoginUseCase(DjangoUserRepository(), password_hasher=DjangoPasswordHasher())
+
+        with pytest.raises(Exception):
+            use_case.execute(LoginCommand(email="legacy2@test.com", password="wrong-password"))
+
+        assert User.objects.get(email="legacy2@test.com").password_hash == legacy
+
+
+class TestLoginTiming:
+
+    def test_unknown_email_still_verifies_a_hash(self):
+        repository = MagicMock()
+        repository.find_by_email.return_value = None
+        hasher = MagicMock(wraps=DjangoPasswordHasher())
+        use_case = LoginUseCase(repository, password_hasher=hasher)
+
+        for _ in range(2):
+            with pytest.raises(InvalidCredentials):
+                use_case.execute(LoginCommand(email="ghost@test.com", password=PASSWORD))
+
+        assert hasher.verify.call_count == 2
+        assert hasher.verify.call_args.args[0] == PASSWORD
+        # El hash de referencia se calcula una sola vez
+        hasher.hash.assert_called_once()
+
+
+class TestHashingPool:
+
+    def test_runs_and_reports_stats(self):
+        pool = HashingPool(max_workers=2, max_pending=2)
+        hasher = PooledPasswordHasher(DjangoPasswordHasher(), pool)
+
+        encoded = hasher.hash(PASSWORD)
+        assert hasher.verify(PASSWORD, encoded)
+
+        stats = pool.stats()
+        assert stats["completed"] == 2
+        assert stats["queue_depth"] == 0 and stats["in_flight"] == 0
+        pool.shutdown()
+
+    def test_shutdown_hashing_pool(self, monkeypatch):
+        pool = HashingPool(max_workers=1)
+        monkeypatch.setattr(password_hashing, "_hashing_pool", pool)
+
+        shutdown_hashing_pool()
+
+        with pytest.raises(RuntimeError):
+            pool.run(lambda: None)
+
+    def test_rejects_when_saturated(self):
+        pool = HashingPool(max_workers=1, max_pending=0, acquire_timeout=0.05)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(5)
+
+        worker = threading.Thread(target=pool.run, args=(blocking,))
+        worker.start()
+        started.wait(5)
+        try:
+            with pytest.raises(PasswordHashingBusy):
+                pool.run(lambda: None)
+            assert pool.stats()["rejected"] == 1
+            assert pool.stats()["in_flight"] == 1
+        finally:
+            release.set()
+            worker.join()
+            pool.shutdown()
@@ -0,0 +1,119 @@
+"""
+Tests de la caché LRU + TTL de principals autenticados.
+"""
+
+import hashlib
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from rest_framework.test import APIClient
+
+from users.domain.events import UserCreated, UserDeactivated
+from users.infrastructure.principal_cache import (
+    PrincipalCache,
+    PrincipalCacheInvalidator,
+    get_principal_cache,
+)
+from users.models import User
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPrincipalCache:
+    """Comportamiento LRU/TTL y contadores."""
+
+    def test_hit_and_miss_counters(self):
+        cache = PrincipalCache(max_size=2, ttl=10)
+
+        assert cache.get("a") is None
+        cache.put("a", "user-a")
+        assert cache.get("a") == "user-a"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PrincipalCache(max_size=2, ttl=10)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" pasa a ser el menos usado
+
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = PrincipalCache(max_size=2, ttl=5, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 5.0
+
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_zero_size_disables_cache(self):
+        cache = PrincipalCache(max_size=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+
+    @pytest.mark.django_db
+    def test_invalidator_evicts_on_deactivation_only(self):
+        cache = PrincipalCache()
+        cache.put("1", "user")
+        inner = MagicMock()
+        publisher = PrincipalCacheInvalidator(inner, cache=cache)
+
+        publisher.publish(UserCreated(datetime.now(), "1", "a@b.com", "abc"), 'user.created')
+        assert cache.get("1") == "user"
+
+        publisher.publish(UserDeactivated(datetime.now(), "1"), 'user.deactivated')
+        assert cache.get("1") is None
+        assert cache.stats()["invalidations"] == 1
+        assert inner.publish.call_count == 2
+
+
+@pytest.mark.django_db
+class TestAuthenticationUsesCache:
+    """Los autenticadores evitan la consulta a BD con la caché caliente."""
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        self.user = User.objects.create(
+            email="cached@example.com",
+            username="cached",
+            password_hash=hashlib.sha256(b"Password123").hexdigest(),
+        )
+        self.client = APIClient()
+        self.client.post(
+            "/api/auth/login/",
+            {"email": "cached@example.com", "password": "Password123"},
+            format="json",
+        )
+
+    def test_second_request_skips_user_lookup(self, django_assert_num_queries):
+        assert self.client.get("/api/auth/me/").status_code == 200
+
+        with django_assert_num_queries(0):
+            assert self.client.get("/api/auth/me/").status_code == 200
+
+    def test_deactivation_evicts_cached_principal(self):
+        assert self.client.get("/api/auth/me/").status_code == 200
+
+        response = self.client.post(f"/api/users/{self.user.id}/deactivate/", {}, format="json")
+
+        assert response.status_code == 200
+        assert get_principal_cache().get(str(self.user.id)) is None
+        assert self.client.get("/api/auth/me/").status_code == 401
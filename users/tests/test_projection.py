@@ -0,0 +1,105 @@
+"""
+Tests de las lecturas proyectadas: las rutas de solo lectura no cargan
+``password_hash`` y devuelven ``UserSummary``.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.entities import UserRole
+from users.domain.factories import UserFactory
+from users.domain.pagination import PageRequest
+from users.domain.read_models import UserSummary
+from users.infrastructure.async_repository import AsyncDjangoUserRepository
+from users.infrastructure.identity_map import identity_map_scope
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+
+
+def _user_selects(ctx):
+    return [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT") and 'FROM "users"' in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestProjectedReads:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+        self.user = self.repository.save(UserFactory.create("reader@test.com", "reader", "Password123"))
+
+    @pytest.mark.parametrize("read", [
+        lambda r, u: r.find_all(),
+        lambda r, u: r.find_by_role(UserRole.USER),
+        lambda r, u: r.find_page(PageRequest(size=10)).items,
+        lambda r, u: r.find_page(PageRequest(size=10), is_active=True).items,
+        lambda r, u: r.find_page_by_role(UserRole.USER, PageRequest(size=10)).items,
+        lambda r, u: [r.find_summary_by_id(u.id)],
+        lambda r, u: r.find_by_ids([u.id]),
+        lambda r, u: r.find_by_emails([u.email]),
+    ])
+    def test_read_paths_skip_password_hash(self, read):
+        with CaptureQueriesContext(connection) as ctx:
+            results = read(self.repository, self.user)
+
+        assert [s.id for s in results if s.id == self.user.id] == [self.user.id]
+        assert all(isinstance(s, UserSummary) and not hasattr(s, "password_hash") for s in results)
+        selects = _user_selects(ctx)
+        assert selects and not any("password_hash" in sql for sql in selects)
+
+    def test_summary_matches_entity(self):
+        summary = self.repository.find_summary_by_id(self.user.id)
+        entity = self.repository.find_by_id(self.user.id)
+
+        assert (summary.email, summary.username, summary.role, summary.is_active, summary.created_at) == (
+            entity.email, entity.username, entity.role, entity.is_active, entity.created_at,
+        )
+
+    def test_summary_reuses_identity_map_row(self):
+        with identity_map_scope():
+            self.repository.find_by_id(self.user.id)
+            with CaptureQueriesContext(connection) as ctx:
+                summary = self.repository.find_summary_by_id(self.user.id)
+
+        assert summary.email == "reader@test.com"
+        assert _user_selects(ctx) == []
+
+    def test_async_reads_skip_password_hash(self):
+        repository = AsyncDjangoUserRepository(self.repository)
+
+        async def read():
+            page = await repository.find_page(PageRequest(size=10))
+            return page.items + [await repository.find_summary_by_id(self.user.id)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = async_to_sync(read)()
+
+        assert all(isinstance(s, UserSummary) for s in results)
+        selects = _user_selects(ctx)
+        assert selects and not any("password_hash" in sql for sql in selects)
+
+    def test_write_paths_still_load_entities(self):
+        user = self.repository.find_by_id(self.user.id)
+
+        assert user.password_hash
+
+
+@pytest.mark.django_db
+def test_user_detail_does_not_select_password_hash_for_other_users():
+    repository = DjangoUserRepository()
+    admin = repository.save(UserFactory.create("boss@test.com", "bossuser", "Password123", role=UserRole.ADMIN))
+    other = repository.save(UserFactory.create("other@test.com", "otheruser", "Password123"))
+    get_principal_cache().clear()
+    client = APIClient()
+    client.cookies["access_token"] = _generate_tokens(admin)["access"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(f"/api/users/{other.id}/")
+
+    other_pk = other.id.replace("-", "")
+    assert response.status_code == 200
+    assert "password_hash" not in response.json()["data"]["attributes"]
+    assert not any("password_hash" in sql and other_pk in sql for sql in _user_selects(ctx))
@@ -0,0 +1,134 @@
+"""
+Tests del pool de conexiones RabbitMQ y del publicador que lo usa.
+No requieren broker: las conexiones pika se sustituyen por mocks.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pika.exceptions import StreamLostError
+
+from users.domain.events import UserCreated
+from users.infrastructure.event_publisher import RabbitMQEventPublisher
+from users.infrastructure.rabbitmq_pool import RabbitMQChannelPool, RabbitMQPoolExhausted
+
+
+def _fake_connection() -> MagicMock:
+    """Conexión pika falsa con un canal abierto."""
+    connection = MagicMock()
+    connection.is_open = True
+    connection.channel.return_value.is_open = True
+    return connection
+
+
+def _event() -> UserCreated:
+    return UserCreated(
+        occurred_at=datetime.now(),
+        user_id="123",
+        email="test@example.com",
+        username="testuser",
+    )
+
+
+class TestRabbitMQChannelPool:
+    """Tests del ciclo de vida del pool."""
+
+    def test_reuses_connection_between_checkouts(self):
+        factory = MagicMock(side_effect=_fake_connection)
+        pool = RabbitMQChannelPool(factory, max_size=2)
+
+        with pool.channel() as first:
+            pass
+        with pool.channel() as second:
+            pass
+
+        assert first is second
+        assert factory.call_count == 1
+        stats = pool.stats()
+        assert stats["connections_created"] == 1
+        assert stats["reuses"] == 1
+        assert stats["idle"] == 1
+        assert stats["in_use"] == 0
+
+    def test_broken_channel_is_discarded_and_recreated(self):
+        factory = MagicMock(side_effect=_fake_connection)
+        pool = RabbitMQChannelPool(factory, max_size=1)
+
+        with pytest.raises(StreamLostError):
+            with pool.channel():
+                raise StreamLostError("conexión perdida")
+
+        with pool.channel():
+            pass
+
+        assert factory.call_count == 2
+        assert pool.stats()["discarded"] == 1
+        assert pool.stats()["size"] == 1
+
+    def test_closed_idle_connection_is_replaced(self):
+        factory = MagicMock(side_effect=_fake_connection)
+        pool = RabbitMQChannelPool(factory, max_size=1)
+
+        with pool.channel() as pooled:
+            pass
+        pooled.connection.is_open = False
+
+        with pool.channel() as fresh:
+            pass
+
+        assert fresh is not pooled
+        assert factory.call_count == 2
+
+    def test_exhausted_pool_raises_after_timeout(self):
+        pool = RabbitMQChannelPool(MagicMock(side_effect=_fake_connection), max_size=1, acquire_timeout=0.01)
+
+        with pool.channel():
+            with pytest.raises(RabbitMQPoolExhausted):
+                with pool.channel():
+                    pass
+
+        assert pool.stats()["exhausted"] == 1
+
+    def test_reset_after_fork_forgets_parent_connections(self):
+        factory = MagicMock(side_effect=_fake_connection)
+        pool = RabbitMQChannelPool(factory, max_size=1)
+        with pool.channel() as parent:
+            pass
+
+        with patch("users.infrastructure.rabbitmq_pool.os.getpid", return_value=-1):
+            with pool.channel() as child:
+                pass
+
+        assert child is not parent
+        parent.connection.close.assert_not_called()
+        assert pool.stats()["connections_created"] == 1
+
+
+class TestRabbitMQEventPublisherPooling:
+    """El publicador reutiliza el pool y reconecta de forma transparente."""
+
+    def test_publishes_many_events_over_one_connection(self):
+        factory = MagicMock(side_effect=_fake_connection)
+        publisher = RabbitMQEventPublisher(pool=RabbitMQChannelPool(factory))
+
+        for _ in range(3):
+            publisher.publish(_event(), 'user.created')
+
+        assert factory.call_count == 1
+        with publisher.pool.channel() as pooled:
+            assert pooled.channel.basic_publish.call_count == 3
+            # El exchange se declara una sola vez por canal
+            assert pooled.channel.exchange_declare.call_count == 1
+
+    def test_retries_once_on_lost_connection(self):
+        broken = _fake_connection()
+        broken.channel.return_value.basic_publish.side_effect = StreamLostError("reset")
+        healthy = _fake_connection()
+        factory = MagicMock(side_effect=[broken, healthy])
+        publisher = RabbitMQEventPublisher(pool=RabbitMQChannelPool(factory))
+
+        publisher.publish(_event(), 'user.created')
+
+        healthy.channel.return_value.basic_publish.assert_called_once()
+        assert publisher.pool_stats()["discarded"] == 1
@@ -0,0 +1,102 @@
+"""
+Tests del registro sin consulta previa: la unicidad de email y username la
+garantizan las restricciones de ``users`` y el repositorio traduce su
+violación a ``UserAlreadyExists`` (409 con el campo en conflicto).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import pytest
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.domain.exceptions import UserAlreadyExists
+from users.domain.factories import UserFactory
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User as DjangoUser
+
+PAYLOAD = {"email": "race@test.com", "username": "raceuser", "password": "Password123"}
+
+
+def _register(client, **overrides):
+    return client.post("/api/auth/", {**PAYLOAD, **overrides}, format="json")
+
+
+@pytest.mark.django_db
+class TestUniqueConstraintConflicts:
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_registration_is_a_single_insert(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = _register(self.client)
+
+        user_queries = [q["sql"] for q in ctx.captured_queries if '"users"' in q["sql"]]
+        assert response.status_code == 201
+        assert [sql.split()[0] for sql in user_queries] == ["INSERT"]
+
+    @pytest.mark.parametrize("overrides, field", [
+        ({"username": "otheruser", "email": "RACE@test.com"}, "email"),
+        ({"email": "other@test.com"}, "username"),
+    ])
+    def test_duplicate_maps_to_conflict_on_field(self, overrides, field):
+        _register(self.client)
+
+        response = _register(self.client, **overrides)
+
+        error = response.json()["errors"][0]
+        assert response.status_code == 409
+        assert error["code"] == "user_already_exists"
+        assert error["source"] == {"pointer": f"/data/attributes/{field}"}
+
+    def test_transaction_stays_usable_after_conflict(self):
+        repository = DjangoUserRepository()
+        repository.save(UserFactory.create("taken@test.com", "takenuser", "Password123"))
+
+        with transaction.atomic():
+            with pytest.raises(UserAlreadyExists) as exc_info:
+                repository.save(UserFactory.create("taken@test.com", "freshuser", "Password123"))
+            assert DjangoUser.objects.filter(email="taken@test.com").count() == 1
+
+        assert exc_info.value.field == "email"
+
+    def test_email_change_conflict_maps_to_user_already_exists(self):
+        repository = DjangoUserRepository()
+        repository.save(UserFactory.create("first@test.com", "firstuser", "Password123"))
+        second = repository.save(UserFactory.create("second@test.com", "seconduser", "Password123"))
+
+        second = repository.find_by_id(second.id)
+        second.change_email("first@test.com")
+        with pytest.raises(UserAlreadyExists) as exc_info:
+            repository.save(second)
+
+        assert (exc_info.value.field, exc_info.value.value) == ("email", "first@test.com")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_identical_registrations():
+    """N registros idénticos en paralelo: exactamente un 201 y N-1 409."""
+    attempts = 8
+    barrier = threading.Barrier(attempts)
+    # La base SQLite en memoria de los tests no admite escritores concurrentes
+    # ("database table is locked"): ahí los requests se serializan. En
+    # PostgreSQL corren en paralelo y compiten por la restricción única.
+    serialize = threading.Lock() if connection.vendor == "sqlite" else nullcontext()
+
+    def register():
+        try:
+            barrier.wait()
+            with serialize:
+                return _register(APIClient()).status_code
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=attempts) as pool:
+        statuses = sorted(pool.map(lambda _: register(), range(attempts)))
+
+    assert statuses == [201] + [409] * (attempts - 1)
+    assert DjangoUser.objects.filter(email=PAYLOAD["email"]).count() == 1
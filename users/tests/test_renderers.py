@@ -0,0 +1,108 @@
+"""
+Tests del renderer/parser JSON (orjson con fallback a la librería estándar).
+"""
+
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from users import renderers
+from users.api_response import user_resource
+from users.application.use_cases import _generate_tokens
+from users.domain.entities import User, UserRole
+from users.domain.factories import UserFactory
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+
+CREATED = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(renderers, "orjson", None)
+    return request.param
+
+
+def _user():
+    return User(
+        id=str(uuid.uuid4()), email="render@test.com", username="renderuser", password_hash="x",
+        is_active=True, role=UserRole.USER, created_at=CREATED,
+    )
+
+
+class TestFastJSONRenderer:
+
+    def test_serializes_datetime_and_uuid(self, backend):
+        key = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+        body = renderers.FastJSONRenderer().render({"at": CREATED, "id": key, "n": "ñ"})
+
+        assert json.loads(body) == {"at": CREATED.isoformat(), "id": str(key), "n": "ñ"}
+        assert b" " not in body and "ñ".encode() in body
+
+    def test_user_resource_renders_iso_created_at(self, backend):
+        user = _user()
+
+        body = json.loads(renderers.JSONAPIRenderer().render({"data": user_resource(user)}))
+
+        assert body["data"]["attributes"]["created_at"] == "2026-03-01T12:30:15.123456+00:00"
+
+    def test_none_renders_empty_body(self, backend):
+        assert renderers.FastJSONRenderer().render(None) == b""
+
+    def test_backends_produce_same_output(self, monkeypatch):
+        pytest.importorskip("orjson")
+        data = {"data": [user_resource(_user()) for _ in range(3)], "meta": {"count": 3}}
+
+        fast = renderers.dumps(data)
+        monkeypatch.setattr(renderers, "orjson", None)
+
+        assert renderers.dumps(data) == fast
+
+
+class TestFastJSONParser:
+
+    def test_parses_body(self, backend):
+        parsed = renderers.JSONAPIParser().parse(io.BytesIO(b'{"email": "a@b.com"}'))
+
+        assert parsed == {"email": "a@b.com"}
+
+    def test_invalid_json_raises_parse_error(self, backend):
+        with pytest.raises(ParseError):
+            renderers.FastJSONParser().parse(io.BytesIO(b"{nope"))
+
+
+@pytest.mark.django_db
+class TestJSONAPIRequests:
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        self.user = DjangoUserRepository().save(UserFactory.create("json@test.com", "jsonuser", "Password123"))
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    def test_accepts_jsonapi_request_body(self):
+        response = self.client.patch(
+            f"/api/users/{self.user.id}/",
+            data=json.dumps({"email": "json2@test.com"}),
+            content_type="application/vnd.api+json",
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["attributes"]["email"] == "json2@test.com"
+
+    def test_malformed_body_is_400(self):
+        response = self.client.patch(
+            f"/api/users/{self.user.id}/", data="{nope", content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["code"] == "parse_error"
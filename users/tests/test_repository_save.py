@@ -0,0 +1,121 @@
+"""
+Tests del guardado por campos modificados y el bloqueo optimista.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.exceptions import ConcurrentModification, UserNotFound
+from users.domain.factories import UserFactory
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+from users.models import User
+
+
+def _users_queries(ctx, verb):
+    return [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(verb) and '"users"' in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestDirtyFieldSave:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+        self.user = self.repository.save(UserFactory.create("dirty@test.com", "dirtyuser", "Password123"))
+
+    def test_deactivate_is_one_update_of_changed_fields(self):
+        user = self.repository.find_by_id(self.user.id)
+        user.deactivate()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.repository.save(user)
+
+        assert len(ctx.captured_queries) == 1
+        (update,) = _users_queries(ctx, "UPDATE")
+        assert '"is_active"' in update and '"token_version"' in update and '"version"' in update
+        assert '"email"' not in update and '"password_hash"' not in update
+        row = User.objects.get(pk=self.user.id)
+        assert (row.is_active, row.token_version, row.version) == (False, 1, 1)
+        assert user.version == 1 and user.dirty_fields() == frozenset()
+
+    def test_save_without_changes_writes_nothing(self):
+        user = self.repository.find_by_id(self.user.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.repository.save(user)
+
+        assert ctx.captured_queries == []
+
+    def test_stale_version_raises_conflict(self):
+        first = self.repository.find_by_id(self.user.id)
+        second = self.repository.find_by_id(self.user.id)
+        first.change_email("first@test.com")
+        self.repository.save(first)
+
+        second.deactivate()
+        with pytest.raises(ConcurrentModification):
+            self.repository.save(second)
+
+        assert User.objects.get(pk=self.user.id).is_active is True
+
+    def test_stale_version_allowed_without_optimistic_locking(self, settings):
+        settings.USERS_OPTIMISTIC_LOCKING = False
+        first = self.repository.find_by_id(self.user.id)
+        second = self.repository.find_by_id(self.user.id)
+        first.change_email("first@test.com")
+        self.repository.save(first)
+
+        second.deactivate()
+        self.repository.save(second)
+
+        row = User.objects.get(pk=self.user.id)
+        assert (row.email, row.is_active) == ("first@test.com", False)
+
+    def test_missing_user_raises_not_found(self):
+        user = self.repository.find_by_id(self.user.id)
+        User.objects.filter(pk=self.user.id).delete()
+        user.deactivate()
+
+        with pytest.raises(UserNotFound):
+            self.repository.save(user)
+
+
+@pytest.mark.django_db
+class TestRoundTrips:
+
+    def setup_method(self):
+        get_principal_cache().clear()
+        repository = DjangoUserRepository()
+        self.admin = repository.save(UserFactory.create("rt-admin@test.com", "rtadmin", "Password123"))
+        self.target = repository.save(UserFactory.create("rt-target@test.com", "rttarget", "Password123"))
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.admin)["access"]
+
+    def test_deactivate_reads_once_and_updates_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(f"/api/users/{self.target.id}/deactivate/")
+
+        assert response.status_code == 200
+        target_pk = self.target.id.replace("-", "")
+        assert len([q for q in _users_queries(ctx, "SELECT") if target_pk in q]) == 1
+        assert len(_users_queries(ctx, "UPDATE")) == 1
+
+    def test_concurrent_modification_is_409(self, monkeypatch, settings):
+        # La escritura concurrente simulada corre dentro del request
+        settings.USERS_QUERY_BUDGET_MODE = "off"
+        original = DjangoUserRepository.find_by_id
+
+        def stale_find_by_id(repository, user_id):
+            user = original(repository, user_id)
+            User.objects.filter(pk=user_id).update(version=user.version + 1)
+            return user
+
+        monkeypatch.setattr(DjangoUserRepository, "find_by_id", stale_find_by_id)
+
+        response = self.client.post(f"/api/users/{self.target.id}/deactivate/")
+
+        assert response.status_code == 409
+        assert response.json()["errors"][0]["code"] == "concurrent_modification"
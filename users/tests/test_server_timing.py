@@ -0,0 +1,154 @@
+"""
+Tests de ``Server-Timing`` por fase y de los presupuestos de consultas.
+"""
+
+import logging
+import re
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.application.use_cases import _generate_tokens
+from users.domain.entities import UserRole
+from users.domain.factories import UserFactory
+from users.infrastructure.identity_map import identity_map_scope
+from users.infrastructure.principal_cache import get_principal_cache
+from users.infrastructure.repository import DjangoUserRepository
+from users.infrastructure.request_profile import (
+    QueryBudgetExceeded,
+    phase,
+    query_budget,
+    request_profile_scope,
+)
+from users.models import User as DjangoUser
+
+
+def _timings(response):
+    """``{fase: (ms, desc)}`` a partir de la cabecera ``Server-Timing``."""
+    timings = {}
+    for entry in response["Server-Timing"].split(", "):
+        name, *params = entry.split(";")
+        values = dict(param.split("=", 1) for param in params)
+        timings[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return timings
+
+
+@pytest.mark.django_db
+class TestServerTiming:
+
+    def setup_method(self):
+        repository = DjangoUserRepository()
+        self.admin = repository.save(
+            UserFactory.create("timing@test.com", "timinguser", "Password123", role=UserRole.ADMIN)
+        )
+        self.other = repository.save(UserFactory.create("target@test.com", "targetuser", "Password123"))
+        get_principal_cache().clear()
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.admin)["access"]
+
+    def test_read_breaks_down_phases(self):
+        response = self.client.get(f"/api/users/{self.other.id}/")
+
+        timings = _timings(response)
+        assert {"auth", "use_case", "serialization", "db", "total"} <= set(timings)
+        assert timings["db"][1] == "2 queries"
+        assert timings["total"][0] >= timings["use_case"][0]
+
+    def test_write_includes_validation(self):
+        response = self.client.patch(f"/api/users/{self.other.id}/", {"email": "moved@test.com"}, format="json")
+
+        assert response.status_code == 200
+        assert "validation" in _timings(response)
+
+    def test_only_api_responses_carry_header(self):
+        assert not Client().get("/metrics").has_header("Server-Timing")
+
+    def test_can_be_disabled(self, settings):
+        settings.USERS_SERVER_TIMING = False
+
+        assert not self.client.get(f"/api/users/{self.other.id}/").has_header("Server-Timing")
+
+
+@pytest.mark.django_db
+class TestQueryBudget:
+
+    def setup_method(self):
+        self.repository = DjangoUserRepository()
+        self.user = self.repository.save(UserFactory.create("budget@test.com", "budgetuser", "Password123"))
+        self.other = self.repository.save(UserFactory.create("budget2@test.com", "budgetuser2", "Password123"))
+        get_principal_cache().clear()
+        self.client = APIClient()
+        self.client.cookies["access_token"] = _generate_tokens(self.user)["access"]
+
+    def _with_extra_query(self, monkeypatch):
+        original = DjangoUserRepository.find_summary_by_id
+
+        def n_plus_one(repository, user_id):
+            DjangoUser.objects.filter(pk=user_id).exists()
+            return original(repository, user_id)
+
+        monkeypatch.setattr(DjangoUserRepository, "find_summary_by_id", n_plus_one)
+
+    def test_retrieve_fits_its_budget_with_cold_caches(self):
+        response = self.client.get(f"/api/users/{self.other.id}/")
+
+        assert response.status_code == 200
+        assert _timings(response)["db"][1] == "2 queries"
+
+    def test_exceeding_budget_fails_in_raise_mode(self, monkeypatch):
+        self._with_extra_query(monkeypatch)
+
+        with pytest.raises(QueryBudgetExceeded, match=r"UserViewSet\.retrieve ejecutó 3 consultas"):
+            self.client.get(f"/api/users/{self.other.id}/")
+
+    def test_exceeding_budget_only_warns_in_production(self, monkeypatch, settings, caplog):
+        settings.USERS_QUERY_BUDGET_MODE = "warn"
+        self._with_extra_query(monkeypatch)
+
+        with caplog.at_level(logging.WARNING, logger="users.infrastructure.request_profile"):
+            response = self.client.get(f"/api/users/{self.other.id}/")
+
+        assert response.status_code == 200
+        assert re.search(r"UserViewSet\.retrieve ejecutó 3 consultas \(presupuesto: 2\)", caplog.text)
+
+    def test_etag_lookup_and_detail_share_one_query(self):
+        with identity_map_scope(), CaptureQueriesContext(connection) as ctx:
+            updated_at = self.repository.find_updated_at(self.other.id)
+            summary = self.repository.find_summary_by_id(self.other.id)
+
+        assert len(ctx.captured_queries) == 1
+        assert summary.email == "budget2@test.com" and updated_at is not None
+
+    def test_loading_the_full_row_replaces_the_summary(self):
+        with identity_map_scope():
+            self.repository.find_updated_at(self.other.id)
+            user = self.repository.find_by_id(self.other.id)
+            user.change_email("fresh@test.com")
+            self.repository.save(user)
+
+            assert self.repository.find_summary_by_id(self.other.id).email == "fresh@test.com"
+
+
+class TestRequestProfile:
+
+    def test_nested_phase_is_counted_once(self):
+        with request_profile_scope() as profile:
+            with phase("serialization"):
+                with phase("serialization"):
+                    pass
+
+        assert list(profile.phases) == ["serialization"]
+
+    def test_budget_decorator_supports_async_views(self):
+        @query_budget(1)
+        async def get(view, request):
+            return "ok"
+
+        with request_profile_scope() as profile:
+            assert async_to_sync(get)(None, None) == "ok"
+
+        assert profile.budget.max_queries == 1
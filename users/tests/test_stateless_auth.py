@@ -0,0 +1,136 @@
+"""
+Tests del modo de autenticación sin estado (JWT_STATELESS_AUTH).
+
+Verifica que el usuario se resuelve desde los claims del token sin
+consultar la base de datos y que la revocación funciona vía token_version.
+"""
+
+import hashlib
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.infrastructure.claims_principal import ClaimsPrincipal
+from users.infrastructure.token_revocation import check_revocation_cache, is_token_revoked, revoke_tokens
+from users.models import User
+
+PASSWORD = "Password123"
+
+
+@pytest.fixture
+def user(db):
+    cache.clear()
+    return User.objects.create(
+        email="stateless@example.com",
+        username="stateless",
+        password_hash=hashlib.sha256(PASSWORD.encode()).hexdigest(),
+        role="USER",
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def client(user):
+    api_client = APIClient()
+    response = api_client.post(
+        "/api/auth/login/",
+        {"email": user.email, "password": PASSWORD},
+        format="json",
+    )
+    assert response.status_code == 200
+    return api_client
+
+
+class TestStatelessAuthentication:
+    """Autenticación a partir de claims."""
+
+    @pytest.fixture(autouse=True)
+    def stateless_mode(self, settings):
+        settings.JWT_STATELESS_AUTH = True
+
+    def test_me_does_not_query_the_database(self, client, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            response = client.get("/api/auth/me/")
+
+        assert response.status_code == 200
+        attributes = response.json()["data"]["attributes"]
+        assert attributes["email"] == "stateless@example.com"
+        assert attributes["username"] == "stateless"
+        assert attributes["role"] == "USER"
+
+    def test_deactivation_revokes_existing_tokens(
+        self, client, user, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(f"/api/users/{user.id}/deactivate/", {}, format="json")
+        assert response.status_code == 200
+
+        user.refresh_from_db()
+        assert user.token_version == 1
+        assert client.get("/api/auth/me/").status_code == 401
+        assert client.post("/api/auth/refresh/").status_code == 401
+
+    def test_token_without_claims_falls_back_to_db(self, user):
+        legacy = RefreshToken()
+        legacy["user_id"] = str(user.id)
+        api_client = APIClient()
+        api_client.cookies["access_token"] = str(legacy.access_token)
+
+        response = api_client.get("/api/auth/me/")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["attributes"]["email"] == user.email
+
+
+class TestTokenRevocation:
+    """Lista de revocación basada en token_version."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_unknown_user_is_not_revoked(self):
+        assert is_token_revoked("u1", 0) is False
+
+    def test_older_versions_are_revoked(self):
+        revoke_tokens("u1", 2)
+
+        assert is_token_revoked("u1", 1) is True
+        assert is_token_revoked("u1", 2) is False
+
+    def test_revoke_all(self):
+        revoke_tokens("u1", None)
+
+        assert is_token_revoked("u1", 10_000) is True
+
+    def test_principal_requires_all_claims(self):
+        token = RefreshToken()
+        token["user_id"] = "u1"
+        token["email"] = "a@b.com"
+
+        assert ClaimsPrincipal.from_token(token) is None
+
+
+class TestRevocationCacheCheck:
+
+    def test_silent_when_stateless_mode_is_off(self, settings):
+        settings.JWT_STATELESS_AUTH = False
+
+        assert check_revocation_cache() == []
+
+    @pytest.mark.parametrize("backend, check_id", [
+        ("django.core.cache.backends.locmem.LocMemCache", "users.W001"),
+        ("django.core.cache.backends.dummy.DummyCache", "users.E001"),
+    ])
+    def test_per_process_caches_are_reported(self, settings, backend, check_id):
+        settings.JWT_STATELESS_AUTH = True
+        settings.CACHES = {"default": {"BACKEND": backend}}
+
+        assert [message.id for message in check_revocation_cache()] == [check_id]
+
+    def test_shared_cache_passes(self, settings):
+        settings.JWT_STATELESS_AUTH = True
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache"}}
+
+        assert check_revocation_cache() == []
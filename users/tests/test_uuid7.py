@@ -0,0 +1,66 @@
+"""
+Tests del generador de UUIDv7 y su uso como PK de usuarios.
+"""
+
+import time
+import uuid
+
+import pytest
+
+from users.domain.factories import UserFactory
+from users.infrastructure import uuid7 as uuid7_module
+from users.infrastructure.repository import DjangoUserRepository
+from users.infrastructure.uuid7 import uuid7_timestamp_ms
+from users.models import User as DjangoUser
+
+
+class TestUUID7:
+
+    def test_version_variant_and_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7_module._uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert before <= uuid7_timestamp_ms(value) <= after + 1
+
+    def test_strictly_increasing_within_process(self):
+        values = [uuid7_module._uuid7() for _ in range(10_000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    def test_counter_overflow_and_clock_skew_stay_monotonic(self, monkeypatch):
+        now = [time.time_ns()]
+        monkeypatch.setattr(uuid7_module.time, "time_ns", lambda: now[0])
+
+        first = [uuid7_module._uuid7() for _ in range(5000)]  # más que el contador de 12 bits
+        now[0] -= 10_000_000_000  # el reloj retrocede 10 s
+        second = [uuid7_module._uuid7() for _ in range(10)]
+
+        values = first + second
+        assert values == sorted(values) and len(set(values)) == len(values)
+        assert uuid7_timestamp_ms(first[-1]) > uuid7_timestamp_ms(first[0])
+
+
+@pytest.mark.django_db
+class TestUserPrimaryKey:
+
+    def test_new_users_get_time_ordered_ids(self):
+        repository = DjangoUserRepository()
+        ids = [
+            repository.save(UserFactory.create(f"v7-{i}@test.com", f"v7user{i}", "Password123")).id
+            for i in range(3)
+        ]
+
+        assert all(uuid.UUID(i).version == 7 for i in ids)
+        assert ids == sorted(ids)
+
+    def test_existing_uuid4_ids_remain_valid(self):
+        legacy_id = uuid.uuid4()
+        DjangoUser.objects.create(id=legacy_id, email="v4@test.com", username="v4user", password_hash="x")
+
+        user = DjangoUserRepository().find_by_id(str(legacy_id))
+
+        assert user is not None and user.username == "v4user"
@@ -7,7 +7,8 @@ users/urls.py
 Define las rutas de la API REST.
 
 ✅ EJEMPLO de lo que DEBE ir aquí:
-    from django.urls import path, include
+    from django.conf import settings
+from django.urls import path, re_path, include
     from rest_framework.routers import DefaultRouter
     from .views import UserViewSet
 
@@ -31,7 +32,8 @@ Define las rutas de la API REST.
 💡 Los routers de DRF generan las URLs automáticamente siguiendo convenciones REST.
 """
 
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, re_path, include
 from rest_framework.routers import SimpleRouter
 from .views import HealthCheckView, AuthViewSet, CookieTokenRefreshView, UserViewSet
 
@@ -47,7 +49,24 @@ router.register(r'auth', AuthViewSet, basename='auth')
 # Registrar UserViewSet para CRUD de usuarios
 router.register(r'users', UserViewSet, basename='user')
 
-urlpatterns = [
+urlpatterns = []
+
+# Despliegue ASGI: las lecturas de usuarios se atienden con vistas async.
+# Van antes del router para tener prioridad sobre las rutas equivalentes.
+if settings.USERS_ASYNC_VIEWS:
+    from .async_views import AsyncUserDetailView, AsyncUserListView, AsyncUsersByRoleView
+
+    urlpatterns += [
+        path('users/', AsyncUserListView.as_view(), name='user-list-async'),
+        re_path(
+            r'^users/(?!export/|changes/|lookup/)(?P<pk>[^/.]+)/$',
+            AsyncUserDetailView.as_view(),
+            name='user-detail-async',
+        ),
+        re_path(r'^auth/by-role/(?P<role>[^/.]+)/$', AsyncUsersByRoleView.as_view(), name='auth-by-role-async'),
+    ]
+
+urlpatterns += [
     # Health check endpoint
     path('health/', HealthCheckView.as_view(), name='health-check'),
 
@@ -14,6 +14,7 @@ HTTP-dominio que requieran cabeceras o logica extra (p.ej. Location, cookies).
 """
 
 import logging
+import re
 from typing import Any, Dict, cast
 
 from rest_framework.views import APIView
@@ -23,7 +24,12 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
-from django.db import connection
+from rest_framework_simplejwt.settings import api_settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, connections, transaction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from django.utils.cache import patch_vary_headers
 
 from .application.use_cases import (
     RegisterUserCommand,
@@ -31,24 +37,42 @@ from .application.use_cases import (
     GetUsersByRoleCommand,
     DeactivateUserCommand,
     ChangeUserEmailCommand,
-    RegisterUserUseCase,
-    LoginUseCase,
-    GetUsersByRoleUseCase,
-    GetUserUseCase,
-    ListUsersUseCase,
-    DeactivateUserUseCase,
-    ChangeUserEmailUseCase,
+    ResolveUsersCommand,
 )
-from .infrastructure.repository import DjangoUserRepository
-from .infrastructure.event_publisher import RabbitMQEventPublisher
+from .container import get_container
+from .infrastructure.db_pool import database_pool_stats
+from .infrastructure.db_router import REPLICA_ALIAS, replica_configured, routing_stats
+from .infrastructure.export import CONTENT_TYPES, FORMAT_NDJSON, export_users
+from .infrastructure.metrics import render_metrics
+from .infrastructure.password_hashing import hashing_pool_stats
+from .infrastructure.principal_cache import get_principal_cache
+from .infrastructure.rabbitmq_pool import pool_stats
+from .infrastructure.request_profile import phase, query_budget
+from .infrastructure.token_revocation import is_token_revoked
 from .infrastructure.cookie_utils import set_auth_cookies, clear_auth_cookies
+from .conditional import collection_etag, etag_condition, user_etag
+from .pagination import (
+    CREATED_AT_KEY,
+    USERNAME_KEY,
+    change_feed_links,
+    encode_cursor,
+    page_request_from_query,
+    page_size_from_query,
+    pagination_links,
+    since_from_query,
+)
+from .lookup import active_filter_from_query, resolve_command_from_query, resolve_response
+from .renderers import CSVRenderer, FastJSONRenderer, NDJSONRenderer
 from .serializers import (
     RegisterUserSerializer,
     LoginSerializer,
     UpdateUserSerializer,
     DeactivateUserSerializer,
+    ResolveUsersSerializer,
 )
+from .domain.entities import parse_role
 from .domain.exceptions import (
+    DomainException,
     UserNotFound,
 )
 from .api_response import (
@@ -56,12 +80,46 @@ from .api_response import (
     collection_response,
     no_content_response,
     unauthorized_error,
+    user_change_resource,
     user_resource,
     _meta,
 )
 
 logger = logging.getLogger(__name__)
 
+# Accept-Encoding que admite gzip (misma detección que GZipMiddleware)
+_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+# ===========================================================================
+# ETags (GET condicionales, ver users/conditional.py)
+# ===========================================================================
+
+def _me_etag(view, request):
+    # En modo sin estado el principal no tiene updated_at: sin ETag
+    return user_etag(request.user.pk, getattr(request.user, "updated_at", None))
+
+
+def _user_etag(view, request, pk=None):
+    try:
+        return user_etag(pk, view.repository.find_updated_at(pk))
+    except DjangoValidationError:
+        return None  # ID inválido: la acción responde el error
+
+
+def _users_etag(view, request):
+    return collection_etag(request, *view.repository.collection_state())
+
+
+def _by_role_etag(view, request, role=None):
+    try:
+        resolved = parse_role(role)
+    except DomainException:
+        return None  # rol inválido: la acción responde el error
+    if resolved is None:
+        return None
+    return collection_etag(request, *view.repository.collection_state(resolved), resolved.value)
+
 
 # ===========================================================================
 # Health Check
@@ -89,8 +147,25 @@ class HealthCheckView(APIView):
             "checks": {
                 "database": "connected",
             },
+            "pools": {
+                "database": database_pool_stats(),
+                "rabbitmq": pool_stats(),
+                "password_hashing": hashing_pool_stats(),
+            },
+            "caches": {
+                "principal": get_principal_cache().stats(),
+            },
+            "database_routing": routing_stats(),
         }
 
+        if replica_configured():
+            # La réplica caída no tumba el servicio, pero queda a la vista
+            try:
+                connections[REPLICA_ALIAS].ensure_connection()
+                health["checks"]["replica"] = "connected"
+            except Exception as e:
+                health["checks"]["replica"] = f"error: {e}"
+
         try:
             connection.ensure_connection()
         except Exception as e:
@@ -109,6 +184,19 @@ class HealthCheckView(APIView):
         )
 
 
+@require_GET
+def metrics_view(request):
+    """
+    GET /metrics
+
+    Métricas en formato de texto de Prometheus (latencias por ruta,
+    consultas por request, publicación en RabbitMQ, caché de principals).
+    Con ``PROMETHEUS_MULTIPROC_DIR`` agrega los valores de todos los workers.
+    """
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
+
+
 # ===========================================================================
 # Auth ViewSet
 # ===========================================================================
@@ -129,8 +217,8 @@ class AuthViewSet(viewsets.ViewSet):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.repository = DjangoUserRepository()
-        self.event_publisher = RabbitMQEventPublisher()
+        self.container = get_container()
+        self.repository = self.container.repository
 
     def get_permissions(self):
         """Permite acceso publico a register, login y logout."""
@@ -139,6 +227,7 @@ class AuthViewSet(viewsets.ViewSet):
         return super().get_permissions()
 
     # -- POST /api/auth/  ->  Register ------------------------------------
+    @query_budget(2)
     def create(self, request):
         """
         Registrar un nuevo usuario.
@@ -150,7 +239,7 @@ class AuthViewSet(viewsets.ViewSet):
             JSON:API resource object + HttpOnly auth cookies.
 
         Errors:
-            409 Conflict -- email ya registrado.
+            409 Conflict -- email o username ya registrado.
             422 Unprocessable Entity -- datos invalidos.
         """
         serializer = RegisterUserSerializer(data=request.data)
@@ -163,14 +252,13 @@ class AuthViewSet(viewsets.ViewSet):
             username=data["username"],
             password=data["password"],
         )
-        use_case = RegisterUserUseCase(
-            repository=self.repository,
-            event_publisher=self.event_publisher,
-        )
+        use_case = self.container.register_user
 
         # Excepciones de dominio (UserAlreadyExists, InvalidEmail, etc.)
         # se propagan al exception handler global.
-        auth_result = use_case.execute(command)
+        # El usuario y su evento (outbox) se confirman en la misma transacción.
+        with phase("use_case"), transaction.atomic():
+            auth_result = use_case.execute(command)
         user = auth_result["user"]
         tokens = auth_result["tokens"]
 
@@ -184,6 +272,7 @@ class AuthViewSet(viewsets.ViewSet):
 
     # -- POST /api/auth/login/ --------------------------------------------
     @action(detail=False, methods=["post"], url_path="login")
+    @query_budget(2)
     def login(self, request):
         """
         Autenticar un usuario existente.
@@ -204,9 +293,10 @@ class AuthViewSet(viewsets.ViewSet):
         data = cast(Dict[str, Any], serializer.validated_data)
 
         command = LoginCommand(email=data["email"], password=data["password"])
-        use_case = LoginUseCase(repository=self.repository)
+        use_case = self.container.login
 
-        auth_result = use_case.execute(command)
+        with phase("use_case"):
+            auth_result = use_case.execute(command)
         user = auth_result["user"]
         tokens = auth_result["tokens"]
 
@@ -216,12 +306,17 @@ class AuthViewSet(viewsets.ViewSet):
 
     # -- GET /api/auth/me/ ------------------------------------------------
     @action(detail=False, methods=["get"], url_path="me")
+    @query_budget(1)
+    @etag_condition(_me_etag)
     def me(self, request):
         """
         Datos del usuario autenticado.
 
         Success 200 OK:
-            JSON:API resource object con datos del usuario actual.
+            JSON:API resource object con datos del usuario actual y ETag.
+
+        Success 304 Not Modified:
+            If-None-Match coincide con el ETag actual (sin cuerpo).
 
         Errors:
             401 Unauthorized -- no autenticado.
@@ -254,6 +349,8 @@ class AuthViewSet(viewsets.ViewSet):
 
     # -- GET /api/auth/by-role/{role}/ ------------------------------------
     @action(detail=False, methods=["get"], url_path=r"by-role/(?P<role>[^/.]+)")
+    @query_budget(3)
+    @etag_condition(_by_role_etag)
     def by_role(self, request, role=None):
         """
         Obtener usuarios filtrados por rol.
@@ -261,18 +358,34 @@ class AuthViewSet(viewsets.ViewSet):
         Path parameters:
             role -- "ADMIN" o "USER".
 
+        Query parameters:
+            page[size]   -- tamaño de página (default 50, máximo 200).
+            page[after]  -- cursor de ``links.next``.
+            page[before] -- cursor de ``links.prev``.
+
         Success 200 OK:
-            JSON:API collection de usuarios.
+            JSON:API collection de usuarios ordenada por username,
+            con ``links.next`` / ``links.prev`` y ETag.
+
+        Success 304 Not Modified:
+            If-None-Match coincide con el ETag actual (sin cuerpo).
 
         Errors:
+            400 Bad Request -- parámetros de paginación inválidos.
             422 Unprocessable Entity -- rol invalido.
         """
         command = GetUsersByRoleCommand(role=role)
-        use_case = GetUsersByRoleUseCase(repository=self.repository)
-        users = use_case.execute(command)
-
-        resources = [user_resource(u, request=request) for u in users]
-        return collection_response(resources, status=status.HTTP_200_OK)
+        page_request = page_request_from_query(request, USERNAME_KEY)
+        use_case = self.container.get_users_by_role
+        with phase("use_case"):
+            page = use_case.execute_page(command, page_request)
+
+        resources = [user_resource(u, request=request) for u in page.items]
+        return collection_response(
+            resources,
+            status=status.HTTP_200_OK,
+            links=pagination_links(request, page, page_request),
+        )
 
 
 # ===========================================================================
@@ -305,6 +418,11 @@ class CookieTokenRefreshView(APIView):
 
         try:
             refresh = RefreshToken(refresh_token)
+            if is_token_revoked(
+                str(refresh.get(api_settings.USER_ID_CLAIM, "")),
+                int(refresh.get("token_version", 0)),
+            ):
+                raise TokenError("Token revoked")
             new_access = str(refresh.access_token)
             new_refresh = str(refresh)
 
@@ -347,6 +465,10 @@ class UserViewSet(viewsets.ViewSet):
 
     Endpoints:
         GET    /api/users/                   -- Listar usuarios (200).
+        GET    /api/users/?filter[id]=a,b    -- Resolver un lote por ID / email (200).
+        POST   /api/users/lookup/            -- Resolver un lote grande por ID / email (200).
+        GET    /api/users/export/            -- Exportar todos (NDJSON | CSV, streaming).
+        GET    /api/users/changes/           -- Feed de cambios desde un cursor (200).
         GET    /api/users/{id}/              -- Obtener usuario (200 | 404).
         PATCH  /api/users/{id}/              -- Actualizar email (200 | 404 | 409 | 422).
         POST   /api/users/{id}/deactivate/   -- Desactivar usuario (200 | 404 | 409).
@@ -357,39 +479,183 @@ class UserViewSet(viewsets.ViewSet):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.repository = DjangoUserRepository()
-        self.event_publisher = RabbitMQEventPublisher()
+        self.container = get_container()
+        self.repository = self.container.repository
 
     # -- GET /api/users/ --------------------------------------------------
+    @query_budget(3)
+    @etag_condition(_users_etag)
     def list(self, request):
         """
-        Listar todos los usuarios del sistema.
+        Listar los usuarios del sistema (más recientes primero), paginados.
+
+        Query parameters:
+            page[size]   -- tamaño de página (default 50, máximo 200).
+            page[after]  -- cursor de ``links.next``.
+            page[before] -- cursor de ``links.prev``.
+            filter[is_active] -- ``true`` / ``false``: solo usuarios activos / inactivos.
+            filter[id], filter[email] -- listas separadas por coma: en lugar
+                de paginar, resuelve esos usuarios en una consulta ``IN``
+                (ver ``users/lookup.py``); los no encontrados van en
+                ``meta.missing``.
+
+        Success 200 OK:
+            JSON:API collection con meta.count, ``links.next`` / ``links.prev`` y ETag.
+
+        Success 304 Not Modified:
+            If-None-Match coincide con el ETag actual (sin cuerpo).
+
+        Errors:
+            400 Bad Request -- parámetros de paginación o filtros inválidos, o más de
+                ``USERS_LOOKUP_MAX`` valores en los filtros.
+        """
+        command = resolve_command_from_query(request)
+        if command is not None:
+            with phase("use_case"):
+                result = self.container.resolve_users.execute(command)
+            return resolve_response(request, result)
+
+        page_request = page_request_from_query(request, CREATED_AT_KEY)
+        is_active = active_filter_from_query(request)
+        use_case = self.container.list_users
+        with phase("use_case"):
+            page = use_case.execute_page(page_request, is_active)
+        resources = [user_resource(u, request=request) for u in page.items]
+        return collection_response(
+            resources,
+            status=status.HTTP_200_OK,
+            links=pagination_links(request, page, page_request),
+        )
+
+    # -- POST /api/users/lookup/ ------------------------------------------
+    @action(detail=False, methods=["post"], url_path="lookup")
+    @query_budget(3)
+    def lookup(self, request):
+        """
+        Resolver un lote de usuarios por ID y/o email (sin límite de URL).
+
+        Request body:
+            { "ids": ["uuid", ...], "emails": ["a@example.com", ...] }
 
         Success 200 OK:
-            JSON:API collection con meta.count.
+            JSON:API collection con los usuarios encontrados y
+            ``meta.missing`` = { "ids": [...], "emails": [...] }.
+
+        Errors:
+            422 Unprocessable Entity -- cuerpo vacío o más de ``USERS_LOOKUP_MAX`` valores.
         """
-        use_case = ListUsersUseCase(repository=self.repository)
-        users = use_case.execute()
-        resources = [user_resource(u, request=request) for u in users]
-        return collection_response(resources, status=status.HTTP_200_OK)
+        serializer = ResolveUsersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = ResolveUsersCommand(
+            ids=serializer.validated_data["ids"],
+            emails=serializer.validated_data["emails"],
+        )
+        with phase("use_case"):
+            result = self.container.resolve_users.execute(command)
+        return resolve_response(request, result)
+
+    # -- GET /api/users/export/ -------------------------------------------
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[NDJSONRenderer, CSVRenderer, FastJSONRenderer],
+    )
+    def export(self, request):
+        """
+        Exportar todos los usuarios en streaming (sincronizaciones masivas).
+
+        Formato (content negotiation):
+            Accept: application/x-ndjson  -- NDJSON, un usuario por línea (default).
+            Accept: text/csv              -- CSV con cabecera.
+
+        Con ``Accept-Encoding: gzip`` la salida se comprime
+        (``Content-Encoding: gzip``). La memoria usada no depende del
+        número de usuarios.
+
+        Success 200 OK:
+            Cuerpo en streaming (id, email, username, role, is_active, created_at).
+        """
+        fmt = request.accepted_renderer.format
+        if fmt not in CONTENT_TYPES:
+            fmt = FORMAT_NDJSON
+        use_gzip = bool(_GZIP_RE.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
+
+        response = StreamingHttpResponse(
+            export_users(fmt, gzip=use_gzip),
+            content_type=CONTENT_TYPES[fmt],
+        )
+        response["Content-Disposition"] = f'attachment; filename="users.{fmt}"'
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
+
+    # -- GET /api/users/changes/ ------------------------------------------
+    @action(detail=False, methods=["get"], url_path="changes")
+    @query_budget(3)
+    def changes(self, request):
+        """
+        Feed incremental de cambios (altas, modificaciones y bajas).
+
+        Pensado para que otros servicios mantengan su copia de los usuarios
+        sin descargar la colección completa: guardan ``meta.cursor`` (o
+        ``links.next``) y lo envían en la siguiente consulta.
+
+        Query parameters:
+            since      -- cursor de una respuesta anterior (sin él: desde el inicio).
+            page[size] -- máximo de cambios (default 50, máximo 200).
+
+        Success 200 OK:
+            JSON:API collection en orden de cambio. Altas/modificaciones son
+            el usuario completo; bajas ``{type, id, meta: {deleted: true}}``.
+            ``meta.cursor`` es la nueva posición y ``meta.has_more`` indica
+            si hay más cambios disponibles de inmediato.
+
+        Errors:
+            400 Bad Request -- cursor o page[size] inválidos.
+        """
+        size = page_size_from_query(request)
+        since = since_from_query(request)
+        use_case = self.container.list_user_changes
+        with phase("use_case"):
+            feed = use_case.execute(since, size)
+        resources = [user_change_resource(c, request=request) for c in feed.changes]
+        return collection_response(
+            resources,
+            status=status.HTTP_200_OK,
+            meta_extra={
+                "cursor": encode_cursor(feed.cursor) if feed.cursor is not None else None,
+                "has_more": feed.has_more,
+            },
+            links=change_feed_links(request, since, feed, size),
+        )
 
     # -- GET /api/users/{id}/ ---------------------------------------------
+    @query_budget(2)
+    @etag_condition(_user_etag)
     def retrieve(self, request, pk=None):
         """
         Obtener un usuario por ID.
 
         Success 200 OK:
-            JSON:API resource object.
+            JSON:API resource object con ETag.
+
+        Success 304 Not Modified:
+            If-None-Match coincide con el ETag actual (sin cuerpo).
 
         Errors:
             404 Not Found -- usuario no existe.
         """
-        use_case = GetUserUseCase(repository=self.repository)
-        user = use_case.execute(user_id=pk)  # UserNotFound -> handler global
+        use_case = self.container.get_user
+        with phase("use_case"):
+            user = use_case.execute(user_id=pk)  # UserNotFound -> handler global
         resource = user_resource(user, request=request)
         return success_response(resource, status=status.HTTP_200_OK)
 
     # -- PATCH /api/users/{id}/ -------------------------------------------
+    @query_budget(5)
     def partial_update(self, request, pk=None):
         """
         Actualizar el email del usuario.
@@ -402,7 +668,7 @@ class UserViewSet(viewsets.ViewSet):
 
         Errors:
             404 Not Found -- usuario no existe.
-            409 Conflict -- email ya en uso.
+            409 Conflict -- email ya en uso o usuario modificado concurrentemente.
             422 Unprocessable Entity -- email invalido.
         """
         serializer = UpdateUserSerializer(data=request.data)
@@ -412,16 +678,15 @@ class UserViewSet(viewsets.ViewSet):
             user_id=pk,
             new_email=serializer.validated_data["email"],
         )
-        use_case = ChangeUserEmailUseCase(
-            repository=self.repository,
-            event_publisher=self.event_publisher,
-        )
-        user = use_case.execute(command)
+        use_case = self.container.change_user_email
+        with phase("use_case"), transaction.atomic():
+            user = use_case.execute(command)
         resource = user_resource(user, request=request)
         return success_response(resource, status=status.HTTP_200_OK)
 
     # -- POST /api/users/{id}/deactivate/ ---------------------------------
     @action(detail=True, methods=["post"], url_path="deactivate")
+    @query_budget(4)
     def deactivate(self, request, pk=None):
         """
         Desactivar un usuario (impide su acceso al sistema).
@@ -434,7 +699,7 @@ class UserViewSet(viewsets.ViewSet):
 
         Errors:
             404 Not Found -- usuario no existe.
-            409 Conflict -- usuario ya inactivo.
+            409 Conflict -- usuario ya inactivo o modificado concurrentemente.
         """
         serializer = DeactivateUserSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -443,15 +708,14 @@ class UserViewSet(viewsets.ViewSet):
             user_id=pk,
             reason=serializer.validated_data.get("reason") or None,
         )
-        use_case = DeactivateUserUseCase(
-            repository=self.repository,
-            event_publisher=self.event_publisher,
-        )
-        user = use_case.execute(command)
+        use_case = self.container.deactivate_user
+        with phase("use_case"), transaction.atomic():
+            user = use_case.execute(command)
         resource = user_resource(user, request=request)
         return success_response(resource, status=status.HTTP_200_OK)
 
     # -- DELETE /api/users/{id}/ ------------------------------------------
+    @query_budget(4)
     def destroy(self, request, pk=None):
         """
         Eliminar un usuario permanentemente.
@@ -462,8 +726,9 @@ class UserViewSet(viewsets.ViewSet):
         Errors:
             404 Not Found -- usuario no existe.
         """
-        user = self.repository.find_by_id(pk)
-        if not user:
-            raise UserNotFound(pk)
-        self.repository.delete(pk)
+        with phase("use_case"):
+            user = self.repository.find_by_id(pk)
+            if not user:
+                raise UserNotFound(pk)
+            self.repository.delete(pk)
         return no_content_response()